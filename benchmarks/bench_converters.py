@@ -0,0 +1,333 @@
+"""
+bench_converters.py
+End-to-end benchmark of every conversion in STIGConverter._DISPATCH, plus the
+convert_checklist_to_md and write_stigs report writers.
+
+Each case runs against the data/ fixtures (scale 1) and against synthetic inputs
+whose VULN/Rule count is scaled up (10x, 100x by default; copies get unique
+Vuln_Num / Rule_ID values). Wall time is the best of --repeat runs; peak memory
+comes from one extra run under tracemalloc. XCCDF (.xml/.zip) cases use a
+scratch benchmark cache, so their best time is a warm-cache run. Results are
+written as JSON so runs from different commits can be compared with --compare.
+
+Usage:
+    python benchmarks/bench_converters.py [--scales 1,10,100] [--repeat N] [--cases ckl]
+                                          [--json FILE] [--compare PREVIOUS.json]
+"""
+
+import argparse
+import contextlib
+import copy
+import csv
+import io
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+from stig_converter.converters.json_to_markdown import convert_checklist_to_md, write_stigs
+from stig_converter.converters.readers import (
+    _NS,
+    iter_ckl_findings,
+    read_ckl,
+    read_cklb,
+    read_xccdf,
+    safe_parse,
+)
+from stig_converter.converters.writers import (
+    write_ckl,
+    write_cklb,
+    write_findings_json,
+    write_findings_jsonl,
+)
+from stig_converter.stig_converter import STIGConverter
+
+_ROOT = Path(__file__).resolve().parent.parent
+_DATA = _ROOT / "data"
+_FIXTURES = {
+    "ckl": _DATA / "Test_ASD_Checklist.ckl",
+    "cklb": _DATA / "Test_ASD_Checklist.cklb",
+    "csv": _DATA / "Test_ASD_Checklist.csv",
+    "xml": _DATA / "U_ASD_STIG_V6R4_Manual-xccdf.xml",
+}
+
+
+# ------------------------------------------------------------------
+# Scaled inputs
+# ------------------------------------------------------------------
+
+def _scale_checklist(checklist, scale: int):
+    """Repeat every rule scale times; copies get unique Vuln_Num / Rule_ID values."""
+    for stig in checklist.stigs:
+        rules = stig.rules
+        scaled = list(rules)
+        for k in range(1, scale):
+            for rule in rules:
+                dup = copy.copy(rule)
+                dup.vuln_num = f"{rule.vuln_num}.{k}"
+                dup.rule_id = f"{rule.rule_id}.{k}"
+                scaled.append(dup)
+        stig.rules = scaled
+    return checklist
+
+
+def _scale_xccdf(path: Path, scale: int, target: Path) -> None:
+    tree = safe_parse(path)
+    root = tree.getroot()
+    groups = root.findall(f"{{{_NS}}}Group")
+    for k in range(1, scale):
+        for group in groups:
+            dup = copy.deepcopy(group)
+            dup.set("id", f"{group.get('id')}.{k}")
+            rule = dup.find(f"{{{_NS}}}Rule")
+            if rule is not None:
+                rule.set("id", f"{rule.get('id')}.{k}")
+            root.append(dup)
+    tree.write(target, encoding="UTF-8", xml_declaration=True)
+
+
+def _stigviewer_json(checklist, target: Path) -> None:
+    """Write a stigviewer.com-format JSON (the write_stigs input) from a benchmark."""
+    findings = {}
+    for rule in checklist.rules():
+        findings[rule.vuln_num] = {
+            "id": rule.vuln_num,
+            "ruleID": rule.rule_id,
+            "severity": rule.severity,
+            "title": rule.rule_title,
+            "description": rule.vuln_discuss,
+            "checkid": rule.check_content_ref,
+            "checktext": rule.check_content,
+            "fixid": rule.rule_id,
+            "fixtext": rule.fix_text,
+        }
+    stig = {"date": "2025-10-01", "description": checklist.stigs[0].title, "findings": findings}
+    with open(target, "w", encoding="utf-8") as f:
+        json.dump({"stig": stig}, f)
+
+
+def build_inputs(scale: int, workdir: Path) -> dict:
+    """
+    Materialize one input per format at the given scale.
+    :return: {format: (path, rule count)}
+    """
+    workdir.mkdir(parents=True, exist_ok=True)
+    inputs = {}
+
+    if scale == 1:
+        ckl, cklb, csv_path, xml = (_FIXTURES[k] for k in ("ckl", "cklb", "csv", "xml"))
+    else:
+        ckl = workdir / "checklist.ckl"
+        with open(ckl, "wb") as f:
+            write_ckl(_scale_checklist(read_ckl(_FIXTURES["ckl"]), scale), f)
+        cklb = workdir / "checklist.cklb"
+        with open(cklb, "w", encoding="utf-8") as f:
+            write_cklb(_scale_checklist(read_cklb(_FIXTURES["cklb"]), scale), f)
+        csv_path = workdir / "checklist.csv"
+        with open(_FIXTURES["csv"], newline="", encoding="utf-8") as src, \
+                open(csv_path, "w", newline="", encoding="utf-8") as dst:
+            # Rows are copied verbatim: the fixture is a STIG Viewer export with a banner
+            # line above the header, which a DictReader/DictWriter round trip would mangle
+            rows = list(csv.reader(src))
+            start = next(i for i, row in enumerate(rows) if len(row) > 1) + 1
+            header = rows[start - 1]
+            group_id = header.index("Group ID") if "Group ID" in header else None
+            writer = csv.writer(dst)
+            writer.writerows(rows)
+            for k in range(1, scale):
+                for row in rows[start:]:
+                    dup = list(row)
+                    if group_id is not None and len(dup) > group_id:
+                        dup[group_id] = f"{dup[group_id]}.{k}"
+                    writer.writerow(dup)
+        xml = workdir / f"U_ASD_STIG_x{scale}_Manual-xccdf.xml"
+        _scale_xccdf(_FIXTURES["xml"], scale, xml)
+
+    checklist = read_ckl(ckl)
+    inputs["ckl"] = (ckl, checklist.rule_count())
+    inputs["cklb"] = (cklb, read_cklb(cklb).rule_count())
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    header = next(i for i, row in enumerate(rows) if len(row) > 1)
+    inputs["csv"] = (csv_path, len(rows) - header - 1)
+    benchmark = read_xccdf(xml)
+    inputs["xml"] = (xml, benchmark.rule_count())
+
+    package = workdir / "U_ASD_STIG.zip"
+    with zipfile.ZipFile(package, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.write(xml, f"U_ASD_Manual_STIG/{xml.name}")
+    inputs["zip"] = (package, benchmark.rule_count())
+
+    for ext, writer in (("json", write_findings_json), ("jsonl", write_findings_jsonl),
+                        ("ndjson", write_findings_jsonl)):
+        path = workdir / f"findings.{ext}"
+        with open(path, "w", encoding="utf-8") as f:
+            writer(iter_ckl_findings(ckl, "20250101"), f)
+        inputs[ext] = (path, inputs["ckl"][1])
+
+    stigviewer = workdir / "stigviewer.json"
+    _stigviewer_json(benchmark, stigviewer)
+    inputs["stigviewer"] = (stigviewer, benchmark.rule_count())
+    return inputs
+
+
+# ------------------------------------------------------------------
+# Cases
+# ------------------------------------------------------------------
+
+def build_cases(inputs: dict, out_dir: Path) -> list:
+    """Return (name, rules, input bytes, callable) for every benchmarked conversion."""
+    template = inputs["ckl"][0]
+    cases = []
+    for (input_ext, output_ext) in STIGConverter._DISPATCH:
+        path, rules = inputs[input_ext]
+        args = argparse.Namespace(
+            input=path,
+            output=out_dir / f"{input_ext}_to_{output_ext}.{output_ext}",
+            name=None,
+            template_ckl=template,
+        )
+        cases.append((f"{input_ext}->{output_ext}", rules, path.stat().st_size,
+                      STIGConverter(args).convert))
+
+    json_path, rules = inputs["json"]
+
+    def checklist_md():
+        with open(json_path, encoding="utf-8") as f:
+            findings = json.load(f)
+        convert_checklist_to_md(findings, out_dir / "checklist_report.md")
+
+    cases.append(("convert_checklist_to_md", rules, json_path.stat().st_size, checklist_md))
+
+    stigviewer, rules = inputs["stigviewer"]
+    cases.append(("write_stigs", rules, stigviewer.stat().st_size,
+                  lambda: write_stigs(stigviewer, out_dir / "stigs_report.md")))
+    return cases
+
+
+def measure(fn, repeat: int) -> tuple:
+    """Best wall time over repeat runs, then peak traced memory of one more run."""
+    best = float("inf")
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=_ROOT,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def compare(results: list, previous_path: Path) -> None:
+    with open(previous_path, encoding="utf-8") as f:
+        previous = {(r["case"], r["scale"]): r for r in json.load(f)["results"]}
+    print(f"\nvs {previous_path}")
+    print(f"  {'case':28} {'scale':>5} {'time':>9} {'peak mem':>9}")
+    for r in results:
+        old = previous.get((r["case"], r["scale"]))
+        if not old:
+            continue
+        print(f"  {r['case']:28} {r['scale']:>5} {r['seconds'] / old['seconds']:>8.2f}x"
+              f" {r['peak_mb'] / max(old['peak_mb'], 1e-9):>8.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scales", default="1,10,100", metavar="LIST",
+                        help="comma separated VULN multipliers (default: 1,10,100)")
+    parser.add_argument("--repeat", type=int, default=3, metavar="N",
+                        help="timed runs per case; the best is reported (default: 3)")
+    parser.add_argument("--cases", default="", metavar="TEXT",
+                        help="only run cases whose name contains TEXT")
+    parser.add_argument("--json", type=Path, metavar="FILE",
+                        help="results file (default: benchmarks/results/<commit>-<time>.json)")
+    parser.add_argument("--compare", type=Path, metavar="FILE",
+                        help="previous results file to print time/memory ratios against")
+    args = parser.parse_args()
+
+    scales = [int(s) for s in args.scales.split(",") if s.strip()]
+    commit = _git_commit()
+    results = []
+
+    # Converters may only write under the project root, so the scratch space lives there
+    (_ROOT / "output").mkdir(exist_ok=True)
+    scratch = Path(tempfile.mkdtemp(prefix="bench-", dir=_ROOT / "output"))
+    cache_dir = os.environ.get("STIG_CONVERTER_CACHE_DIR")
+    os.environ["STIG_CONVERTER_CACHE_DIR"] = str(scratch / "benchmark-cache")
+    try:
+        print(f"{'case':28} {'scale':>5} {'rules':>8} {'time':>9} {'rules/s':>10} {'peak mem':>10}")
+        for scale in scales:
+            inputs = build_inputs(scale, scratch / f"x{scale}")
+            out_dir = scratch / f"x{scale}" / "out"
+            out_dir.mkdir()
+            for name, rules, size, fn in build_cases(inputs, out_dir):
+                if args.cases not in name:
+                    continue
+                seconds, peak = measure(fn, args.repeat)
+                result = {
+                    "case": name,
+                    "scale": scale,
+                    "rules": rules,
+                    "input_bytes": size,
+                    "seconds": round(seconds, 6),
+                    "rules_per_sec": round(rules / seconds, 1),
+                    "peak_mb": round(peak / (1024 * 1024), 3),
+                }
+                results.append(result)
+                print(f"{name:28} {scale:>5} {rules:>8} {seconds * 1000:>7.1f}ms"
+                      f" {result['rules_per_sec']:>10.0f} {result['peak_mb']:>8.2f}MB")
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+        try:
+            (_ROOT / "output").rmdir()
+        except OSError:
+            pass
+        if cache_dir is None:
+            os.environ.pop("STIG_CONVERTER_CACHE_DIR", None)
+        else:
+            os.environ["STIG_CONVERTER_CACHE_DIR"] = cache_dir
+
+    stamp = datetime.now(timezone.utc)
+    results_dir = Path(__file__).resolve().parent / "results"
+    out = args.json or results_dir / f"{commit or 'nogit'}-{stamp:%Y%m%dT%H%M%S}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump({
+            "commit": commit,
+            "timestamp": stamp.isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "results": results,
+        }, f, indent=2)
+    print(f"\nResults written to {out}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+bench_xccdf_description.py
+Micro-benchmark for the XCCDF <description> tokenizer used by every XCCDF reader.
+
+Compares the single-pass tokenizer in stig_converter.converters.readers against
+the previous implementation, which ran one re.search per sub-tag (11 scans per
+Rule), over every Rule description in the bundled ASD V6R4 benchmark.
+
+Usage:
+    python benchmarks/bench_xccdf_description.py [--xccdf FILE] [--repeat N]
+"""
+
+import argparse
+import re
+import timeit
+from pathlib import Path
+
+from stig_converter.converters.readers import _DESC_TAGS, _NS, _parse_description, safe_parse
+
+_DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+_DEFAULT_XCCDF = _DATA_DIR / "U_ASD_STIG_V6R4_Manual-xccdf.xml"
+
+
+def _parse_description_per_tag(raw: str) -> dict:
+    """The previous implementation: one regex scan per sub-tag."""
+    result = {}
+    for xml_tag, _ in _DESC_TAGS:
+        m = re.search(rf"<{xml_tag}>(.*?)</{xml_tag}>", raw, re.DOTALL)
+        result[xml_tag] = m.group(1).strip() if m else ""
+    return result
+
+
+def _load_descriptions(xccdf_path) -> list:
+    root = safe_parse(xccdf_path).getroot()
+    return [el.text or "" for el in root.iterfind(f".//{{{_NS}}}Rule/{{{_NS}}}description")]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--xccdf", type=Path, default=_DEFAULT_XCCDF, metavar="FILE")
+    parser.add_argument("--repeat", type=int, default=20, metavar="N")
+    args = parser.parse_args()
+
+    descriptions = _load_descriptions(args.xccdf)
+    for raw in descriptions:
+        assert _parse_description(raw) == _parse_description_per_tag(raw)
+
+    def run(fn):
+        timings = timeit.repeat(
+            lambda: [fn(d) for d in descriptions], number=1, repeat=args.repeat
+        )
+        return min(timings)
+
+    before = run(_parse_description_per_tag)
+    after = run(_parse_description)
+    print(f"{len(descriptions)} rule descriptions from {args.xccdf.name}")
+    print(f"  per-tag re.search : {before * 1000:8.2f} ms")
+    print(f"  single pass       : {after * 1000:8.2f} ms")
+    print(f"  speedup           : {before / after:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
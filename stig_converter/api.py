@@ -0,0 +1,213 @@
+# api.py
+# In-memory conversion API for embedding (e.g. in a web service): bytes or binary file
+# objects in and out, with no path validation, filesystem access or printing, so calls
+# are independent of each other and safe to run from a thread pool
+
+import csv
+import io
+import zipfile
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from stig_converter.converters.json_to_ckl import CklTemplate, write_populated_ckl
+from stig_converter.converters.json_to_markdown import write_checklist_md, write_stigviewer_md
+from stig_converter.converters.model import Checklist
+from stig_converter.converters.readers import (
+    _read_xccdf_stream,
+    find_xccdf_member,
+    iter_ckl_findings,
+    iter_jsonl,
+    read_ckl,
+    read_cklb,
+    read_findings_json,
+)
+from stig_converter.converters.writers import (
+    write_ckl,
+    write_cklb,
+    write_findings_csv,
+    write_findings_json,
+    write_findings_jsonl,
+)
+from stig_converter.stig_converter import _SUPPORTED_CONVERSIONS
+
+# Formats the CLI writes that are not a single in-memory document
+_FILE_ONLY = ("sqlite",)
+
+# source format → formats it can be converted to (the CLI's table, minus file-only outputs)
+CONVERSIONS = {
+    src: [dst for dst in dsts if dst not in _FILE_ONLY]
+    for src, dsts in _SUPPORTED_CONVERSIONS.items()
+}
+
+
+def load_template(template) -> CklTemplate:
+    """
+    Parse a CKL template for JSON/JSONL → CKL conversions.
+    The result is read-only once built, so one template can be shared by every
+    thread and request instead of being parsed on each call.
+    :param template: CKL bytes, str, a binary file object, or an existing CklTemplate
+    :return: CklTemplate
+    """
+    if isinstance(template, CklTemplate):
+        return template
+    if isinstance(template, str):
+        template = template.encode("utf-8")
+    if isinstance(template, (bytes, bytearray, memoryview)):
+        template = io.BytesIO(template)
+    return CklTemplate(template)
+
+
+@contextmanager
+def _text_reader(source):
+    """Decode a binary stream as UTF-8 text without closing it afterwards."""
+    text = io.TextIOWrapper(source, encoding="utf-8")
+    try:
+        yield text
+    finally:
+        text.detach()
+
+
+@contextmanager
+def _text_writer(destination, newline=None):
+    """Encode text to a binary stream as UTF-8 without closing it afterwards."""
+    text = io.TextIOWrapper(destination, encoding="utf-8", newline=newline, write_through=True)
+    try:
+        yield text
+        text.flush()
+    finally:
+        text.detach()
+
+
+def _read_xccdf_zip(source):
+    """Read the XCCDF benchmark out of a DISA STIG package held in a stream."""
+    if not source.seekable():
+        source = io.BytesIO(source.read())
+    with zipfile.ZipFile(source) as zip_file:
+        member = find_xccdf_member(zip_file)
+        with zip_file.open(member) as f:
+            return _read_xccdf_stream(f, Path(member.filename).stem)
+
+
+def read_checklist(source, src: str) -> Checklist:
+    """
+    Read a checklist or benchmark (ckl, cklb, xml, zip) from a binary file object.
+    The result is only read by write_checklist, so it can be cached and shared.
+    """
+    src = src.lower().lstrip(".")
+    if src not in ("ckl", "cklb", "xml", "zip"):
+        raise ValueError(f"Cannot read a checklist from '{src}'. Supported: ckl, cklb, xml, zip")
+    if src == "ckl":
+        return read_ckl(source)
+    if src == "cklb":
+        with _text_reader(source) as text:
+            return read_cklb(text)
+    if src == "zip":
+        return _read_xccdf_zip(source)
+    checklist = _read_xccdf_stream(source, "")
+    checklist.title = checklist.stigs[0].stig_id
+    return checklist
+
+
+def write_checklist(checklist: Checklist, destination, dst: str, title=None) -> None:
+    """
+    Write a Checklist as CKL or CKLB to a binary file object without modifying it.
+    :param title: Checklist title for CKLB output (default: checklist.title)
+    """
+    dst = dst.lower().lstrip(".")
+    if dst not in ("ckl", "cklb"):
+        raise ValueError(f"Cannot write a checklist as '{dst}'. Supported: ckl, cklb")
+    if title is not None:
+        checklist = Checklist(
+            title=title, id=checklist.id, asset=checklist.asset, stigs=checklist.stigs
+        )
+    if dst == "ckl":
+        write_ckl(checklist, destination)
+    else:
+        with _text_writer(destination) as text:
+            write_cklb(checklist, text)
+
+
+def _write_findings(findings, destination, dst: str) -> None:
+    with _text_writer(destination, newline="" if dst == "csv" else None) as text:
+        if dst == "csv":
+            write_findings_csv(findings, text)
+        elif dst == "json":
+            write_findings_json(findings, text)
+        elif dst in ("jsonl", "ndjson"):
+            write_findings_jsonl(findings, text)
+        else:
+            write_checklist_md(findings, text)
+
+
+def convert_stream(
+    source, destination, src: str, dst: str, template=None, title=None, date=None
+) -> None:
+    """
+    Convert between formats, reading from and writing to binary file objects.
+    Streaming conversions (CKL → CSV/JSON/JSONL/Markdown, CSV → JSON/JSONL,
+    JSONL → Markdown) never hold the whole document in memory.
+    :param source: Readable binary file object
+    :param destination: Writable binary file object; it is not closed
+    :param src: Source format, e.g. "ckl", "cklb", "csv", "json", "jsonl", "xml", "zip"
+    :param dst: Target format, e.g. "csv", "json", "jsonl", "md", "ckl", "cklb"
+    :param template: CKL template (bytes, file object or load_template result),
+        required for JSON/JSONL → CKL
+    :param title: Checklist title for CKLB output (default: the source's own title,
+        or the benchmark id for a bare XCCDF stream)
+    :param date: YYYYMMDD stamp for the DATE column of flat findings (default: today)
+    :raises ValueError: If the conversion is not supported or a template is missing
+    """
+    src = src.lower().lstrip(".")
+    dst = dst.lower().lstrip(".")
+    if dst in _FILE_ONLY:
+        raise ValueError(f"'{dst}' output needs a file path; use the CLI or the converter module")
+    if dst not in CONVERSIONS.get(src, ()):
+        valid = ", ".join(CONVERSIONS.get(src, ())) or "none"
+        raise ValueError(f"Cannot convert '{src}' → '{dst}'. Valid outputs: {valid}")
+    if dst == "ckl" and src in ("json", "jsonl", "ndjson") and template is None:
+        raise ValueError(f"A CKL template is required for {src.upper()} → CKL conversion")
+    date = date or datetime.now().strftime("%Y%m%d")
+
+    if src in ("ckl", "cklb", "xml", "zip") and dst in ("ckl", "cklb"):
+        write_checklist(read_checklist(source, src), destination, dst, title=title)
+        return
+
+    if src == "ckl":
+        _write_findings(iter_ckl_findings(source, date), destination, dst)
+        return
+
+    with _text_reader(source) as text:
+        if src == "csv":
+            findings = csv.DictReader(text)
+        elif src == "json":
+            findings = read_findings_json(text)
+        else:
+            findings = iter_jsonl(text)
+
+        if dst == "ckl":
+            if isinstance(findings, dict):
+                raise ValueError("JSON → CKL needs a list of findings, not a stigviewer document")
+            with _text_writer(destination) as out:
+                write_populated_ckl(findings, load_template(template), out)
+        elif dst == "md" and isinstance(findings, dict):
+            with _text_writer(destination) as out:
+                write_stigviewer_md(findings, out)
+        else:
+            _write_findings(findings, destination, dst)
+
+
+def convert_bytes(data, src: str, dst: str, template=None, title=None, date=None) -> bytes:
+    """
+    Convert a whole document held in memory.
+    :param data: Source document as bytes (str is encoded as UTF-8)
+    :return: Converted document as bytes
+    See convert_stream for the remaining parameters.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    destination = io.BytesIO()
+    convert_stream(
+        io.BytesIO(data), destination, src, dst, template=template, title=title, date=date
+    )
+    return destination.getvalue()
@@ -0,0 +1,209 @@
+# batch.py
+# Convert many checklists in one invocation, fanned out over a process pool
+
+import argparse
+import contextlib
+import glob
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+from stig_converter.stig_converter import _SUPPORTED_CONVERSIONS, STIGConverter, ValidationError
+
+# Suffixes of the checklists read by fleet-wide commands (ingest, matrix, upgrade)
+_CHECKLIST_SUFFIXES = (".ckl", ".cklb")
+
+
+class BatchResult(NamedTuple):
+    """Outcome of converting a single file in a batch."""
+
+    input: Path
+    output: Optional[Path]
+    ok: bool
+    error: str
+    seconds: float
+    bytes_in: int
+
+
+def _glob_base(pattern: str) -> Path:
+    """Return the leading directory of a glob pattern that contains no wildcards."""
+    parts = []
+    for part in Path(pattern).parts:
+        if glob.has_magic(part):
+            break
+        parts.append(part)
+    return Path(*parts) if parts else Path(".")
+
+
+def input_base(source) -> Path:
+    """
+    Directory a batch input's tree is mirrored from: the directory itself,
+    a glob pattern's leading directory, or a single file's parent.
+    """
+    source = str(source)
+    if glob.has_magic(source):
+        return _glob_base(source)
+    if Path(source).is_dir():
+        return Path(source)
+    return Path(source).parent
+
+
+def expand_inputs(source, to_ext: str):
+    """
+    Resolve a batch input into (file, base directory) pairs.
+    :param source: A file, a directory (searched recursively), or a glob pattern
+    :param to_ext: Target extension; directories only yield files convertible to it
+    :return: Sorted list of (input_path, base_dir) tuples
+    """
+    source = str(source)
+    base = input_base(source)
+    if glob.has_magic(source):
+        files = [Path(p) for p in glob.glob(source, recursive=True) if Path(p).is_file()]
+    elif Path(source).is_dir():
+        files = [
+            p for p in base.rglob("*")
+            if p.is_file() and to_ext in _SUPPORTED_CONVERSIONS.get(p.suffix[1:].lower(), ())
+        ]
+    else:
+        files = [Path(source)]
+    return [(p, base) for p in sorted(files)]
+
+
+def expand_checklists(sources) -> List[Path]:
+    """
+    Every .ckl/.cklb file matched by sources, for commands that read a whole fleet.
+    :param sources: A file, directory (searched recursively) or glob pattern, or a list of them
+    :return: Sorted, de-duplicated list of checklist paths
+    """
+    if isinstance(sources, (str, os.PathLike)):
+        sources = [sources]
+    found = set()
+    for source in map(str, sources):
+        if glob.has_magic(source):
+            candidates = [Path(p) for p in glob.glob(source, recursive=True) if Path(p).is_file()]
+        elif Path(source).is_dir():
+            candidates = [p for p in input_base(source).rglob("*") if p.is_file()]
+        else:
+            candidates = [Path(source)]
+        found.update(p for p in candidates if p.suffix.lower() in _CHECKLIST_SUFFIXES)
+    return sorted(found)
+
+
+def _output_for(input_path: Path, base: Path, output_dir: Path, to_ext: str) -> Path:
+    """Mirror the input's location under base into output_dir with the new extension."""
+    try:
+        relative = input_path.relative_to(base)
+    except ValueError:
+        relative = Path(input_path.name)
+    return output_dir / relative.with_suffix(f".{to_ext}")
+
+
+def output_conflicts(targets) -> Dict[Path, List[Path]]:
+    """
+    Outputs claimed by more than one input (e.g. a.ckl and a.cklb → a.csv), which
+    would otherwise overwrite each other.
+    :param targets: (input_path, output_path) pairs
+    :return: {output_path: input paths} for every shared output, in input order
+    """
+    owners: Dict[Path, List[Path]] = {}
+    for input_path, output_path in targets:
+        owners.setdefault(output_path, []).append(input_path)
+    return {output: inputs for output, inputs in owners.items() if len(inputs) > 1}
+
+
+def check_unique_outputs(targets) -> None:
+    """
+    Refuse a batch in which two inputs would write the same output file.
+    :raises ValidationError: Listing every shared output and the inputs behind it
+    """
+    conflicts = output_conflicts(targets)
+    if conflicts:
+        lines = [
+            f"  {output} ← {', '.join(str(p) for p in inputs)}"
+            for output, inputs in conflicts.items()
+        ]
+        raise ValidationError(
+            "Several inputs would write the same output; rename or move them apart:\n"
+            + "\n".join(lines)
+        )
+
+
+def _convert_one(input_path: Path, output_path: Path, template_ckl: Optional[Path]) -> BatchResult:
+    """Convert one file through the STIGConverter dispatch table (runs in a worker process)."""
+    start = time.perf_counter()
+    try:
+        bytes_in = input_path.stat().st_size
+    except OSError:
+        bytes_in = 0
+    args = argparse.Namespace(
+        input=input_path, output=output_path, name=None, template_ckl=template_ckl
+    )
+    try:
+        input_ext = input_path.suffix[1:].lower()
+        output_ext = output_path.suffix[1:].lower()
+        if output_ext not in _SUPPORTED_CONVERSIONS.get(input_ext, ()):
+            raise ValidationError(f"Cannot convert '{input_ext}' → '{output_ext}'")
+        # Per-file progress is reported by the batch; keep converter chatter out of it
+        with contextlib.redirect_stdout(io.StringIO()):
+            STIGConverter(args).convert()
+        return BatchResult(input_path, output_path, True, "", time.perf_counter() - start, bytes_in)
+    except Exception as e:
+        return BatchResult(input_path, None, False, str(e), time.perf_counter() - start, bytes_in)
+
+
+def convert_batch(
+    source,
+    output_dir,
+    to_ext: str,
+    jobs: Optional[int] = None,
+    template_ckl: Optional[Path] = None,
+) -> List[BatchResult]:
+    """
+    Convert every file matched by source into output_dir, one process per core.
+    :param source: Input file, directory, or glob pattern (e.g. 'scans/**/*.ckl')
+    :param output_dir: Directory for converted files; input sub-directories are mirrored
+    :param to_ext: Target format extension (csv, json, md, ckl, cklb)
+    :param jobs: Worker processes (default: CPU count); 1 converts in-process
+    :param template_ckl: CKL template forwarded to JSON → CKL conversions
+    :return: One BatchResult per input file, in input order
+    """
+    to_ext = to_ext.lower().lstrip(".")
+    output_dir = Path(output_dir)
+    pairs = expand_inputs(source, to_ext)
+    if not pairs:
+        raise ValidationError(f"No input files matched: {source}")
+
+    tasks = [(p, _output_for(p, base, output_dir, to_ext), template_ckl) for p, base in pairs]
+    check_unique_outputs((input_path, output_path) for input_path, output_path, _ in tasks)
+    jobs = jobs or os.cpu_count() or 1
+
+    print(f"[*] Converting {len(tasks)} file(s) → .{to_ext} with {min(jobs, len(tasks))} worker(s)")
+    start = time.perf_counter()
+    results = []
+    if jobs == 1 or len(tasks) == 1:
+        for task in tasks:
+            results.append(_report(_convert_one(*task)))
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+            for result in pool.map(_convert_one, *zip(*tasks)):
+                results.append(_report(result))
+    elapsed = max(time.perf_counter() - start, 1e-9)
+
+    ok = sum(r.ok for r in results)
+    megabytes = sum(r.bytes_in for r in results) / (1024 * 1024)
+    print(
+        f"[*] Converted {ok}/{len(results)} file(s) in {elapsed:.2f}s "
+        f"({len(results) / elapsed:.1f} files/s, {megabytes / elapsed:.2f} MB/s)"
+    )
+    return results
+
+
+def _report(result: BatchResult) -> BatchResult:
+    if result.ok:
+        print(f"[*] {result.input} → {result.output} ({result.seconds:.2f}s)")
+    else:
+        print(f"[X] {result.input}: {result.error}")
+    return result
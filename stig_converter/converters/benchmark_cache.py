@@ -0,0 +1,183 @@
+# benchmark_cache.py
+# On-disk store of compiled XCCDF benchmarks for instant blank-checklist generation
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+from pathlib import Path
+
+from stig_converter.converters.model import Asset, Checklist, Rule, Stig
+from stig_converter.converters.readers import _read_xccdf_stream, open_xccdf, peek_xccdf
+
+# Bump when the model or the XCCDF reader changes so stale entries are ignored
+CACHE_FORMAT = 3
+
+# Entries are plain JSON, not pickles: the cache directory can be redirected through
+# $STIG_CONVERTER_CACHE_DIR, and loading an entry must never be able to run code
+_SUFFIX = ".json"
+_STIG_FIELDS = ("stig_id", "title", "version", "release_info", "uuid")
+
+# Compiled benchmarks kept before the least recently used ones are evicted
+DEFAULT_MAX_ENTRIES = 32
+
+
+def cache_dir() -> Path:
+    """
+    Directory holding compiled benchmarks:
+    $STIG_CONVERTER_CACHE_DIR, else $XDG_CACHE_HOME/stig_converter/benchmarks,
+    else ~/.cache/stig_converter/benchmarks.
+    """
+    override = os.environ.get("STIG_CONVERTER_CACHE_DIR")
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "stig_converter" / "benchmarks"
+
+
+def _entry_path(meta: dict) -> Path:
+    """Cache file for a benchmark, keyed on its id, version and release info."""
+    key = f"{meta['stigid']}|{meta['version']}|{meta['releaseinfo']}"
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+    readable = re.sub(r"[^A-Za-z0-9_.-]", "_", f"{meta['stigid']}-V{meta['version']}")[:80]
+    return cache_dir() / f"{readable}-{digest}{_SUFFIX}"
+
+
+def _fingerprint(xccdf_path) -> list:
+    """Size and modification time of the source file, stored with its entry to spot edits."""
+    st = os.stat(xccdf_path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _to_document(checklist: Checklist, source: list) -> dict:
+    """Cache entry for a checklist; rules are stored as value rows in Rule.__slots__ order."""
+    return {
+        "format": CACHE_FORMAT,
+        "source": source,
+        "rule_slots": Rule.__slots__,
+        "title": checklist.title,
+        "id": checklist.id,
+        "asset": {slot: getattr(checklist.asset, slot) for slot in Asset.__slots__},
+        "stigs": [
+            {
+                **{field: getattr(stig, field) for field in _STIG_FIELDS},
+                "rules": [[getattr(rule, slot) for slot in Rule.__slots__] for rule in stig.rules],
+            }
+            for stig in checklist.stigs
+        ],
+    }
+
+
+def _from_document(document: dict, source: list):
+    """
+    Rebuild the Checklist of a cache entry, or None if it was written by another version
+    or compiled from a different revision of the source file.
+    """
+    slots = Rule.__slots__
+    if document.get("format") != CACHE_FORMAT or document.get("rule_slots") != list(slots):
+        return None
+    if document.get("source") != source:
+        return None
+    stigs = []
+    for stig in document["stigs"]:
+        rules = []
+        for values in stig["rules"]:
+            if len(values) != len(slots):
+                raise ValueError("rule row does not match the rule fields")
+            rule = Rule.__new__(Rule)
+            for slot, value in zip(slots, values):
+                setattr(rule, slot, value)
+            rules.append(rule)
+        stigs.append(Stig(**{field: stig[field] for field in _STIG_FIELDS}, rules=rules))
+    return Checklist(
+        title=document["title"],
+        id=document["id"],
+        asset=Asset(**document["asset"]),
+        stigs=stigs,
+    )
+
+
+def _load_entry(path: Path, source: list):
+    try:
+        with open(path, encoding="utf-8") as f:
+            checklist = _from_document(json.load(f), source)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logging.warning(f"Ignoring unreadable benchmark cache entry {path}: {e}")
+        return None
+    if checklist is None:
+        return None
+    # Mark as recently used for LRU eviction; a read-only cache is still usable
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return checklist
+
+
+def _store_entry(path: Path, checklist: Checklist, source: list, max_entries: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".part")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(_to_document(checklist, source), f, separators=(",", ":"))
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+    evict(max_entries)
+
+
+def evict(max_entries: int = DEFAULT_MAX_ENTRIES) -> int:
+    """
+    Delete the least recently used compiled benchmarks beyond max_entries.
+    :return: Number of entries removed
+    """
+    entries = []
+    for path in cache_dir().glob(f"*{_SUFFIX}"):
+        try:
+            entries.append((path.stat().st_mtime, path))
+        except OSError:
+            pass
+    entries.sort(reverse=True)
+    removed = 0
+    for _, stale in entries[max_entries:]:
+        try:
+            stale.unlink(missing_ok=True)
+            removed += 1
+        except OSError as e:
+            logging.warning(f"Could not evict benchmark cache entry {stale}: {e}")
+    return removed
+
+
+def load_benchmark(xccdf_path, max_entries: int = DEFAULT_MAX_ENTRIES) -> Checklist:
+    """
+    Return the blank Checklist for an XCCDF benchmark (.xml or STIG .zip), compiling it once.
+    Only the Benchmark header is parsed to find the cache key; a known benchmark is
+    loaded from its stored rule set without parsing any rules, descriptions or
+    computing UUIDs. Unknown benchmarks are parsed normally and stored for next time,
+    as are known ones whose file size or modification time no longer match the entry.
+    The cache is best effort: any failure to write it falls back to a plain parse.
+    :param xccdf_path: Path to the XCCDF .xml file or DISA STIG .zip package
+    :param max_entries: Compiled benchmarks kept before LRU eviction
+    :return: Populated Checklist with a single STIG
+    """
+    fingerprint = _fingerprint(xccdf_path)
+    with open_xccdf(xccdf_path) as (source, title):
+        meta = peek_xccdf(source)
+        entry = _entry_path(meta)
+        checklist = _load_entry(entry, fingerprint)
+        if checklist is not None:
+            checklist.title = title
+            return checklist
+        source.seek(0)
+        checklist = _read_xccdf_stream(source, title)
+
+    try:
+        _store_entry(entry, checklist, fingerprint, max_entries)
+    except OSError as e:
+        logging.warning(f"Could not write benchmark cache {entry}: {e}")
+    return checklist
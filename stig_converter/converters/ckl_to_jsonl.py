@@ -0,0 +1,38 @@
+# ckl_to_jsonl.py
+# Convert STIG .ckl to JSON Lines (.jsonl / .ndjson), one finding per line
+
+from datetime import datetime
+from pathlib import Path
+
+from stig_converter.converters.readers import iter_ckl_findings
+from stig_converter.converters.writers import write_findings_jsonl
+from stig_converter.instrumentation import stage, track
+from stig_converter.security_utils import get_default_allowed_dirs, validate_output_path
+
+
+def convert_ckl_to_jsonl(ckl_file, jsonl_path) -> str:
+    """
+    Converts a STIG Checklist .CKL file to JSON Lines.
+    :param ckl_file: Path to the .ckl file to convert
+    :param jsonl_path: Output directory or file path for the .jsonl
+    :return: Path to the created .jsonl file
+    """
+    current_date = datetime.now().strftime("%Y%m%d")
+    ckl_path = Path(ckl_file)
+
+    if not ckl_path.is_file():
+        raise FileNotFoundError(f"[X] CKL file does not exist: {ckl_path}")
+
+    new_jsonl_path = validate_output_path(
+        jsonl_path, ckl_file, get_default_allowed_dirs(), extension=".jsonl"
+    )
+
+    print(f"[*] Converting CKL: {ckl_path}")
+
+    # Each line is written as its VULN is read, so the output can be tailed while it grows
+    with open(new_jsonl_path, "w", encoding="utf-8") as jsonl_file:
+        with stage("serialize"):
+            write_findings_jsonl(track(iter_ckl_findings(ckl_path, current_date)), jsonl_file)
+
+    print(f"[*] New JSONL Created: {new_jsonl_path}")
+    return str(new_jsonl_path)
@@ -0,0 +1,45 @@
+# ckl_to_sqlite.py
+# Load a STIG .ckl/.cklb checklist into a SQLite checklist database
+
+from pathlib import Path
+
+from stig_converter.converters.readers import file_sha256, read_ckl, read_cklb
+from stig_converter.converters.sqlite_store import analyze, open_database, write_sqlite
+from stig_converter.instrumentation import count_checklist, stage
+from stig_converter.security_utils import get_default_allowed_dirs, validate_output_path
+
+
+def convert_ckl_to_sqlite(ckl_file, sqlite_path) -> str:
+    """
+    Add a STIG checklist to a SQLite database (see sqlite_store for the schema).
+    The database is created if missing; otherwise the checklist is added to the
+    checklists already in it, replacing an earlier load of the same file.
+    :param ckl_file: Path to the input .ckl or .cklb file
+    :param sqlite_path: Output directory or file path for the .sqlite database
+    :return: Path to the database
+    """
+    ckl_path = Path(ckl_file)
+    if not ckl_path.is_file():
+        raise FileNotFoundError(f"[X] Checklist file does not exist: {ckl_path}")
+
+    new_sqlite_path = validate_output_path(
+        sqlite_path, ckl_file, get_default_allowed_dirs(), extension=".sqlite"
+    )
+
+    input_ext = ckl_path.suffix[1:].upper()
+    print(f"[*] Converting {input_ext} → SQLite: {ckl_path}")
+
+    with stage("parse"):
+        checklist = read_cklb(ckl_path) if input_ext == "CKLB" else read_ckl(ckl_path)
+    count_checklist(checklist)
+    with stage("serialize"):
+        conn = open_database(new_sqlite_path)
+        try:
+            with conn:
+                write_sqlite(checklist, conn, str(ckl_path.resolve()), file_sha256(ckl_path))
+            analyze(conn)
+        finally:
+            conn.close()
+
+    print(f"[*] Checklist added to SQLite database: {new_sqlite_path}")
+    return str(new_sqlite_path)
@@ -2,9 +2,10 @@
 # Convert STIGs in .csv to .json
 
 import csv
-import json
 from pathlib import Path
 
+from stig_converter.converters.writers import write_findings_json
+from stig_converter.instrumentation import stage, track
 from stig_converter.security_utils import validate_output_path, get_default_allowed_dirs
 
 
@@ -25,11 +26,11 @@ def convert_csv_to_json(csv_file, json_path) -> str:
     )
 
     print(f"[*] Converting CSV: {csv_path}")
-    with open(csv_path, encoding="utf-8") as read_file:
-        json_array = list(csv.DictReader(read_file))
-
-    with open(new_json_path, "w", encoding="utf-8") as json_file:
-        json.dump(json_array, json_file, indent=4)
+    # Rows are serialized as they are read; the CSV is never fully in memory
+    with open(csv_path, encoding="utf-8") as read_file, \
+            open(new_json_path, "w", encoding="utf-8") as json_file:
+        with stage("serialize"):
+            write_findings_json(track(csv.DictReader(read_file)), json_file)
 
     print(f"[*] New JSON file created: {new_json_path}")
     return str(new_json_path)
@@ -0,0 +1,35 @@
+# csv_to_jsonl.py
+# Convert STIGs in .csv to JSON Lines (.jsonl / .ndjson)
+
+import csv
+from pathlib import Path
+
+from stig_converter.converters.writers import write_findings_jsonl
+from stig_converter.instrumentation import stage, track
+from stig_converter.security_utils import get_default_allowed_dirs, validate_output_path
+
+
+def convert_csv_to_jsonl(csv_file, jsonl_path) -> str:
+    """
+    Converts .csv to JSON Lines, one row per line.
+    :param csv_file: Path to the .csv file to convert
+    :param jsonl_path: Output directory or file path for the .jsonl
+    :return: Path to the created .jsonl file
+    """
+    csv_path = Path(csv_file)
+
+    if not csv_path.is_file():
+        raise FileNotFoundError(f"[X] CSV file does not exist: {csv_path}")
+
+    new_jsonl_path = validate_output_path(
+        jsonl_path, csv_file, get_default_allowed_dirs(), extension=".jsonl"
+    )
+
+    print(f"[*] Converting CSV: {csv_path}")
+    with open(csv_path, encoding="utf-8") as read_file, \
+            open(new_jsonl_path, "w", encoding="utf-8") as jsonl_file:
+        with stage("serialize"):
+            write_findings_jsonl(track(csv.DictReader(read_file)), jsonl_file)
+
+    print(f"[*] New JSONL file created: {new_jsonl_path}")
+    return str(new_jsonl_path)
@@ -2,21 +2,23 @@
 # Convert .json to STIG checklist .ckl file
 
 import json
+import os
 import xml.etree.ElementTree as ET
+from functools import lru_cache
 from pathlib import Path
 
+from stig_converter.converters.readers import safe_parse
+from stig_converter.converters.writers import _escape
+from stig_converter.instrumentation import count, stage
 from stig_converter.security_utils import validate_output_path, get_default_allowed_dirs
 
 # Asset child tags that can be populated from JSON findings
 _ASSET_FIELDS = {"HOST_NAME", "HOST_IP", "HOST_MAC", "HOST_FQDN", "TARGET_COMMENT"}
 
+# VULN child tags that can be populated from JSON findings
+_VULN_FIELDS = ("STATUS", "FINDING_DETAILS", "COMMENTS")
 
-def _populate_asset(ckl_root, finding: dict) -> None:
-    """Write asset-level fields from a JSON finding into the CKL template."""
-    for asset in ckl_root.iter("ASSET"):
-        for child in asset:
-            if child.tag in _ASSET_FIELDS and child.tag in finding:
-                child.text = finding[child.tag]
+_CKL_HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n<!--DISA STIG Viewer :: 2.16-->\n'
 
 
 def _get_vuln_num(vuln):
@@ -29,12 +31,121 @@ def _get_vuln_num(vuln):
     return None
 
 
-def _apply_finding(vuln, finding: dict) -> None:
-    """Write STATUS, FINDING_DETAILS, and COMMENTS from a JSON finding into a VULN element."""
-    for tag in ("STATUS", "FINDING_DETAILS", "COMMENTS"):
-        elem = vuln.find(f"./{tag}")
-        if elem is not None and tag in finding:
-            elem.text = finding[tag]
+class CklTemplate:
+    """
+    A CKL template parsed once and reused to populate any number of findings files.
+
+    The template is serialized a single time with a placeholder in every element a
+    JSON finding may fill (the asset fields and each VULN's STATUS, FINDING_DETAILS
+    and COMMENTS). The serialized text is split at those placeholders, and a
+    Vuln_Num → slot index is precomputed, so rendering a host's checklist is a
+    dict lookup per finding plus one string join; the XML is never re-parsed.
+    """
+
+    def __init__(self, template_ckl) -> None:
+        root = safe_parse(template_ckl).getroot()
+
+        slots = []  # (tag, default text) per fillable element, in document order
+        self._asset_slots = {}  # asset tag → [slot index]
+        self._vuln_slots = {}  # Vuln_Num → {tag: [slot index]}
+
+        # Fillable elements get a private-use-area marker that cannot occur in real CKL text
+        def claim(elem) -> int:
+            index = len(slots)
+            slots.append((elem.tag, elem.text or ""))
+            elem.text = f"\ue000{index}\ue001"
+            return index
+
+        # Claim fillable elements in document order so the markers can be split in sequence
+        for parent in root.iter():
+            if parent.tag == "ASSET":
+                for child in parent:
+                    if child.tag in _ASSET_FIELDS and len(child) == 0:
+                        self._asset_slots.setdefault(child.tag, []).append(claim(child))
+            elif parent.tag == "VULN":
+                by_tag = self._vuln_slots.setdefault(_get_vuln_num(parent), {})
+                for child in parent:
+                    if child.tag in _VULN_FIELDS and len(child) == 0:
+                        by_tag.setdefault(child.tag, []).append(claim(child))
+
+        # Split the serialized template into the static text around each slot
+        xml = ET.tostring(root, encoding="unicode")
+        self._chunks = []
+        pos = 0
+        for index, (tag, _) in enumerate(slots):
+            marker = f"<{tag}>\ue000{index}\ue001</{tag}>"
+            start = xml.index(marker, pos)
+            self._chunks.append(xml[pos:start])
+            pos = start + len(marker)
+        self._chunks.append(xml[pos:])
+        self._slots = slots
+
+    def render(self, findings) -> str:
+        """
+        Return the populated CKL document for an iterable of JSON findings.
+        Asset fields come from the first finding; VULNs are matched on Vuln_Num.
+        Findings are consumed in one pass, so a streaming generator works as well as a list.
+        """
+        values = [text for _, text in self._slots]
+
+        first = True
+        for finding in findings:
+            if first:
+                for tag, indices in self._asset_slots.items():
+                    if tag in finding:
+                        for index in indices:
+                            values[index] = finding[tag]
+                first = False
+
+            vuln_num = finding.get("Vuln_Num")
+            if not vuln_num:
+                continue  # would otherwise match template VULNs that have no Vuln_Num either
+            by_tag = self._vuln_slots.get(vuln_num)
+            if not by_tag:
+                continue
+            for tag, indices in by_tag.items():
+                if tag in finding:
+                    for index in indices:
+                        values[index] = finding[tag]
+
+        parts = [_CKL_HEADER]
+        for chunk, (tag, _), value in zip(self._chunks, self._slots, values):
+            parts.append(chunk)
+            value = "" if value is None else str(value)
+            parts.append(f"<{tag}>{_escape(value)}</{tag}>" if value else f"<{tag} />")
+        parts.append(self._chunks[-1])
+        return "".join(parts)
+
+
+@lru_cache(maxsize=8)
+def _cached_template(path: str, mtime_ns: int, size: int) -> CklTemplate:
+    return CklTemplate(path)
+
+
+def load_template(template_ckl) -> CklTemplate:
+    """
+    Return a parsed CklTemplate, reusing a cached one while the file is unchanged.
+    The cache is per process, so batch workers parse each template only once.
+    """
+    path = os.path.realpath(template_ckl)
+    stat = os.stat(path)
+    return _cached_template(path, stat.st_mtime_ns, stat.st_size)
+
+
+def write_populated_ckl(findings, template_ckl, fp) -> None:
+    """
+    Populate a CKL template with JSON findings and write the result.
+    :param findings: Iterable of flat finding dicts (ckl_to_json format)
+    :param template_ckl: Path to the CKL template, or an already loaded CklTemplate
+    :param fp: Text file opened for writing
+    """
+    if not isinstance(template_ckl, CklTemplate):
+        with stage("parse"):
+            template_ckl = load_template(template_ckl)
+    with stage("transform"):
+        text = template_ckl.render(findings)
+    with stage("serialize"):
+        fp.write(text)
 
 
 def convert_json_to_ckl(json_file, ckl_path, template_ckl) -> str:
@@ -57,30 +168,48 @@ def convert_json_to_ckl(json_file, ckl_path, template_ckl) -> str:
         ckl_path, json_file, get_default_allowed_dirs(), extension=".ckl"
     )
 
-    with open(json_path, "r", encoding="utf-8") as read_file:
+    with stage("parse"), open(json_path, "r", encoding="utf-8") as read_file:
         loaded_data = json.load(read_file)
-
-    ckl_tree = ET.parse(template_ckl_path)
-    ckl_root = ckl_tree.getroot()
-
-    if loaded_data:
-        _populate_asset(ckl_root, loaded_data[0])
-
-    # Build a lookup of findings by Vuln_Num for O(1) matching
-    findings_by_vuln = {f["Vuln_Num"]: f for f in loaded_data if "Vuln_Num" in f}
-
-    for vuln in ckl_root.iter("VULN"):
-        vuln_num = _get_vuln_num(vuln)
-        if vuln_num in findings_by_vuln:
-            _apply_finding(vuln, findings_by_vuln[vuln_num])
-
-    # Serialize without ET's own XML declaration, then write our canonical header
-    new_xml = ET.tostring(ckl_root, encoding="unicode")
+    count(rules=len(loaded_data))
 
     with open(new_ckl_path, "w", encoding="utf-8") as ckl_file:
-        ckl_file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
-        ckl_file.write("<!--DISA STIG Viewer :: 2.16-->\n")
-        ckl_file.write(new_xml)
+        write_populated_ckl(loaded_data, template_ckl_path, ckl_file)
 
     print(f"[*] New CKL created: {new_ckl_path}")
     return str(new_ckl_path)
+
+
+def convert_json_to_ckl_bulk(json_files, output_dir, template_ckl) -> list:
+    """
+    Populate one CKL template for many hosts' JSON findings files.
+    The template is parsed and indexed once; each host's checklist is rendered
+    from the cached template and written to output_dir as <json stem>.ckl.
+    :param json_files: Iterable of JSON findings file paths
+    :param output_dir: Output directory for the new .ckl files
+    :param template_ckl: Path to the CKL template to populate
+    :return: Paths to the created .ckl files
+    """
+    template_ckl_path = Path(template_ckl)
+    if not template_ckl_path.exists():
+        raise FileNotFoundError(f"[X] Template checklist does not exist: {template_ckl_path}")
+
+    template = load_template(template_ckl_path)
+    output_dir = Path(output_dir)
+    allowed_dirs = get_default_allowed_dirs()
+
+    created = []
+    for json_file in json_files:
+        json_path = Path(json_file)
+        if not json_path.exists():
+            raise FileNotFoundError(f"[X] JSON file does not exist: {json_path}")
+        new_ckl_path = validate_output_path(
+            output_dir / f"{json_path.stem}.ckl", json_path, allowed_dirs, extension=".ckl"
+        )
+        with open(json_path, "r", encoding="utf-8") as read_file:
+            loaded_data = json.load(read_file)
+        with open(new_ckl_path, "w", encoding="utf-8") as ckl_file:
+            write_populated_ckl(loaded_data, template, ckl_file)
+        created.append(str(new_ckl_path))
+
+    print(f"[*] {len(created)} CKL(s) created from template {template_ckl_path}")
+    return created
@@ -1,10 +1,12 @@
 # json_to_markdown.py
 # Generate Markdown reports from STIG JSON data
 
+import io
 import json
 from pathlib import Path
 
-from stig_converter.security_utils import validate_output_path, get_default_allowed_dirs
+from stig_converter.instrumentation import count, stage
+from stig_converter.security_utils import get_default_allowed_dirs, validate_output_path
 
 _HR = "---\n\n"
 
@@ -43,10 +45,48 @@ def _write_finding_md(outfile, finding: dict) -> None:
     outfile.write(_HR)
 
 
+def write_stigviewer_md(data: dict, outfile) -> None:
+    """
+    Render a stigviewer-format dict as a Markdown report.
+    Expected structure: {"stig": {"date": ..., "description": ..., "findings": {...}}}
+    :param data: Parsed stigviewer JSON dict
+    :param outfile: Text file to write the report to
+    """
+    header = data["stig"]
+    vulnids = header["findings"]
+
+    outfile.write("# Application Security and Development STIGs\n\n")
+    outfile.write(f"**Date:** {header['date']}\n\n")
+    outfile.write(f"**Description:** {header['description']}\n\n")
+    outfile.write(_HR)
+
+    for v in vulnids.values():
+        outfile.write("## " + (v.get("title") or "") + "\n\n")
+        outfile.write("| Severity | Vulnerability ID | Rule ID |\n")
+        outfile.write("|:---:|:---:|:---:|\n")
+        outfile.write(
+            f"| {_severity_label(v.get('severity') or 'low')}"
+            f" | {v.get('id') or ''}"
+            f" | {v.get('ruleID') or ''} |\n\n"
+        )
+        outfile.write("### Description\n\n")
+        outfile.write((v.get("description") or "") + "\n\n")
+        outfile.write("### Check Text\n\n")
+        outfile.write((v.get("checktext") or "") + "\n\n")
+        outfile.write("| Check ID |\n")
+        outfile.write("|---|\n")
+        outfile.write(f"| {v.get('checkid') or ''} |\n\n")
+        outfile.write("### Fix Text\n\n")
+        outfile.write((v.get("fixtext") or "") + "\n\n")
+        outfile.write("| Fix ID |\n")
+        outfile.write("|---|\n")
+        outfile.write(f"| {v.get('fixid') or ''} |\n\n")
+        outfile.write(_HR)
+
+
 def _write_stigviewer_md(data: dict, output_path) -> str:
     """
     Write a Markdown report from an already-loaded stigviewer-format dict.
-    Expected structure: {"stig": {"date": ..., "description": ..., "findings": {...}}}
     :param data: Parsed stigviewer JSON dict
     :param output_path: Output file path for the .md report
     :return: Path to the created Markdown file
@@ -54,38 +94,9 @@ def _write_stigviewer_md(data: dict, output_path) -> str:
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    header = data["stig"]
-    vulnids = header["findings"]
-
     print(f"[*] Writing {output_path}.")
     with open(output_path, "w", encoding="utf-8") as outfile:
-        outfile.write("# Application Security and Development STIGs\n\n")
-        outfile.write(f"**Date:** {header['date']}\n\n")
-        outfile.write(f"**Description:** {header['description']}\n\n")
-        outfile.write(_HR)
-
-        for v in vulnids.values():
-            outfile.write("## " + (v.get("title") or "") + "\n\n")
-            outfile.write("| Severity | Vulnerability ID | Rule ID |\n")
-            outfile.write("|:---:|:---:|:---:|\n")
-            outfile.write(
-                f"| {_severity_label(v.get('severity') or 'low')}"
-                f" | {v.get('id') or ''}"
-                f" | {v.get('ruleID') or ''} |\n\n"
-            )
-            outfile.write("### Description\n\n")
-            outfile.write((v.get("description") or "") + "\n\n")
-            outfile.write("### Check Text\n\n")
-            outfile.write((v.get("checktext") or "") + "\n\n")
-            outfile.write("| Check ID |\n")
-            outfile.write("|---|\n")
-            outfile.write(f"| {v.get('checkid') or ''} |\n\n")
-            outfile.write("### Fix Text\n\n")
-            outfile.write((v.get("fixtext") or "") + "\n\n")
-            outfile.write("| Fix ID |\n")
-            outfile.write("|---|\n")
-            outfile.write(f"| {v.get('fixid') or ''} |\n\n")
-            outfile.write(_HR)
+        write_stigviewer_md(data, outfile)
 
     print(f"[*] File {output_path} written.")
     return str(output_path)
@@ -107,11 +118,10 @@ def write_stigs(json_file, markdown_file) -> str:
     return _write_stigviewer_md(data, validated_path)
 
 
-def _write_checklist_header(outfile, findings: list) -> None:
-    """Write the host/date header block for a checklist report."""
-    if not findings:
+def _write_checklist_header(outfile, first) -> None:
+    """Write the host/date header block for a checklist report from its first finding."""
+    if not first:
         return
-    first = findings[0]
     host = first.get("HOST_NAME", "")
     ip = first.get("HOST_IP", "")
     date = first.get("DATE", "")
@@ -122,43 +132,104 @@ def _write_checklist_header(outfile, findings: list) -> None:
         outfile.write(f"**Date:** {date}\n\n")
 
 
-def convert_checklist_to_md(findings: list, output_path) -> str:
+def _write_summary(outfile, first, status_counts: dict) -> None:
+    outfile.write("# STIG Checklist Report\n\n")
+    _write_checklist_header(outfile, first)
+
+    outfile.write("## Summary\n\n")
+    outfile.write("| Status | Count |\n")
+    outfile.write("|:---|:---:|\n")
+    for status, n in sorted(status_counts.items()):
+        outfile.write(f"| {status} | {n} |\n")
+    outfile.write("\n---\n\n")
+
+
+def _write_checklist_md_passes(open_findings, outfile) -> int:
     """
-    Generate a Markdown report from a flat checklist findings list (ckl_to_json format).
-    :param findings: List of finding dicts from convert_ckl_to_json or convert_csv_to_json
-    :param output_path: Output file path for the .md report
-    :return: Path to the created Markdown file
+    Render a checklist report in streaming passes over a re-readable source:
+    one to count the summary, then one per non-empty section. Memory stays
+    constant however many findings there are.
     """
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    status_counts: dict = {}
+    first = None
+    rendered = 0
+    for f in open_findings():
+        if first is None:
+            first = f
+        status = f.get("STATUS", "Unknown")
+        status_counts[status] = status_counts.get(status, 0) + 1
+        rendered += 1
+
+    _write_summary(outfile, first, status_counts)
+    open_count = status_counts.get("Open", 0)
+    for heading, is_open, n in (
+        ("## Open Findings\n\n", True, open_count),
+        ("## All Other Findings\n\n", False, rendered - open_count),
+    ):
+        if not n:
+            continue
+        outfile.write(heading)
+        for f in open_findings():
+            if (f.get("STATUS") == "Open") == is_open:
+                _write_finding_md(outfile, f)
+    return rendered
+
+
+def write_checklist_md(findings, outfile) -> int:
+    """
+    Render a checklist report (summary, then Open findings, then all others).
+    A list, or a callable that returns a fresh iterator of the findings on every
+    call (e.g. lambda: iter_jsonl(path)), is rendered in streaming passes and
+    holds nothing in memory. Any other iterable (e.g. an iter_ckl_findings
+    generator) is read once, and its two sections are rendered into in-memory
+    buffers while the summary is counted, so memory grows with the report.
+    :param findings: Flat finding dicts (ckl_to_json format): a list, a callable
+        returning an iterator, or a one-shot iterable
+    :param outfile: Text file to write the report to
+    :return: Number of findings rendered
+    """
+    if isinstance(findings, (list, tuple)):
+        return _write_checklist_md_passes(lambda: findings, outfile)
+    if callable(findings):
+        return _write_checklist_md_passes(findings, outfile)
 
     status_counts: dict = {}
+    open_md = io.StringIO()
+    other_md = io.StringIO()
+    first = None
+    rendered = 0
+
     for f in findings:
+        if first is None:
+            first = f
         status = f.get("STATUS", "Unknown")
         status_counts[status] = status_counts.get(status, 0) + 1
+        _write_finding_md(open_md if f.get("STATUS") == "Open" else other_md, f)
+        rendered += 1
 
-    with open(output_path, "w", encoding="utf-8") as outfile:
-        outfile.write("# STIG Checklist Report\n\n")
-        _write_checklist_header(outfile, findings)
-
-        outfile.write("## Summary\n\n")
-        outfile.write("| Status | Count |\n")
-        outfile.write("|:---|:---:|\n")
-        for status, count in sorted(status_counts.items()):
-            outfile.write(f"| {status} | {count} |\n")
-        outfile.write("\n---\n\n")
-
-        open_findings = [f for f in findings if f.get("STATUS") == "Open"]
-        if open_findings:
-            outfile.write("## Open Findings\n\n")
-            for finding in open_findings:
-                _write_finding_md(outfile, finding)
-
-        other_findings = [f for f in findings if f.get("STATUS") != "Open"]
-        if other_findings:
-            outfile.write("## All Other Findings\n\n")
-            for finding in other_findings:
-                _write_finding_md(outfile, finding)
+    _write_summary(outfile, first, status_counts)
+    if open_md.tell():
+        outfile.write("## Open Findings\n\n")
+        outfile.write(open_md.getvalue())
+    if other_md.tell():
+        outfile.write("## All Other Findings\n\n")
+        outfile.write(other_md.getvalue())
+    return rendered
+
+
+def convert_checklist_to_md(findings, output_path) -> str:
+    """
+    Generate a Markdown report from flat checklist findings (ckl_to_json format).
+    :param findings: Finding dicts, e.g. a list loaded from JSON, a generator from
+        iter_ckl_findings, or a callable re-reading a file (see write_checklist_md)
+    :param output_path: Output file path for the .md report
+    :return: Path to the created Markdown file
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with stage("serialize"), open(output_path, "w", encoding="utf-8") as outfile:
+        write_checklist_md(findings, outfile)
 
     print(f"[*] New Markdown created: {output_path}")
     return str(output_path)
@@ -173,8 +244,11 @@ def convert_json_to_md(json_path, output_path) -> str:
     :param output_path: Output file path for the .md report
     :return: Path to the created Markdown file
     """
-    with open(json_path, encoding="utf-8") as f:
+    with stage("parse"), open(json_path, encoding="utf-8") as f:
         data = json.load(f)
     if isinstance(data, list):
+        count(rules=len(data))
         return convert_checklist_to_md(data, output_path)
-    return _write_stigviewer_md(data, output_path)
+    count(rules=len(data.get("stig", {}).get("findings", {})), stigs=1)
+    with stage("serialize"):
+        return _write_stigviewer_md(data, output_path)
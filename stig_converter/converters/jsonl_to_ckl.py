@@ -0,0 +1,37 @@
+# jsonl_to_ckl.py
+# Populate a STIG checklist .ckl template from JSON Lines (.jsonl / .ndjson) findings
+
+from pathlib import Path
+
+from stig_converter.converters.json_to_ckl import write_populated_ckl
+from stig_converter.converters.readers import iter_jsonl
+from stig_converter.instrumentation import track
+from stig_converter.security_utils import get_default_allowed_dirs, validate_output_path
+
+
+def convert_jsonl_to_ckl(jsonl_file, ckl_path, template_ckl) -> str:
+    """
+    Populates a pre-existing STIG Checklist with the findings of a JSON Lines file.
+    Lines are parsed one at a time; the findings are never held as a list.
+    :param jsonl_file: Path to the .jsonl findings file
+    :param ckl_path: Output directory or file path for the new .ckl
+    :param template_ckl: Path to the CKL template to populate
+    :return: Path to the created .ckl file
+    """
+    jsonl_path = Path(jsonl_file)
+    template_ckl_path = Path(template_ckl)
+
+    if not jsonl_path.exists():
+        raise FileNotFoundError(f"[X] JSONL file does not exist: {jsonl_path}")
+    if not template_ckl_path.exists():
+        raise FileNotFoundError(f"[X] Template checklist does not exist: {template_ckl_path}")
+
+    new_ckl_path = validate_output_path(
+        ckl_path, jsonl_file, get_default_allowed_dirs(), extension=".ckl"
+    )
+
+    with open(new_ckl_path, "w", encoding="utf-8") as ckl_file:
+        write_populated_ckl(track(iter_jsonl(jsonl_path)), template_ckl_path, ckl_file)
+
+    print(f"[*] New CKL created: {new_ckl_path}")
+    return str(new_ckl_path)
@@ -0,0 +1,39 @@
+# jsonl_to_markdown.py
+# Generate a Markdown checklist report from JSON Lines (.jsonl / .ndjson) findings
+
+from pathlib import Path
+
+from stig_converter.converters.json_to_markdown import convert_checklist_to_md
+from stig_converter.converters.readers import iter_jsonl
+from stig_converter.instrumentation import track
+from stig_converter.security_utils import get_default_allowed_dirs, validate_output_path
+
+
+def convert_jsonl_to_md(jsonl_file, output_path) -> str:
+    """
+    Convert a JSON Lines findings file to a Markdown report.
+    The file is streamed in a few passes (summary counts, then each section), so
+    no finding or rendered section is held in memory.
+    :param jsonl_file: Path to the .jsonl findings file
+    :param output_path: Output directory or file path for the .md report
+    :return: Path to the created Markdown file
+    """
+    jsonl_path = Path(jsonl_file)
+    if not jsonl_path.is_file():
+        raise FileNotFoundError(f"[X] JSONL file does not exist: {jsonl_path}")
+
+    new_md_path = validate_output_path(
+        output_path, jsonl_path, get_default_allowed_dirs(), extension=".md"
+    )
+
+    print(f"[*] Converting JSONL: {jsonl_path}")
+    first_pass = True
+
+    def findings():
+        # Each call re-reads the file; only the first pass counts the rules
+        nonlocal first_pass
+        tracked = track(iter_jsonl(jsonl_path), count_rules=first_pass)
+        first_pass = False
+        return tracked
+
+    return convert_checklist_to_md(findings, new_md_path)
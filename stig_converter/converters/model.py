@@ -0,0 +1,180 @@
+# model.py
+# Compact in-memory checklist model shared by every reader and writer
+
+from sys import intern
+
+# CKL STATUS values → CKLB lowercase equivalents
+CKL_TO_CKLB_STATUS = {
+    "Not_Reviewed": "not_reviewed",
+    "Open": "open",
+    "NotAFinding": "not_a_finding",
+    "Not_Applicable": "not_applicable",
+}
+
+# CKLB status values → CKL equivalents
+CKLB_TO_CKL_STATUS = {v: k for k, v in CKL_TO_CKLB_STATUS.items()}
+
+# CKL VULN_ATTRIBUTE name → Rule slot, in the order STIG Viewer writes STIG_DATA
+CKL_STIG_DATA = (
+    ("Vuln_Num",                   "vuln_num"),
+    ("Severity",                   "severity"),
+    ("Group_Title",                "group_title"),
+    ("Rule_ID",                    "rule_id"),
+    ("Rule_Ver",                   "rule_ver"),
+    ("Rule_Title",                 "rule_title"),
+    ("Vuln_Discuss",               "vuln_discuss"),
+    ("IA_Controls",                "ia_controls"),
+    ("Check_Content",              "check_content"),
+    ("Fix_Text",                   "fix_text"),
+    ("False_Positives",            "false_positives"),
+    ("False_Negatives",            "false_negatives"),
+    ("Documentable",               "documentable"),
+    ("Mitigations",                "mitigations"),
+    ("Potential_Impact",           "potential_impact"),
+    ("Third_Party_Tools",          "third_party_tools"),
+    ("Mitigation_Control",         "mitigation_control"),
+    ("Responsibility",             "responsibility"),
+    ("Security_Override_Guidance", "security_override_guidance"),
+    ("Check_Content_Ref",          "check_content_ref"),
+    ("Weight",                     "weight"),
+    ("Class",                      "classification"),
+    ("STIGRef",                    "stig_ref"),
+    ("STIG_UUID",                  "stig_uuid"),
+)
+
+# Every VULN_ATTRIBUTE a reader understands (a superset of what the CKL writer emits)
+CKL_ATTRIBUTE_SLOTS = dict(CKL_STIG_DATA, TargetKey="target_key", Rule_UUID="uuid")
+
+# Values repeated across thousands of rules; interning stores each one only once
+_INTERNED = frozenset({
+    "severity", "group_title", "documentable", "check_content_ref", "weight",
+    "classification", "stig_ref", "stig_uuid", "target_key", "status",
+})
+
+_RULE_DEFAULTS = {
+    "documentable": "false",
+    "check_content_ref": "M",
+    "weight": "10.0",
+    "classification": "Unclassified",
+    "status": "Not_Reviewed",
+}
+
+
+class Asset:
+    """Target host a checklist applies to (the CKL ASSET block / CKLB target_data)."""
+
+    __slots__ = (
+        "role", "asset_type", "host_name", "host_ip", "host_mac", "host_fqdn",
+        "target_comment", "tech_area", "target_key", "web_or_database",
+        "web_db_site", "web_db_instance",
+    )
+
+    def __init__(self, **fields) -> None:
+        self.role = "None"
+        self.asset_type = "Computing"
+        self.host_name = ""
+        self.host_ip = ""
+        self.host_mac = ""
+        self.host_fqdn = ""
+        self.target_comment = ""
+        self.tech_area = ""
+        self.target_key = ""
+        self.web_or_database = "false"
+        self.web_db_site = ""
+        self.web_db_instance = ""
+        for name, value in fields.items():
+            setattr(self, name, value)
+
+
+class Rule:
+    """
+    A single STIG rule and its review result (a CKL VULN / CKLB rule).
+    Attribute values are stored as CKL strings; STATUS uses the CKL spelling.
+    """
+
+    __slots__ = (
+        *(slot for _, slot in CKL_STIG_DATA),
+        "target_key", "uuid", "check_content_href", "legacy_ids", "ccis",
+        "status", "finding_details", "comments",
+        "severity_override", "severity_justification",
+    )
+
+    def __init__(self, **fields) -> None:
+        for slot in self.__slots__:
+            setattr(self, slot, _RULE_DEFAULTS.get(slot, ""))
+        self.legacy_ids = []
+        self.ccis = []
+        for name, value in fields.items():
+            self.set(name, value)
+
+    def set(self, slot: str, value) -> None:
+        """Set a field, interning values that repeat across rules."""
+        if slot in _INTERNED and isinstance(value, str):
+            value = intern(value)
+        setattr(self, slot, value)
+
+    def to_finding(self, asset: Asset, date: str) -> dict:
+        """
+        Flatten into the findings dict used by the CSV/JSON/Markdown outputs.
+        Newlines in rule attributes are collapsed so each finding stays on one CSV row.
+        """
+        return {
+            "DATE": date,
+            "HOST_NAME": asset.host_name,
+            "HOST_IP": asset.host_ip,
+            "Vuln_Num": self.vuln_num.replace("\n", " "),
+            "Severity": self.severity.replace("\n", " "),
+            "Group_Title": self.group_title.replace("\n", " "),
+            "Rule_ID": self.rule_id.replace("\n", " "),
+            "Rule_Ver": self.rule_ver.replace("\n", " "),
+            "Rule_Title": self.rule_title.replace("\n", " "),
+            "Fix_Text": self.fix_text.replace("\n", " "),
+            "STATUS": self.status,
+            "FINDING_DETAILS": self.finding_details,
+            "COMMENTS": self.comments,
+        }
+
+    def __repr__(self) -> str:
+        return f"Rule({self.vuln_num!r}, {self.rule_id!r}, status={self.status!r})"
+
+
+class Stig:
+    """One STIG benchmark within a checklist (a CKL iSTIG / CKLB stigs entry)."""
+
+    __slots__ = ("stig_id", "title", "version", "release_info", "uuid", "rules")
+
+    def __init__(self, stig_id="", title="", version="", release_info="", uuid="", rules=None):
+        self.stig_id = stig_id
+        self.title = title
+        self.version = version
+        self.release_info = release_info
+        self.uuid = intern(uuid)
+        self.rules = rules if rules is not None else []
+
+    @property
+    def stig_ref(self) -> str:
+        """The STIGRef string STIG Viewer stores on every VULN."""
+        return f"{self.title} :: Version {self.version}, {self.release_info}"
+
+    def __repr__(self) -> str:
+        return f"Stig({self.stig_id!r}, version={self.version!r}, rules={len(self.rules)})"
+
+
+class Checklist:
+    """A complete checklist: one asset plus one or more STIGs."""
+
+    __slots__ = ("title", "id", "asset", "stigs")
+
+    def __init__(self, title="", id="", asset=None, stigs=None):
+        self.title = title
+        self.id = id
+        self.asset = asset if asset is not None else Asset()
+        self.stigs = stigs if stigs is not None else []
+
+    def rules(self):
+        """Iterate over every rule across all STIGs."""
+        for stig in self.stigs:
+            yield from stig.rules
+
+    def rule_count(self) -> int:
+        return sum(len(stig.rules) for stig in self.stigs)
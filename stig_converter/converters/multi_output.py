@@ -0,0 +1,133 @@
+# multi_output.py
+# Convert one input into several output formats from a single parse
+
+import csv
+import json
+from datetime import datetime
+from pathlib import Path
+
+from stig_converter.converters.benchmark_cache import load_benchmark
+from stig_converter.converters.json_to_ckl import write_populated_ckl
+from stig_converter.converters.json_to_markdown import _write_stigviewer_md, write_checklist_md
+from stig_converter.converters.readers import file_sha256, iter_jsonl, read_ckl, read_cklb
+from stig_converter.converters.sqlite_store import analyze, open_database, write_sqlite
+from stig_converter.converters.writers import (
+    iter_findings,
+    write_ckl,
+    write_cklb,
+    write_findings_csv,
+    write_findings_json,
+    write_findings_jsonl,
+)
+from stig_converter.instrumentation import count, count_checklist, stage
+from stig_converter.security_utils import get_default_allowed_dirs, validate_output_path
+
+# Inputs that are read into the shared Checklist model
+_MODEL_READERS = {
+    "ckl": read_ckl,
+    "cklb": read_cklb,
+    "xml": load_benchmark,
+    "zip": load_benchmark,
+}
+
+
+def _load(input_path: Path, input_ext: str):
+    """Parse the input once: a Checklist for checklist formats, a findings list/dict otherwise."""
+    if input_ext in _MODEL_READERS:
+        return _MODEL_READERS[input_ext](input_path)
+    if input_ext == "csv":
+        with open(input_path, encoding="utf-8") as f:
+            return list(csv.DictReader(f))
+    if input_ext in ("jsonl", "ndjson"):
+        return list(iter_jsonl(input_path))
+    with open(input_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _findings(source, date: str):
+    """Flat findings for CSV/JSON/Markdown writers, whichever form the input was loaded in."""
+    if isinstance(source, list):
+        return source
+    return iter_findings(source, date)
+
+
+def _write(
+    source, output_ext: str, output_path: Path, date: str, template_ckl, input_path: Path
+) -> None:
+    if output_ext == "csv":
+        with open(output_path, "w", newline="", encoding="utf-8") as f:
+            write_findings_csv(_findings(source, date), f)
+    elif output_ext == "json":
+        with open(output_path, "w", encoding="utf-8") as f:
+            write_findings_json(_findings(source, date), f)
+    elif output_ext in ("jsonl", "ndjson"):
+        with open(output_path, "w", encoding="utf-8") as f:
+            write_findings_jsonl(_findings(source, date), f)
+    elif output_ext == "md":
+        if isinstance(source, dict):
+            _write_stigviewer_md(source, output_path)
+            return
+        with open(output_path, "w", encoding="utf-8") as f:
+            write_checklist_md(_findings(source, date), f)
+    elif output_ext == "cklb":
+        with open(output_path, "w", encoding="utf-8") as f:
+            write_cklb(source, f)
+    elif output_ext == "ckl" and isinstance(source, list):
+        if not template_ckl:
+            raise ValueError("--template-ckl is required for JSON/JSONL → CKL conversion")
+        with open(output_path, "w", encoding="utf-8") as f:
+            write_populated_ckl(source, Path(template_ckl), f)
+    elif output_ext == "ckl":
+        with open(output_path, "wb") as f:
+            write_ckl(source, f)
+    elif output_ext == "sqlite" and not isinstance(source, (list, dict)):
+        conn = open_database(output_path)
+        try:
+            with conn:
+                write_sqlite(source, conn, str(input_path.resolve()), file_sha256(input_path))
+            analyze(conn)
+        finally:
+            conn.close()
+    else:
+        raise ValueError(f"Unsupported output type '{output_ext}'")
+
+
+def convert_to_many(input_file, output_paths, template_ckl=None) -> list:
+    """
+    Convert one input file into several outputs, parsing the input only once.
+    Every output is written from the same in-memory checklist (or findings list),
+    so e.g. CKL → CSV + JSON + Markdown + CKLB costs a single XML parse.
+    :param input_file: Path to the input file (.ckl, .cklb, .xml, .zip, .csv, .json, .jsonl)
+    :param output_paths: Output file paths; each one's extension selects its format
+    :param template_ckl: CKL template, required when a JSON input is written to .ckl
+    :return: Paths of the created files, in the order given
+    """
+    input_path = Path(input_file)
+    if not input_path.is_file():
+        raise FileNotFoundError(f"[X] Input file does not exist: {input_path}")
+    input_ext = input_path.suffix[1:].lower()
+    current_date = datetime.now().strftime("%Y%m%d")
+
+    targets = []
+    for output_path in output_paths:
+        output_ext = Path(output_path).suffix[1:].lower()
+        validated = validate_output_path(
+            output_path, input_path, get_default_allowed_dirs(), extension=f".{output_ext}"
+        )
+        targets.append((validated, output_ext))
+
+    print(f"[*] Converting {input_ext.upper()} → {len(targets)} outputs: {input_path}")
+    with stage("parse"):
+        source = _load(input_path, input_ext)
+    if isinstance(source, list):
+        count(rules=len(source))
+    elif not isinstance(source, dict):
+        count_checklist(source)
+
+    created = []
+    for output_path, output_ext in targets:
+        with stage("serialize"):
+            _write(source, output_ext, output_path, current_date, template_ckl, input_path)
+        print(f"[*] New {output_ext.upper()} created: {output_path}")
+        created.append(str(output_path))
+    return created
@@ -0,0 +1,616 @@
+# readers.py
+# Readers that fill the shared checklist model from each supported input format
+
+import hashlib
+import json
+import logging
+import uuid
+import zipfile
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+from sys import intern
+
+try:
+    from defusedxml.ElementTree import iterparse as safe_iterparse
+    from defusedxml.ElementTree import parse as safe_parse
+
+    DEFUSEDXML_AVAILABLE = True
+except ImportError:
+    from xml.etree.ElementTree import iterparse as safe_iterparse
+    from xml.etree.ElementTree import parse as safe_parse
+
+    DEFUSEDXML_AVAILABLE = False
+    logging.warning(
+        "defusedxml not installed — XML parsing has reduced XXE protection. "
+        "Install it with: pip install defusedxml"
+    )
+
+from stig_converter.converters.model import (
+    CKL_ATTRIBUTE_SLOTS,
+    CKLB_TO_CKL_STATUS,
+    Asset,
+    Checklist,
+    Rule,
+    Stig,
+)
+from stig_converter.security_utils import validate_zip_member
+
+# safe_parse and safe_iterparse are shared with the converters, so the defusedxml
+# fallback is decided in one place
+__all__ = [
+    "DEFUSEDXML_AVAILABLE",
+    "safe_iterparse",
+    "safe_parse",
+    "file_sha256",
+    "iter_ckl",
+    "read_ckl",
+    "iter_ckl_findings",
+    "read_cklb",
+    "find_xccdf_member",
+    "open_xccdf",
+    "peek_xccdf",
+    "read_xccdf",
+    "iter_jsonl",
+]
+_NS = "http://checklists.nist.gov/xccdf/1.1"
+
+# Sub-tags embedded (XML-escaped) inside the XCCDF <description> element → Rule slot
+_DESC_TAGS = [
+    ("VulnDiscussion",           "vuln_discuss"),
+    ("FalsePositives",           "false_positives"),
+    ("FalseNegatives",           "false_negatives"),
+    ("Documentable",             "documentable"),
+    ("Mitigations",              "mitigations"),
+    ("SeverityOverrideGuidance", "security_override_guidance"),
+    ("PotentialImpacts",         "potential_impact"),
+    ("ThirdPartyTools",          "third_party_tools"),
+    ("MitigationControl",        "mitigation_control"),
+    ("Responsibility",           "responsibility"),
+    ("IAControls",               "ia_controls"),
+]
+
+_DESC_TAG_NAMES = frozenset(xml_tag for xml_tag, _ in _DESC_TAGS)
+
+# CKL ASSET child tag → Asset slot
+_ASSET_TAGS = [
+    ("ROLE",            "role"),
+    ("ASSET_TYPE",      "asset_type"),
+    ("HOST_NAME",       "host_name"),
+    ("HOST_IP",         "host_ip"),
+    ("HOST_MAC",        "host_mac"),
+    ("HOST_FQDN",       "host_fqdn"),
+    ("TARGET_COMMENT",  "target_comment"),
+    ("TECH_AREA",       "tech_area"),
+    ("TARGET_KEY",      "target_key"),
+    ("WEB_OR_DATABASE", "web_or_database"),
+    ("WEB_DB_SITE",     "web_db_site"),
+    ("WEB_DB_INSTANCE", "web_db_instance"),
+]
+
+
+def _text(element) -> str:
+    """Safely return element text, or empty string if element is missing or has no text."""
+    if element is None:
+        return ""
+    return element.text or ""
+
+
+# ------------------------------------------------------------------
+# CKL (STIG Viewer XML checklist)
+# ------------------------------------------------------------------
+
+def _parse_asset(asset_el) -> Asset:
+    """Build an Asset from a CKL ASSET element."""
+    return Asset(**{slot: _text(asset_el.find(tag)) for tag, slot in _ASSET_TAGS})
+
+
+def _parse_stig_info(stig_info_el, stig: Stig) -> None:
+    """Fill a Stig's metadata from a STIG_INFO element's SID_NAME → SID_DATA pairs."""
+    info = {}
+    for si_data in stig_info_el.iterfind("SI_DATA"):
+        name = _text(si_data.find("SID_NAME"))
+        if name:
+            info[name] = _text(si_data.find("SID_DATA"))
+    stig.stig_id = info.get("stigid", "")
+    stig.title = info.get("title", "")
+    stig.version = info.get("version", "")
+    stig.release_info = info.get("releaseinfo", "")
+    stig.uuid = intern(info.get("uuid", ""))
+
+
+def _parse_vuln(vuln_el) -> Rule:
+    """Build a Rule from a CKL VULN element."""
+    rule = Rule()
+    for stig_data in vuln_el.iterfind("STIG_DATA"):
+        attr_name = _text(stig_data.find("VULN_ATTRIBUTE"))
+        attr_data = _text(stig_data.find("ATTRIBUTE_DATA"))
+        if attr_name == "LEGACY_ID":
+            rule.legacy_ids.append(attr_data)
+        elif attr_name == "CCI_REF":
+            rule.ccis.append(intern(attr_data))
+        elif attr_name in CKL_ATTRIBUTE_SLOTS:
+            rule.set(CKL_ATTRIBUTE_SLOTS[attr_name], attr_data)
+
+    rule.set("status", _text(vuln_el.find("STATUS")))
+    rule.finding_details = _text(vuln_el.find("FINDING_DETAILS"))
+    rule.comments = _text(vuln_el.find("COMMENTS"))
+    rule.severity_override = _text(vuln_el.find("SEVERITY_OVERRIDE"))
+    rule.severity_justification = _text(vuln_el.find("SEVERITY_JUSTIFICATION"))
+    return rule
+
+
+def _open_source(source, mode: str = "rb", **kwargs):
+    """Open a path, or pass an already open file object through without closing it."""
+    if hasattr(source, "read"):
+        return nullcontext(source)
+    return open(source, mode, **kwargs)
+
+
+def _source_stem(source) -> str:
+    """Default checklist title: the file stem of a path, empty for a file object."""
+    return "" if hasattr(source, "read") else Path(source).stem
+
+
+def file_sha256(path) -> str:
+    """SHA-256 of a file's content, read in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def iter_ckl(ckl_path, checklist: Checklist = None):
+    """
+    Stream (Stig, Rule) pairs out of a CKL file, one per VULN element.
+    Each VULN is cleared and detached from its parent as soon as it has been
+    read, so memory stays flat regardless of how many STIGs are merged in.
+    The checklist's asset and STIG list are filled in as they are read; rules
+    are not attached to their Stig, the caller decides whether to keep them.
+    :param ckl_path: Path to the STIG Checklist .ckl file, or a binary file object
+    :param checklist: Optional Checklist to receive the asset and STIG metadata
+    :return: Generator of (Stig, Rule) tuples
+    """
+    if checklist is None:
+        checklist = Checklist()
+    stig = None
+    stack = []
+
+    with _open_source(ckl_path) as source:
+        for event, elem in safe_iterparse(source, events=("start", "end")):
+            if event == "start":
+                stack.append(elem)
+                if elem.tag == "iSTIG":
+                    stig = Stig()
+                    checklist.stigs.append(stig)
+                continue
+            stack.pop()
+
+            if elem.tag == "ASSET":
+                # ASSET precedes STIGS in a CKL; last ASSET element wins if multiple exist
+                checklist.asset = _parse_asset(elem)
+            elif elem.tag == "STIG_INFO" and stig is not None:
+                _parse_stig_info(elem, stig)
+            elif elem.tag == "VULN":
+                if stig is None:
+                    stig = Stig()
+                    checklist.stigs.append(stig)
+                rule = _parse_vuln(elem)
+                elem.clear()
+                if stack:
+                    stack[-1].remove(elem)
+                yield stig, rule
+
+
+def read_ckl(ckl_path) -> Checklist:
+    """
+    Read a complete CKL file into a Checklist.
+    :param ckl_path: Path to the STIG Checklist .ckl file, or a binary file object
+    :return: Populated Checklist
+    """
+    checklist = Checklist(title=_source_stem(ckl_path))
+    for stig, rule in iter_ckl(ckl_path, checklist):
+        stig.rules.append(rule)
+    return checklist
+
+
+def iter_ckl_findings(ckl_path, date: str = ""):
+    """
+    Stream flat finding dicts out of a CKL file, one per VULN element.
+    :param ckl_path: Path to the STIG Checklist .ckl file, or a binary file object
+    :param date: YYYYMMDD stamp for the DATE column (defaults to today)
+    :return: Generator of finding dicts (DATE, HOST_NAME, HOST_IP, attributes, STATUS, ...)
+    """
+    current_date = date or datetime.now().strftime("%Y%m%d")
+    checklist = Checklist()
+    for _, rule in iter_ckl(ckl_path, checklist):
+        yield rule.to_finding(checklist.asset, current_date)
+
+
+# ------------------------------------------------------------------
+# CKLB (STIG Viewer 3 JSON checklist)
+# ------------------------------------------------------------------
+
+def _cklb_rule(rule: dict, stig_ref: str) -> Rule:
+    """Build a Rule from a CKLB rule dict."""
+    rule_id_src = rule.get("rule_id_src", "")
+    if not rule_id_src:
+        rule_id_src = rule.get("rule_id", "") + "_rule"
+
+    check_content_ref = rule.get("check_content_ref", {})
+    if isinstance(check_content_ref, dict):
+        check_content_ref_name = check_content_ref.get("name", "M")
+        check_content_href = check_content_ref.get("href", "")
+    else:
+        check_content_ref_name = str(check_content_ref)
+        check_content_href = ""
+
+    overrides = rule.get("overrides", {})
+    if not isinstance(overrides, dict):
+        overrides = {}
+
+    return Rule(
+        vuln_num=rule.get("group_id", ""),
+        severity=rule.get("severity", ""),
+        group_title=rule.get("srg_id", ""),
+        rule_id=rule_id_src,
+        rule_ver=rule.get("rule_version", ""),
+        rule_title=rule.get("rule_title", ""),
+        vuln_discuss=rule.get("discussion", ""),
+        ia_controls=rule.get("ia_controls", ""),
+        check_content=rule.get("check_content", ""),
+        fix_text=rule.get("fix_text", ""),
+        false_positives=rule.get("false_positives", ""),
+        false_negatives=rule.get("false_negatives", ""),
+        documentable=rule.get("documentable", "false"),
+        mitigations=rule.get("mitigations", ""),
+        potential_impact=rule.get("potential_impacts", ""),
+        third_party_tools=rule.get("third_party_tools", ""),
+        mitigation_control=rule.get("mitigation_control", ""),
+        responsibility=rule.get("responsibility", ""),
+        security_override_guidance=rule.get("security_override_guidance", ""),
+        check_content_ref=check_content_ref_name,
+        check_content_href=check_content_href,
+        weight=str(rule.get("weight", "10.0")),
+        classification=rule.get("classification", "Unclassified"),
+        stig_ref=stig_ref,
+        stig_uuid=rule.get("stig_uuid", ""),
+        target_key=rule.get("reference_identifier", ""),
+        uuid=rule.get("uuid", ""),
+        legacy_ids=list(rule.get("legacy_ids", [])),
+        ccis=[intern(cci) for cci in rule.get("ccis", [])],
+        status=CKLB_TO_CKL_STATUS.get(rule.get("status", "not_reviewed"), "Not_Reviewed"),
+        finding_details=rule.get("finding_details", ""),
+        comments=rule.get("comments", ""),
+        severity_override=overrides.get("severity", ""),
+        severity_justification=overrides.get("justification", ""),
+    )
+
+
+def read_cklb(cklb_path) -> Checklist:
+    """
+    Read a CKLB (JSON) checklist into a Checklist.
+    :param cklb_path: Path to the .cklb file, or a file object
+    :return: Populated Checklist
+    """
+    with _open_source(cklb_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    try:
+        return _cklb_checklist(data, _source_stem(cklb_path))
+    except (AttributeError, KeyError, TypeError) as e:
+        # A JSON document of the wrong shape, e.g. a list or a rule that is not an object
+        raise ValueError(f"[X] Malformed CKLB checklist {cklb_path}: {e}") from e
+
+
+def _cklb_checklist(data: dict, default_title: str) -> Checklist:
+    """Build a Checklist from a parsed CKLB document."""
+    target = data.get("target_data", {})
+    asset = Asset(
+        role=target.get("role", "None"),
+        asset_type=target.get("target_type", "Computing"),
+        host_name=target.get("host_name", ""),
+        host_ip=target.get("ip_address", ""),
+        host_mac=target.get("mac_address", ""),
+        host_fqdn=target.get("fqdn", ""),
+        target_comment=target.get("comments", ""),
+        tech_area=target.get("technology_area", ""),
+        web_or_database=str(target.get("is_web_database", False)).lower(),
+        web_db_site=target.get("web_db_site", ""),
+        web_db_instance=target.get("web_db_instance", ""),
+    )
+
+    checklist = Checklist(
+        title=data.get("title", default_title),
+        id=data.get("id", ""),
+        asset=asset,
+    )
+    for stig_data in data.get("stigs", []):
+        stig = Stig(
+            stig_id=stig_data.get("stig_id", ""),
+            title=stig_data.get("stig_name", ""),
+            version=stig_data.get("version", ""),
+            release_info=stig_data.get("release_info", ""),
+            uuid=stig_data.get("uuid", ""),
+        )
+        stig_ref = stig.stig_ref
+        stig.rules = [_cklb_rule(r, stig_ref) for r in stig_data.get("rules", [])]
+        checklist.stigs.append(stig)
+    return checklist
+
+
+# ------------------------------------------------------------------
+# XCCDF (DISA Benchmark definition)
+# ------------------------------------------------------------------
+
+def _x(el) -> str:
+    """Return element text or empty string."""
+    return (el.text or "") if el is not None else ""
+
+
+def _find(el, tag: str):
+    return el.find(f"{{{_NS}}}{tag}")
+
+
+def _parse_description(raw: str) -> dict:
+    """
+    Extract named sub-tags from the XML-escaped description string.
+    Tokenizes the string in a single left-to-right pass with str.find instead
+    of one regex scan per sub-tag. The first occurrence of each tag wins and
+    absent tags map to an empty string.
+    """
+    result = {}
+    find = raw.find
+    pos = find("<")
+    while pos != -1:
+        end = find(">", pos + 1)
+        if end == -1:
+            break
+        tag = raw[pos + 1:end]
+        if tag in _DESC_TAG_NAMES:
+            close = find(f"</{tag}>", end + 1)
+            if close != -1:
+                if tag not in result:
+                    result[tag] = raw[end + 1:close].strip()
+                pos = find("<", close + len(tag) + 3)
+                continue
+        pos = find("<", pos + 1)
+
+    if len(result) < len(_DESC_TAGS):
+        for xml_tag, _ in _DESC_TAGS:
+            result.setdefault(xml_tag, "")
+    return result
+
+
+def _xccdf_rule(group, rule_el, stig_ref: str, stig_uuid: str) -> Rule:
+    """Build a blank (Not_Reviewed) Rule from an XCCDF Group/Rule pair."""
+    rule_id = rule_el.attrib.get("id", "")
+    rule = Rule(
+        vuln_num=group.attrib.get("id", ""),
+        severity=rule_el.attrib.get("severity", ""),
+        group_title=_x(_find(group, "title")),
+        rule_id=rule_id,
+        rule_ver=_x(_find(rule_el, "version")),
+        rule_title=_x(_find(rule_el, "title")),
+        fix_text=_x(_find(rule_el, "fixtext")),
+        weight=rule_el.attrib.get("weight", "10.0"),
+        stig_ref=stig_ref,
+        stig_uuid=stig_uuid,
+        # Stable UUIDs derived from the rule id so repeated runs produce the same output
+        uuid=str(uuid.uuid5(uuid.NAMESPACE_DNS, rule_id)),
+    )
+
+    desc = _parse_description(_x(_find(rule_el, "description")))
+    for xml_tag, slot in _DESC_TAGS:
+        rule.set(slot, desc[xml_tag])
+
+    check = _find(rule_el, "check")
+    if check is not None:
+        rule.check_content = _x(_find(check, "check-content"))
+        cref = check.find(f"{{{_NS}}}check-content-ref")
+        if cref is not None:
+            rule.set("check_content_ref", cref.attrib.get("name", "M"))
+            rule.check_content_href = cref.attrib.get("href", "")
+
+    for ident in rule_el.iterfind(f"{{{_NS}}}ident"):
+        system = ident.attrib.get("system", "")
+        val = ident.text or ""
+        if "legacy" in system:
+            rule.legacy_ids.append(val)
+        elif "cci" in system:
+            rule.ccis.append(intern(val))
+    return rule
+
+
+def _xccdf_stig(meta: dict) -> Stig:
+    """Build the Stig for a benchmark's metadata."""
+    # Generate stable UUIDs derived from the benchmark id so repeated runs
+    # produce the same output for the same STIG.
+    return Stig(
+        stig_id=meta["stigid"],
+        title=meta["title"],
+        version=meta["version"],
+        release_info=meta["releaseinfo"],
+        uuid=str(uuid.uuid5(uuid.NAMESPACE_DNS, meta["stigid"])),
+    )
+
+
+def _read_xccdf_stream(source, title: str) -> Checklist:
+    """
+    Stream-parse an XCCDF Benchmark from a path or binary file object.
+    Benchmark metadata precedes the Groups, so each Group is turned into a
+    Rule as soon as it ends and then discarded; the tree is never fully built.
+    """
+    meta = {"stigid": "", "title": "", "version": "", "releaseinfo": ""}
+    stig = None
+    stig_ref = ""
+    root = None
+    depth = 0
+
+    group_tag = f"{{{_NS}}}Group"
+    meta_tags = {f"{{{_NS}}}title": "title", f"{{{_NS}}}version": "version"}
+    release_tag = f"{{{_NS}}}plain-text"
+
+    for event, el in safe_iterparse(source, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if root is None:
+                root = el
+                meta["stigid"] = el.attrib.get("id", "")
+            continue
+        depth -= 1
+
+        if el.tag == group_tag:
+            rule_el = el.find(f"{{{_NS}}}Rule")
+            if rule_el is not None:
+                if stig is None:
+                    stig = _xccdf_stig(meta)
+                    stig_ref = intern(stig.stig_ref)
+                stig.rules.append(_xccdf_rule(el, rule_el, stig_ref, stig.uuid))
+            el.clear()
+            if depth == 1:
+                root.remove(el)
+        elif depth == 1:
+            if el.tag in meta_tags:
+                meta[meta_tags[el.tag]] = _x(el)
+            elif el.tag == release_tag and el.attrib.get("id") == "release-info":
+                meta["releaseinfo"] = _x(el)
+
+    return Checklist(
+        title=title,
+        id=str(uuid.uuid5(uuid.NAMESPACE_DNS, meta["stigid"] + "-cklb")),
+        stigs=[stig or _xccdf_stig(meta)],
+    )
+
+
+def find_xccdf_member(zip_file: zipfile.ZipFile) -> zipfile.ZipInfo:
+    """
+    Locate the XCCDF benchmark inside a DISA STIG package.
+    Members named *-xccdf.xml are candidates, preferring the Manual benchmark;
+    the chosen name passes the same path-traversal checks as extraction.
+    :param zip_file: An open ZipFile
+    :return: The ZipInfo of the benchmark member
+    :raises ValueError: If the archive has no XCCDF member
+    """
+    candidates = [
+        info for info in zip_file.infolist()
+        if not info.is_dir() and info.filename.lower().endswith("-xccdf.xml")
+    ]
+    if not candidates:
+        raise ValueError(f"[X] No *-xccdf.xml benchmark found in {zip_file.filename}")
+    candidates.sort(key=lambda info: ("manual" not in info.filename.lower(), info.filename))
+    member = candidates[0]
+    validate_zip_member(member.filename)
+    return member
+
+
+@contextmanager
+def open_xccdf(xccdf_path):
+    """
+    Open an XCCDF benchmark for parsing, looking inside DISA STIG .zip packages.
+    :param xccdf_path: Path to the XCCDF .xml file or DISA STIG .zip package
+    :return: Context manager yielding (binary file object, checklist title)
+    """
+    if Path(xccdf_path).suffix.lower() == ".zip":
+        with zipfile.ZipFile(xccdf_path) as zip_file:
+            member = find_xccdf_member(zip_file)
+            with zip_file.open(member) as f:
+                yield f, Path(member.filename).stem
+    else:
+        with open(xccdf_path, "rb") as f:
+            yield f, Path(xccdf_path).stem
+
+
+def peek_xccdf(source) -> dict:
+    """
+    Read only the Benchmark header (id, title, version, release info).
+    Parsing stops at the first Group, so this costs a few KB of I/O at most.
+    :param source: Binary file object positioned at the start of the XCCDF
+    :return: Dict with stigid, title, version and releaseinfo
+    """
+    meta = {"stigid": "", "title": "", "version": "", "releaseinfo": ""}
+    meta_tags = {f"{{{_NS}}}title": "title", f"{{{_NS}}}version": "version"}
+    depth = 0
+    for event, el in safe_iterparse(source, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if depth == 1:
+                meta["stigid"] = el.attrib.get("id", "")
+            elif el.tag == f"{{{_NS}}}Group":
+                break
+            continue
+        depth -= 1
+        if depth == 1:
+            if el.tag in meta_tags:
+                meta[meta_tags[el.tag]] = _x(el)
+            elif el.tag == f"{{{_NS}}}plain-text" and el.attrib.get("id") == "release-info":
+                meta["releaseinfo"] = _x(el)
+    return meta
+
+
+def read_xccdf(xccdf_path) -> Checklist:
+    """
+    Read a DISA XCCDF Benchmark into a blank Checklist (every rule Not_Reviewed).
+    A STIG package .zip is read in place: the *-xccdf.xml member is stream-parsed
+    straight out of the archive without extracting anything to disk.
+    :param xccdf_path: Path to the XCCDF .xml file or DISA STIG .zip package
+    :return: Populated Checklist with a single STIG
+    """
+    with open_xccdf(xccdf_path) as (source, title):
+        return _read_xccdf_stream(source, title)
+
+
+# ------------------------------------------------------------------
+# Flat findings (JSON Lines / NDJSON)
+# ------------------------------------------------------------------
+
+def iter_jsonl(jsonl_path):
+    """
+    Stream finding dicts out of a JSON Lines (.jsonl / .ndjson) file, one per line.
+    Blank lines are skipped so a file that is still being appended to can be read.
+    :param jsonl_path: Path to the .jsonl file, or a file object
+    :return: Generator of finding dicts
+    """
+    with _open_source(jsonl_path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                finding = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(
+                    f"[X] Invalid JSON on line {line_number} of {jsonl_path}: {e}"
+                ) from e
+            if not isinstance(finding, dict):
+                raise ValueError(
+                    f"[X] Line {line_number} of {jsonl_path} is not a JSON object"
+                )
+            yield finding
+
+
+def read_findings_json(json_path):
+    """
+    Load a findings JSON document: a list of finding dicts, or a stigviewer dict
+    ({"stig": {"date": ..., "description": ..., "findings": {...}}}).
+    :param json_path: Path to the .json file, or a file object
+    :return: The parsed list or dict
+    :raises ValueError: If the document has neither shape
+    """
+    with _open_source(json_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, list):
+        for index, finding in enumerate(data):
+            if not isinstance(finding, dict):
+                raise ValueError(f"[X] Finding {index} of {json_path} is not a JSON object")
+        return data
+    header = data.get("stig") if isinstance(data, dict) else None
+    if (
+        not isinstance(header, dict)
+        or not {"date", "description", "findings"} <= header.keys()
+        or not isinstance(header["findings"], dict)
+        or not all(isinstance(v, dict) for v in header["findings"].values())
+    ):
+        raise ValueError(
+            f"[X] {json_path} is neither a list of findings nor a stigviewer findings document"
+        )
+    return data
@@ -0,0 +1,217 @@
+# sqlite_store.py
+# Normalized SQLite store for many checklists: assets, stigs, rules and findings
+
+import json
+import sqlite3
+from datetime import datetime
+
+from stig_converter.converters.model import CKL_STIG_DATA, Checklist
+from stig_converter.converters.readers import _ASSET_TAGS
+
+SCHEMA_VERSION = 1
+
+# Rule text lives once per STIG release in `rules`; per-host results go to `findings`.
+# STIGRef/STIG_UUID are left out because they are columns of the rule's stig.
+_RULE_COLUMNS = [
+    (attr, slot) for attr, slot in CKL_STIG_DATA if slot not in ("stig_ref", "stig_uuid")
+] + [
+    ("TargetKey", "target_key"),
+    ("Rule_UUID", "uuid"),
+    ("Check_Content_Href", "check_content_href"),
+]
+
+_FINDING_COLUMNS = [
+    ("STATUS", "status"),
+    ("FINDING_DETAILS", "finding_details"),
+    ("COMMENTS", "comments"),
+    ("SEVERITY_OVERRIDE", "severity_override"),
+    ("SEVERITY_JUSTIFICATION", "severity_justification"),
+]
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS assets (
+    id INTEGER PRIMARY KEY,
+    {", ".join(f"{tag} TEXT NOT NULL" for tag, _ in _ASSET_TAGS)},
+    UNIQUE (HOST_NAME, HOST_IP, HOST_MAC, HOST_FQDN, TARGET_KEY)
+);
+CREATE TABLE IF NOT EXISTS stigs (
+    id INTEGER PRIMARY KEY,
+    stig_id TEXT NOT NULL,
+    version TEXT NOT NULL,
+    release_info TEXT NOT NULL,
+    title TEXT NOT NULL,
+    uuid TEXT NOT NULL,
+    UNIQUE (stig_id, version, release_info)
+);
+CREATE TABLE IF NOT EXISTS rules (
+    id INTEGER PRIMARY KEY,
+    stig INTEGER NOT NULL REFERENCES stigs (id),
+    {", ".join(f"{attr} TEXT NOT NULL" for attr, _ in _RULE_COLUMNS)},
+    LEGACY_IDS TEXT NOT NULL,
+    CCIS TEXT NOT NULL,
+    UNIQUE (stig, Rule_ID, Vuln_Num)
+);
+CREATE TABLE IF NOT EXISTS checklists (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL UNIQUE,
+    sha256 TEXT NOT NULL,
+    title TEXT NOT NULL,
+    checklist_id TEXT NOT NULL,
+    asset INTEGER NOT NULL REFERENCES assets (id),
+    ingested TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS findings (
+    checklist INTEGER NOT NULL REFERENCES checklists (id) ON DELETE CASCADE,
+    rule INTEGER NOT NULL REFERENCES rules (id),
+    {", ".join(f"{col} TEXT NOT NULL" for col, _ in _FINDING_COLUMNS)},
+    PRIMARY KEY (checklist, rule)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_rules_vuln_num ON rules (Vuln_Num);
+CREATE INDEX IF NOT EXISTS idx_rules_rule_id ON rules (Rule_ID);
+CREATE INDEX IF NOT EXISTS idx_findings_rule_status ON findings (rule, STATUS);
+CREATE INDEX IF NOT EXISTS idx_findings_status ON findings (STATUS);
+CREATE INDEX IF NOT EXISTS idx_assets_host_name ON assets (HOST_NAME);
+CREATE INDEX IF NOT EXISTS idx_checklists_asset ON checklists (asset);
+CREATE VIEW IF NOT EXISTS fleet_findings AS
+SELECT assets.HOST_NAME, assets.HOST_IP, stigs.stig_id, stigs.version, stigs.release_info,
+       rules.Vuln_Num, rules.Severity, rules.Rule_ID, rules.Rule_Ver, rules.Rule_Title,
+       findings.STATUS, findings.FINDING_DETAILS, findings.COMMENTS, checklists.source
+FROM findings
+JOIN checklists ON checklists.id = findings.checklist
+JOIN assets ON assets.id = checklists.asset
+JOIN rules ON rules.id = findings.rule
+JOIN stigs ON stigs.id = rules.stig;
+PRAGMA user_version = {SCHEMA_VERSION};
+"""
+
+# ON CONFLICT rather than OR IGNORE: OR IGNORE would also swallow NOT NULL violations
+_INSERT_RULE = (
+    f"INSERT INTO rules (stig, {', '.join(attr for attr, _ in _RULE_COLUMNS)}, LEGACY_IDS, CCIS) "
+    f"VALUES (?, {', '.join('?' for _ in _RULE_COLUMNS)}, ?, ?) "
+    "ON CONFLICT (stig, Rule_ID, Vuln_Num) DO NOTHING"
+)
+_INSERT_FINDING = (
+    f"INSERT OR REPLACE INTO findings "
+    f"(checklist, rule, {', '.join(col for col, _ in _FINDING_COLUMNS)}) "
+    f"VALUES (?, ?, {', '.join('?' for _ in _FINDING_COLUMNS)})"
+)
+_ASSET_NAMES = ", ".join(tag for tag, _ in _ASSET_TAGS)
+_INSERT_ASSET = (
+    f"INSERT INTO assets ({_ASSET_NAMES}) VALUES ({', '.join('?' for _ in _ASSET_TAGS)}) "
+    f"ON CONFLICT (HOST_NAME, HOST_IP, HOST_MAC, HOST_FQDN, TARGET_KEY) DO UPDATE SET "
+    + ", ".join(f"{tag} = excluded.{tag}" for tag, _ in _ASSET_TAGS)
+)
+
+
+def open_database(path) -> sqlite3.Connection:
+    """
+    Open (creating if needed) a checklist database and make sure the schema exists.
+    The connection is tuned for bulk loading: WAL journal, relaxed fsync.
+    """
+    conn = sqlite3.connect(str(path))
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version not in (0, SCHEMA_VERSION):
+        conn.close()
+        raise ValueError(f"{path} has schema version {version}; expected {SCHEMA_VERSION}")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def analyze(conn: sqlite3.Connection) -> None:
+    """
+    Refresh the query planner's statistics after a load. Without them SQLite may
+    scan findings by STATUS instead of looking the rule up by Vuln_Num first.
+    The sample is capped, so this stays fast on databases of millions of findings.
+    """
+    conn.execute("PRAGMA analysis_limit = 1000")
+    conn.execute("ANALYZE")
+    conn.commit()
+
+
+def ingested_hash(conn: sqlite3.Connection, source: str):
+    """SHA-256 recorded for a source when it was last ingested, or None."""
+    row = conn.execute("SELECT sha256 FROM checklists WHERE source = ?", (source,)).fetchone()
+    return row[0] if row else None
+
+
+def _text(value) -> str:
+    """Column value for a model field; a CKLB may carry null where a CKL has an empty element."""
+    return "" if value is None else value
+
+
+def _asset_id(conn, asset) -> int:
+    values = [_text(getattr(asset, slot)) for _, slot in _ASSET_TAGS]
+    conn.execute(_INSERT_ASSET, values)
+    return conn.execute(
+        "SELECT id FROM assets WHERE HOST_NAME = ? AND HOST_IP = ? AND HOST_MAC = ? "
+        "AND HOST_FQDN = ? AND TARGET_KEY = ?",
+        [_text(value) for value in (
+            asset.host_name, asset.host_ip, asset.host_mac, asset.host_fqdn, asset.target_key
+        )],
+    ).fetchone()[0]
+
+
+def _stig_id(conn, stig) -> int:
+    key = (_text(stig.stig_id), _text(stig.version), _text(stig.release_info))
+    conn.execute(
+        "INSERT INTO stigs (stig_id, version, release_info, title, uuid) VALUES (?, ?, ?, ?, ?) "
+        "ON CONFLICT (stig_id, version, release_info) DO NOTHING",
+        (*key, _text(stig.title), _text(stig.uuid)),
+    )
+    return conn.execute(
+        "SELECT id FROM stigs WHERE stig_id = ? AND version = ? AND release_info = ?", key
+    ).fetchone()[0]
+
+
+def _rule_ids(conn, stig_pk: int, rules) -> dict:
+    """
+    Insert the rule definitions of one STIG release (once per fleet).
+    :return: {(Rule_ID, Vuln_Num): id}
+    """
+    conn.executemany(_INSERT_RULE, (
+        (stig_pk, *(_text(getattr(rule, slot)) for _, slot in _RULE_COLUMNS),
+         json.dumps(rule.legacy_ids or []), json.dumps(rule.ccis or []))
+        for rule in rules
+    ))
+    return {
+        (rule_id, vuln_num): pk
+        for pk, rule_id, vuln_num in conn.execute(
+            "SELECT id, Rule_ID, Vuln_Num FROM rules WHERE stig = ?", (stig_pk,)
+        )
+    }
+
+
+def write_sqlite(
+    checklist: Checklist, conn: sqlite3.Connection, source: str, sha256: str = ""
+) -> int:
+    """
+    Insert (or replace) one checklist. Rule text is shared by every checklist of the same
+    STIG release, so each host adds only its asset row and one narrow row per finding.
+    Runs inside the caller's transaction; commit to make it visible.
+    :param source: Key of the checklist in the database, normally its file path;
+        a checklist already stored under it is replaced
+    :param sha256: Content hash of the source file, used to skip unchanged re-ingests
+    :return: Number of findings written
+    """
+    conn.execute("DELETE FROM checklists WHERE source = ?", (source,))
+    asset_pk = _asset_id(conn, checklist.asset)
+    checklist_pk = conn.execute(
+        "INSERT INTO checklists (source, sha256, title, checklist_id, asset, ingested) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        (source, sha256, _text(checklist.title), _text(checklist.id), asset_pk,
+         datetime.now().isoformat(timespec="seconds")),
+    ).lastrowid
+
+    written = 0
+    for stig in checklist.stigs:
+        rule_ids = _rule_ids(conn, _stig_id(conn, stig), stig.rules)
+        conn.executemany(_INSERT_FINDING, (
+            (checklist_pk, rule_ids[_text(rule.rule_id), _text(rule.vuln_num)],
+             *(_text(getattr(rule, slot)) for _, slot in _FINDING_COLUMNS))
+            for rule in stig.rules
+        ))
+        written += len(stig.rules)
+    return written
@@ -0,0 +1,364 @@
+# writers.py
+# Writers that serialize the shared checklist model to each supported output format
+
+import csv
+import json
+import uuid
+
+from stig_converter.converters.model import CKL_STIG_DATA, CKL_TO_CKLB_STATUS, Checklist
+
+# Column order of the flat findings CSV
+FINDING_FIELDS = [
+    "DATE",
+    "HOST_NAME",
+    "HOST_IP",
+    "Vuln_Num",
+    "Severity",
+    "Group_Title",
+    "Rule_ID",
+    "Rule_Ver",
+    "Rule_Title",
+    "Fix_Text",
+    "STATUS",
+    "FINDING_DETAILS",
+    "COMMENTS",
+]
+
+
+def iter_findings(checklist: Checklist, date: str):
+    """Yield the flat findings dict for every rule in a checklist."""
+    for rule in checklist.rules():
+        yield rule.to_finding(checklist.asset, date)
+
+
+# ------------------------------------------------------------------
+# Flat findings (CSV / JSON)
+# ------------------------------------------------------------------
+
+def write_findings_csv(findings, fp) -> int:
+    """
+    Write an iterable of finding dicts as CSV rows, one at a time.
+    :param fp: Text file opened with newline=""
+    :return: Number of rows written
+    """
+    writer = csv.DictWriter(fp, fieldnames=FINDING_FIELDS)
+    writer.writeheader()
+    count = 0
+    for finding in findings:
+        writer.writerow(finding)
+        count += 1
+    return count
+
+
+def write_findings_json(findings, fp, indent: int = 4) -> int:
+    """
+    Write an iterable of dicts as a JSON array, one item at a time.
+    Output is identical to json.dump(list(items), fp, indent=indent) without
+    materializing the list.
+    :return: Number of items written
+    """
+    pad = " " * indent
+    count = 0
+    fp.write("[")
+    for item in findings:
+        fp.write(",\n" + pad if count else "\n" + pad)
+        fp.write(json.dumps(item, indent=indent).replace("\n", "\n" + pad))
+        count += 1
+    fp.write("\n]" if count else "]")
+    return count
+
+
+def write_findings_jsonl(findings, fp) -> int:
+    """
+    Write an iterable of dicts as JSON Lines: one compact JSON object per line.
+    Each line is complete when written, so the output can be tailed while it grows.
+    :param fp: Text file opened for writing
+    :return: Number of lines written
+    """
+    count = 0
+    for finding in findings:
+        fp.write(json.dumps(finding, ensure_ascii=False) + "\n")
+        count += 1
+    return count
+
+
+# ------------------------------------------------------------------
+# CKLB (STIG Viewer 3 JSON checklist)
+# ------------------------------------------------------------------
+
+def _cklb_overrides(rule) -> dict:
+    """Severity override in the shape read_cklb reads it back from."""
+    if not rule.severity_override:
+        return {}
+    return {"severity": rule.severity_override, "justification": rule.severity_justification}
+
+
+def _cklb_rule(rule) -> dict:
+    """Build a CKLB rule dict from a Rule."""
+    return {
+        "group_id_src": rule.vuln_num,
+        "group_tree": [
+            {
+                "id": rule.vuln_num,
+                "title": rule.group_title,
+                "description": "<GroupDescription></GroupDescription>",
+            }
+        ],
+        "group_id": rule.vuln_num,
+        "severity": rule.severity,
+        "group_title": rule.rule_title,
+        "rule_id_src": rule.rule_id,
+        # Rule_ID in CKL is stored as "SV-xxxxxxx_rule"; strip the suffix for rule_id
+        "rule_id": rule.rule_id.removesuffix("_rule"),
+        "rule_version": rule.rule_ver,
+        "rule_title": rule.rule_title,
+        "fix_text": rule.fix_text,
+        "weight": rule.weight,
+        "check_content": rule.check_content,
+        "check_content_ref": {"name": rule.check_content_ref, "href": rule.check_content_href},
+        "classification": rule.classification,
+        "discussion": rule.vuln_discuss,
+        "false_positives": rule.false_positives,
+        "false_negatives": rule.false_negatives,
+        "documentable": rule.documentable,
+        "security_override_guidance": rule.security_override_guidance,
+        "potential_impacts": rule.potential_impact,
+        "third_party_tools": rule.third_party_tools,
+        "ia_controls": rule.ia_controls,
+        "responsibility": rule.responsibility,
+        "mitigations": rule.mitigations,
+        "mitigation_control": rule.mitigation_control,
+        "legacy_ids": rule.legacy_ids,
+        "ccis": rule.ccis,
+        "reference_identifier": rule.target_key,
+        "uuid": rule.uuid or str(uuid.uuid4()),
+        "stig_uuid": rule.stig_uuid,
+        "status": CKL_TO_CKLB_STATUS.get(rule.status, "not_reviewed"),
+        "overrides": _cklb_overrides(rule),
+        "comments": rule.comments,
+        "finding_details": rule.finding_details,
+        "srg_id": rule.group_title,
+    }
+
+
+def _cklb_target(asset) -> dict:
+    """Build the CKLB target_data dict from an Asset."""
+    return {
+        "target_type": asset.asset_type,
+        "host_name": asset.host_name,
+        "ip_address": asset.host_ip,
+        "mac_address": asset.host_mac,
+        "fqdn": asset.host_fqdn,
+        "comments": asset.target_comment,
+        "role": asset.role,
+        "is_web_database": asset.web_or_database.lower() == "true",
+        "technology_area": asset.tech_area,
+        "web_db_site": asset.web_db_site,
+        "web_db_instance": asset.web_db_instance,
+        "classification": None,
+    }
+
+
+def _cklb_stig(stig, rules) -> dict:
+    """Build a CKLB stigs entry around an already built rules value."""
+    return {
+        "stig_name": stig.title,
+        "display_name": stig.title,
+        "stig_id": stig.stig_id,
+        "release_info": stig.release_info,
+        "version": stig.version,
+        "uuid": stig.uuid or str(uuid.uuid4()),
+        "reference_identifier": "",
+        "size": len(stig.rules),
+        "rules": rules,
+    }
+
+
+def cklb_document(checklist: Checklist, stigs=None) -> dict:
+    """
+    Build the CKLB (JSON) document for a Checklist.
+    :param stigs: Value used for "stigs" instead of the fully built list
+    """
+    if stigs is None:
+        stigs = [_cklb_stig(stig, [_cklb_rule(r) for r in stig.rules]) for stig in checklist.stigs]
+
+    return {
+        "title": checklist.title,
+        "id": checklist.id or str(uuid.uuid4()),
+        "stigs": stigs,
+        "active": False,
+        "mode": 1,
+        "has_path": True,
+        "target_data": _cklb_target(checklist.asset),
+        "cklb_version": "1.0",
+    }
+
+
+# Stands in for a list while its enclosing object is serialized
+_CKLB_LIST_MARKER = json.dumps("\ue000list\ue001")
+
+
+def _split_at_list(value: dict, pad: str):
+    """Serialize value at indent=2 re-indented by pad, split around its marker list."""
+    return json.dumps(value, indent=2).replace("\n", "\n" + pad).split(_CKLB_LIST_MARKER)
+
+
+def write_cklb(checklist: Checklist, fp) -> None:
+    """
+    Write a Checklist as CKLB (JSON), one rule at a time.
+    Output is identical to json.dump(cklb_document(checklist), fp, indent=2)
+    without holding every rule dict in memory, so stig.rules may be any
+    sized iterable.
+    :param fp: Text file opened for writing
+    """
+    marker = json.loads(_CKLB_LIST_MARKER)
+    head, tail = _split_at_list(cklb_document(checklist, stigs=marker), "")
+    fp.write(head)
+    if not checklist.stigs:
+        fp.write("[]")
+    for count, stig in enumerate(checklist.stigs):
+        fp.write(",\n    " if count else "[\n    ")
+        stig_head, stig_tail = _split_at_list(_cklb_stig(stig, marker), "    ")
+        fp.write(stig_head)
+        written = 0
+        for rule in stig.rules:
+            fp.write(",\n        " if written else "[\n        ")
+            fp.write(json.dumps(_cklb_rule(rule), indent=2).replace("\n", "\n        "))
+            written += 1
+        fp.write("\n      ]" if written else "[]")
+        fp.write(stig_tail)
+    if checklist.stigs:
+        fp.write("\n  ]")
+    fp.write(tail)
+
+
+# ------------------------------------------------------------------
+# CKL (STIG Viewer XML checklist)
+# ------------------------------------------------------------------
+
+# Emitted verbatim so the output stays identical to the former ET.indent + ElementTree.write
+_CKL_DECLARATION = "<?xml version='1.0' encoding='UTF-8'?>\n"
+
+
+def _escape(text: str) -> str:
+    """Escape element text the same way ElementTree serializes it."""
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+
+def _leaf(indent: str, tag: str, text) -> str:
+    """Return one tab-indented text element line; empty text is written as <TAG />."""
+    if text:
+        return f"{indent}<{tag}>{_escape(text)}</{tag}>\n"
+    return f"{indent}<{tag} />\n"
+
+
+def _ckl_asset(asset) -> str:
+    return "".join([
+        "\t<ASSET>\n",
+        _leaf("\t\t", "ROLE", asset.role),
+        _leaf("\t\t", "ASSET_TYPE", asset.asset_type),
+        _leaf("\t\t", "HOST_NAME", asset.host_name),
+        _leaf("\t\t", "HOST_IP", asset.host_ip),
+        _leaf("\t\t", "HOST_MAC", asset.host_mac),
+        _leaf("\t\t", "HOST_FQDN", asset.host_fqdn),
+        _leaf("\t\t", "TARGET_COMMENT", asset.target_comment),
+        _leaf("\t\t", "TECH_AREA", asset.tech_area),
+        _leaf("\t\t", "TARGET_KEY", asset.target_key),
+        _leaf("\t\t", "WEB_OR_DATABASE", asset.web_or_database),
+        _leaf("\t\t", "WEB_DB_SITE", asset.web_db_site),
+        _leaf("\t\t", "WEB_DB_INSTANCE", asset.web_db_instance),
+        "\t</ASSET>\n",
+    ])
+
+
+def _ckl_stig_info(stig) -> str:
+    fields = [
+        ("version",        stig.version),
+        ("classification", "UNCLASSIFIED"),
+        ("customname",     ""),
+        ("stigid",         stig.stig_id),
+        ("description",    ""),
+        ("releaseinfo",    stig.release_info),
+        ("title",          stig.title),
+        ("uuid",           stig.uuid),
+        ("notice",         "terms-of-use"),
+        ("source",         "Unknown"),
+    ]
+    parts = ["\t\t\t<STIG_INFO>\n"]
+    for sid_name, sid_data in fields:
+        parts.append("\t\t\t\t<SI_DATA>\n")
+        parts.append(_leaf("\t\t\t\t\t", "SID_NAME", sid_name))
+        parts.append(_leaf("\t\t\t\t\t", "SID_DATA", sid_data))
+        parts.append("\t\t\t\t</SI_DATA>\n")
+    parts.append("\t\t\t</STIG_INFO>\n")
+    return "".join(parts)
+
+
+def _ckl_stig_data(parts: list, attr_name: str, attr_data) -> None:
+    """Append the lines of one STIG_DATA block to parts."""
+    parts.append("\t\t\t\t<STIG_DATA>\n")
+    parts.append(_leaf("\t\t\t\t\t", "VULN_ATTRIBUTE", attr_name))
+    parts.append(_leaf("\t\t\t\t\t", "ATTRIBUTE_DATA", attr_data))
+    parts.append("\t\t\t\t</STIG_DATA>\n")
+
+
+def _ckl_vuln(rule) -> str:
+    """Serialize one Rule as an indented VULN element."""
+    parts = ["\t\t\t<VULN>\n"]
+    for attr_name, slot in CKL_STIG_DATA:
+        _ckl_stig_data(parts, attr_name, getattr(rule, slot))
+    for legacy_id in rule.legacy_ids:
+        _ckl_stig_data(parts, "LEGACY_ID", legacy_id)
+    for cci in rule.ccis:
+        _ckl_stig_data(parts, "CCI_REF", cci)
+
+    parts.append(_leaf("\t\t\t\t", "STATUS", rule.status))
+    parts.append(_leaf("\t\t\t\t", "FINDING_DETAILS", rule.finding_details))
+    parts.append(_leaf("\t\t\t\t", "COMMENTS", rule.comments))
+    parts.append(_leaf("\t\t\t\t", "SEVERITY_OVERRIDE", rule.severity_override))
+    parts.append(_leaf("\t\t\t\t", "SEVERITY_JUSTIFICATION", rule.severity_justification))
+    parts.append("\t\t\t</VULN>\n")
+    return "".join(parts)
+
+
+def _encode(text: str) -> bytes:
+    return text.encode("utf-8", "xmlcharrefreplace")
+
+
+def ckl_asset_bytes(asset) -> bytes:
+    """The encoded document head up to and including the ASSET block."""
+    return _encode(_CKL_DECLARATION + "<CHECKLIST>\n" + _ckl_asset(asset))
+
+
+def iter_ckl_stigs_bytes(checklist: Checklist):
+    """Yield the encoded remainder of the document after ASSET, one VULN at a time."""
+    if not checklist.stigs:
+        yield b"\t<STIGS />\n</CHECKLIST>"
+        return
+
+    yield b"\t<STIGS>\n"
+    for stig in checklist.stigs:
+        yield _encode("\t\t<iSTIG>\n" + _ckl_stig_info(stig))
+        for rule in stig.rules:
+            yield _encode(_ckl_vuln(rule))
+        yield b"\t\t</iSTIG>\n"
+    yield b"\t</STIGS>\n</CHECKLIST>"
+
+
+def write_ckl(checklist: Checklist, fp) -> None:
+    """
+    Write a Checklist as a STIG Viewer CKL (XML), one VULN at a time.
+    Output is byte-for-byte what ET.indent(space="\\t") followed by
+    ElementTree.write(encoding="UTF-8", xml_declaration=True) produced,
+    without building the element tree.
+    :param fp: Binary file opened for writing
+    """
+    fp.write(ckl_asset_bytes(checklist.asset))
+    for chunk in iter_ckl_stigs_bytes(checklist):
+        fp.write(chunk)
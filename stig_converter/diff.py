@@ -0,0 +1,377 @@
+# diff.py
+# Compare two checklists (or findings files) rule by rule
+
+import csv
+import hashlib
+import json
+import sys
+from pathlib import Path
+from sys import intern
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Inputs a diff can read; findings formats carry the same columns as the CSV output
+DIFF_INPUTS = ("ckl", "cklb", "xml", "zip", "csv", "json", "jsonl", "ndjson")
+
+# Report formats, chosen by the output suffix
+DIFF_OUTPUTS = ("json", "csv", "md")
+
+# Compared per rule, in the order they are listed in a change
+_COMPARED = ("Rule_ID", "Severity", "STATUS", "FINDING_DETAILS", "COMMENTS")
+
+DIFF_FIELDS = [
+    "Change",
+    "Changed_Fields",
+    "Vuln_Num",
+    "Rule_ID",
+    "Severity",
+    "Rule_Title",
+    "Old_STATUS",
+    "New_STATUS",
+    "Old_FINDING_DETAILS",
+    "New_FINDING_DETAILS",
+    "Old_COMMENTS",
+    "New_COMMENTS",
+]
+
+
+class _Record(NamedTuple):
+    vuln_num: str
+    rule_id: str
+    severity: str
+    rule_title: str
+    status: str
+    details: str
+    comments: str
+
+    @property
+    def key(self) -> str:
+        return self.vuln_num or self.rule_id
+
+
+class RuleChange(NamedTuple):
+    """One rule that was added, removed or changed between the two sides."""
+
+    change: str  # "added", "removed" or "changed"
+    fields: Tuple[str, ...]  # compared fields that differ, for "changed"
+    vuln_num: str
+    rule_id: str
+    severity: str
+    rule_title: str
+    old_status: str
+    new_status: str
+    old_details: str
+    new_details: str
+    old_comments: str
+    new_comments: str
+
+    def as_dict(self) -> dict:
+        return dict(zip(DIFF_FIELDS, (self.change, ";".join(self.fields), *self[2:])))
+
+
+class ChecklistDiff(NamedTuple):
+    """Result of diff_checklists."""
+
+    old: str
+    new: str
+    old_rules: int
+    new_rules: int
+    unchanged: int
+    transitions: Dict[Tuple[str, str], int]  # (old STATUS, new STATUS) → rules
+    changes: List[RuleChange]
+
+    def counts(self) -> Dict[str, int]:
+        counts = {"added": 0, "removed": 0, "changed": 0}
+        for change in self.changes:
+            counts[change.change] += 1
+        counts["unchanged"] = self.unchanged
+        return counts
+
+
+def _from_rule(rule) -> _Record:
+    return _Record(
+        rule.vuln_num, rule.rule_id, rule.severity, rule.rule_title,
+        rule.status, rule.finding_details, rule.comments,
+    )
+
+
+def _from_finding(finding: dict) -> _Record:
+    return _Record(
+        finding.get("Vuln_Num") or "",
+        finding.get("Rule_ID") or "",
+        intern(finding.get("Severity") or ""),
+        finding.get("Rule_Title") or "",
+        intern(finding.get("STATUS") or ""),
+        finding.get("FINDING_DETAILS") or "",
+        finding.get("COMMENTS") or "",
+    )
+
+
+def iter_records(path):
+    """
+    Stream the comparable fields of every rule in a checklist or findings file.
+    CKL, CSV and JSONL are read incrementally; CKLB and JSON are single documents.
+    :raises ValueError: If a rule has neither a Vuln_Num nor a Rule_ID to match it on
+    """
+    for number, record in enumerate(_iter_records(path), 1):
+        if not record.key:
+            raise ValueError(
+                f"[X] Rule {number} of {path} has neither a Vuln_Num nor a Rule_ID; findings "
+                "files must use the ckl_to_csv / ckl_to_json columns"
+            )
+        yield record
+
+
+def _duplicate(key: str, path) -> ValueError:
+    return ValueError(f"[X] {key} appears more than once in {path}; rules cannot be matched")
+
+
+def _iter_records(path):
+    from stig_converter.converters.readers import iter_ckl, iter_jsonl, read_cklb
+
+    path = Path(path)
+    ext = path.suffix[1:].lower()
+    if ext == "ckl":
+        for _, rule in iter_ckl(path):
+            yield _from_rule(rule)
+    elif ext == "cklb":
+        for rule in read_cklb(path).rules():
+            yield _from_rule(rule)
+    elif ext in ("xml", "zip"):
+        from stig_converter.converters.benchmark_cache import load_benchmark
+        for rule in load_benchmark(path).rules():
+            yield _from_rule(rule)
+    elif ext == "csv":
+        with open(path, newline="", encoding="utf-8") as f:
+            for finding in csv.DictReader(f):
+                yield _from_finding(finding)
+    elif ext in ("jsonl", "ndjson"):
+        for finding in iter_jsonl(path):
+            yield _from_finding(finding)
+    elif ext == "json":
+        with open(path, encoding="utf-8") as f:
+            findings = json.load(f)
+        if not isinstance(findings, list):
+            raise ValueError(f"[X] {path} is not a list of findings (ckl_to_json format)")
+        for finding in findings:
+            yield _from_finding(finding)
+    else:
+        raise ValueError(f"Cannot diff '{ext}' files. Supported: {', '.join(DIFF_INPUTS)}")
+
+
+def _digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def _changed_fields(old: tuple, new: _Record) -> Tuple[str, ...]:
+    rule_id, severity, status, details, comments = old
+    return tuple(name for name, differs in zip(_COMPARED, (
+        rule_id != new.rule_id,
+        severity != new.severity,
+        status != new.status,
+        details != _digest(new.details),
+        comments != _digest(new.comments),
+    )) if differs)
+
+
+def diff_checklists(old_path, new_path) -> ChecklistDiff:
+    """
+    Compare two checklists rule by rule, keyed on Vuln_Num (Rule_ID when a finding has none).
+
+    The old side is indexed with only its short fields and a 16-byte digest of
+    FINDING_DETAILS and COMMENTS per rule; the new side is streamed against that
+    index. The full text of removed rules and of changed details/comments is then
+    fetched in a second streaming pass over the old side, so memory grows with
+    the number of rules and changes, never with the size of the text.
+    :param old_path: Earlier checklist or findings file (any of DIFF_INPUTS)
+    :param new_path: Later checklist or findings file
+    :return: ChecklistDiff with changes in new-file order, removed rules last
+    :raises ValueError: If a rule has no key, or a key appears twice on either side
+    """
+    index = {}
+    old_rules = 0
+    for record in iter_records(old_path):
+        if record.key in index:
+            raise _duplicate(record.key, old_path)
+        index[record.key] = (
+            record.rule_id, record.severity, record.status,
+            _digest(record.details), _digest(record.comments),
+        )
+        old_rules += 1
+
+    pending = []  # (fields, old index entry, new record) in new-file order
+    transitions: Dict[Tuple[str, str], int] = {}
+    new_rules = unchanged = 0
+    seen = set()
+    for record in iter_records(new_path):
+        if record.key in seen:
+            raise _duplicate(record.key, new_path)
+        seen.add(record.key)
+        new_rules += 1
+        old = index.pop(record.key, None)
+        if old is None:
+            pending.append(((), None, record))
+            continue
+        fields = _changed_fields(old, record)
+        if not fields:
+            unchanged += 1
+            continue
+        if "STATUS" in fields:
+            transition = (old[2], record.status)
+            transitions[transition] = transitions.get(transition, 0) + 1
+        pending.append((fields, old, record))
+
+    # Second pass: the old text of every rule that is reported with it
+    wanted = set(index)
+    wanted.update(
+        record.key for fields, _, record in pending
+        if "FINDING_DETAILS" in fields or "COMMENTS" in fields
+    )
+    old_text = {}
+    if wanted:
+        for record in iter_records(old_path):
+            if record.key in wanted:
+                old_text[record.key] = record
+
+    changes = []
+    for fields, old, new in pending:
+        if old is None:
+            changes.append(RuleChange(
+                "added", (), new.vuln_num, new.rule_id, new.severity, new.rule_title,
+                "", new.status, "", new.details, "", new.comments,
+            ))
+            continue
+        previous = old_text.get(new.key)
+        changes.append(RuleChange(
+            "changed", fields, new.vuln_num, new.rule_id, new.severity, new.rule_title,
+            old[2], new.status,
+            previous.details if previous else new.details, new.details,
+            previous.comments if previous else new.comments, new.comments,
+        ))
+    for key in index:
+        old = old_text[key]
+        changes.append(RuleChange(
+            "removed", (), old.vuln_num, old.rule_id, old.severity, old.rule_title,
+            old.status, "", old.details, "", old.comments, "",
+        ))
+
+    return ChecklistDiff(
+        str(old_path), str(new_path), old_rules, new_rules, unchanged, transitions, changes
+    )
+
+
+# ------------------------------------------------------------------
+# Reports
+# ------------------------------------------------------------------
+
+def write_diff_json(diff: ChecklistDiff, fp) -> None:
+    json.dump({
+        "old": diff.old,
+        "new": diff.new,
+        "old_rules": diff.old_rules,
+        "new_rules": diff.new_rules,
+        "summary": diff.counts(),
+        "transitions": [
+            {"from": old, "to": new, "count": n}
+            for (old, new), n in sorted(diff.transitions.items())
+        ],
+        "changes": [change.as_dict() for change in diff.changes],
+    }, fp, indent=4)
+    fp.write("\n")
+
+
+def write_diff_csv(diff: ChecklistDiff, fp) -> None:
+    writer = csv.DictWriter(fp, fieldnames=DIFF_FIELDS)
+    writer.writeheader()
+    writer.writerows(change.as_dict() for change in diff.changes)
+
+
+def _cell(text: str) -> str:
+    """Make text safe for a single Markdown table cell."""
+    return " ".join(text.split()).replace("|", "\\|")
+
+
+def write_diff_md(diff: ChecklistDiff, fp) -> None:
+    fp.write("# STIG Checklist Diff\n\n")
+    fp.write(f"**Old:** {diff.old} ({diff.old_rules} rules)\n\n")
+    fp.write(f"**New:** {diff.new} ({diff.new_rules} rules)\n\n")
+
+    fp.write("## Summary\n\n")
+    fp.write("| Change | Rules |\n")
+    fp.write("|:---|:---:|\n")
+    for change, n in diff.counts().items():
+        fp.write(f"| {change.capitalize()} | {n} |\n")
+    fp.write("\n")
+
+    if diff.transitions:
+        fp.write("## Status Transitions\n\n")
+        fp.write("| From | To | Rules |\n")
+        fp.write("|:---|:---|:---:|\n")
+        for (old, new), n in sorted(diff.transitions.items(), key=lambda item: -item[1]):
+            fp.write(f"| {old} | {new} | {n} |\n")
+        fp.write("\n")
+
+    for kind, heading in (
+        ("changed", "Changed Rules"),
+        ("added", "New Rules"),
+        ("removed", "Removed Rules"),
+    ):
+        changes = [c for c in diff.changes if c.change == kind]
+        if not changes:
+            continue
+        fp.write(f"## {heading}\n\n")
+        fp.write(
+            "| Vuln_Num | Rule_ID | Severity | Rule_Title | Old STATUS | New STATUS | Changed |\n"
+        )
+        fp.write("|:---|:---|:---:|:---|:---|:---|:---|\n")
+        for c in changes:
+            fp.write(
+                f"| {c.vuln_num} | {c.rule_id} | {c.severity} | {_cell(c.rule_title)} "
+                f"| {c.old_status} | {c.new_status} | {', '.join(c.fields)} |\n"
+            )
+        fp.write("\n")
+        for c in changes:
+            for field, old, new in (
+                ("FINDING_DETAILS", c.old_details, c.new_details),
+                ("COMMENTS", c.old_comments, c.new_comments),
+            ):
+                if field in c.fields:
+                    fp.write(f"### {c.vuln_num}: {field}\n\n**Old:**\n\n{old or '_(empty)_'}\n\n")
+                    fp.write(f"**New:**\n\n{new or '_(empty)_'}\n\n")
+
+
+_WRITERS = {"json": write_diff_json, "csv": write_diff_csv, "md": write_diff_md}
+
+
+def diff(old_path, new_path, output_path: Optional[Path] = None) -> ChecklistDiff:
+    """
+    Diff two checklists and write the report.
+    :param output_path: .json, .csv or .md report; the Markdown report goes to stdout when omitted
+    :return: The ChecklistDiff
+    """
+    from stig_converter.security_utils import get_default_allowed_dirs, validate_output_path
+
+    for path in (old_path, new_path):
+        if not Path(path).is_file():
+            raise FileNotFoundError(f"[X] Input file does not exist: {path}")
+    if output_path is not None:
+        output_ext = Path(output_path).suffix[1:].lower()
+        if output_ext not in _WRITERS:
+            raise ValueError(
+                f"Unsupported report type '{output_ext}'. Supported: {', '.join(DIFF_OUTPUTS)}"
+            )
+        output_path = validate_output_path(output_path, allowed_dirs=get_default_allowed_dirs())
+
+    result = diff_checklists(old_path, new_path)
+
+    if output_path is None:
+        write_diff_md(result, sys.stdout)
+        return result
+    with open(output_path, "w", newline="" if output_ext == "csv" else None, encoding="utf-8") as f:
+        _WRITERS[output_ext](result, f)
+    counts = result.counts()
+    print(
+        f"[*] {counts['changed']} changed, {counts['added']} added, {counts['removed']} removed, "
+        f"{counts['unchanged']} unchanged"
+    )
+    print(f"[*] Diff report created: {output_path}")
+    return result
@@ -0,0 +1,207 @@
+# fetch_many.py
+# Download many STIG packages concurrently over one pooled async HTTP client
+
+import asyncio
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+import httpx
+
+from stig_converter.get_new_stigs import (
+    _CHUNK_SIZE,
+    DISA_BASE_URL,
+    MAX_DOWNLOAD_BYTES,
+    STIGVIEWER_BASE_URL,
+    _conditional_headers,
+    _json_url,
+    _PartialDownload,
+    _save_meta,
+    _zip_url,
+)
+from stig_converter.security_utils import get_default_allowed_dirs, validate_file_path
+
+
+class FetchItem(NamedTuple):
+    """One download: a DISA package (.zip) or a stigviewer.com checklist (.json)."""
+
+    kind: str
+    name: str
+    url: str
+
+
+class FetchResult(NamedTuple):
+    """Outcome of a single download in a manifest fetch."""
+
+    item: FetchItem
+    path: Optional[Path]
+    status: str  # "downloaded", "not modified" or "failed"
+    error: str
+    bytes: int
+    seconds: float
+
+
+def manifest_items(
+    entries,
+    disa_base_url: str = DISA_BASE_URL,
+    stigviewer_base_url: str = STIGVIEWER_BASE_URL,
+) -> List[FetchItem]:
+    """
+    Turn manifest entries into FetchItems. Each entry is one of:
+        {"stig_sys": "ASD", "stig_ver": "V6R4"}            → U_ASD_V6R4_STIG.zip
+        {"slug": "application_security_and_development"}
+            → application_security_and_development.json
+    An optional "output" key overrides the file name written to the output directory.
+    :param entries: Iterable of manifest entry dicts
+    :param disa_base_url: Base URL for DISA packages
+    :param stigviewer_base_url: Base URL for stigviewer.com checklists
+    :return: FetchItems in manifest order
+    """
+    items = []
+    for entry in entries:
+        if "slug" in entry:
+            url = _json_url(entry["slug"], stigviewer_base_url)
+            items.append(FetchItem("json", entry.get("output") or f"{entry['slug']}.json", url))
+        elif "stig_sys" in entry and "stig_ver" in entry:
+            url = _zip_url(entry["stig_sys"], entry["stig_ver"], disa_base_url)
+            items.append(FetchItem("zip", entry.get("output") or url.rsplit("/", 1)[1], url))
+        else:
+            raise ValueError(f"Manifest entry needs 'slug' or 'stig_sys' + 'stig_ver': {entry}")
+    return items
+
+
+def load_manifest(manifest_path, **base_urls) -> List[FetchItem]:
+    """
+    Read a JSON manifest (a list of entries, see manifest_items) into FetchItems.
+    :param manifest_path: Path to the manifest .json file
+    :return: FetchItems in manifest order
+    """
+    with open(manifest_path, encoding="utf-8") as f:
+        entries = json.load(f)
+    if not isinstance(entries, list):
+        raise ValueError(f"Manifest must be a JSON list of entries: {manifest_path}")
+    return manifest_items(entries, **base_urls)
+
+
+async def _download(client: httpx.AsyncClient, item: FetchItem, path: Path):
+    """Fetch one item to path; returns (status, bytes transferred)."""
+    headers = _conditional_headers(path, item.url)
+    async with client.stream("GET", item.url, headers=headers) as response:
+        if response.status_code == 304:
+            return "not modified", 0
+        response.raise_for_status()
+
+        if item.kind == "zip":
+            with _PartialDownload(response, path) as part:
+                async for chunk in response.aiter_bytes(_CHUNK_SIZE):
+                    part.write(chunk)
+                sha256 = part.commit()
+            _save_meta(path, item.url, response, sha256)
+            return "downloaded", part.size
+
+        # stigviewer JSON is small; it is re-indented to match get_stig_json's output
+        body = bytearray()
+        async for chunk in response.aiter_bytes(_CHUNK_SIZE):
+            body += chunk
+            if len(body) > MAX_DOWNLOAD_BYTES:
+                raise ValueError(f"Downloaded file too large (>{MAX_DOWNLOAD_BYTES} bytes)")
+        content = json.dumps(json.loads(body), indent=2)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        _save_meta(path, item.url, response, hashlib.sha256(content.encode("utf-8")).hexdigest())
+        return "downloaded", len(body)
+
+
+async def _fetch_one(
+    client, semaphore, item: FetchItem, output_dir: Path, allowed_dirs
+) -> FetchResult:
+    start = time.perf_counter()
+    path = None
+    try:
+        path = validate_file_path(output_dir / item.name, allowed_dirs)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        async with semaphore:
+            status, size = await _download(client, item, path)
+        result = FetchResult(item, path, status, "", size, time.perf_counter() - start)
+    except Exception as e:
+        result = FetchResult(item, path, "failed", str(e), 0, time.perf_counter() - start)
+    return _report(result)
+
+
+async def fetch_many(
+    items,
+    output_dir,
+    concurrency: int = 4,
+    allowed_dirs=None,
+    timeout: float = 30.0,
+) -> List[FetchResult]:
+    """
+    Download every item concurrently over a single pooled httpx.AsyncClient.
+    At most `concurrency` transfers run at once and connections are kept alive
+    between them. Existing files are revalidated with conditional requests.
+    :param items: FetchItems to download
+    :param output_dir: Directory the files are written to
+    :param concurrency: Maximum simultaneous downloads (and pooled connections)
+    :param allowed_dirs: List of allowed base directories
+    :param timeout: Per-request timeout in seconds
+    :return: One FetchResult per item, in input order
+    :raises ValueError: If concurrency is less than 1
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+    if allowed_dirs is None:
+        allowed_dirs = get_default_allowed_dirs()
+    output_dir = Path(output_dir)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+    async with httpx.AsyncClient(timeout=timeout, limits=limits) as client:
+        return list(await asyncio.gather(
+            *(_fetch_one(client, semaphore, item, output_dir, allowed_dirs) for item in items)
+        ))
+
+
+def fetch_manifest(
+    manifest_path,
+    output_dir="data",
+    concurrency: int = 4,
+    allowed_dirs=None,
+    disa_base_url: str = DISA_BASE_URL,
+    stigviewer_base_url: str = STIGVIEWER_BASE_URL,
+) -> List[FetchResult]:
+    """
+    Download every STIG listed in a manifest and report per-item results and bandwidth.
+    :param manifest_path: Path to the JSON manifest
+    :param output_dir: Directory the files are written to (default: data/)
+    :param concurrency: Maximum simultaneous downloads
+    :param allowed_dirs: List of allowed base directories
+    :return: One FetchResult per manifest entry, in manifest order
+    """
+    items = load_manifest(
+        manifest_path, disa_base_url=disa_base_url, stigviewer_base_url=stigviewer_base_url
+    )
+    print(f"[*] Fetching {len(items)} STIG(s) into {output_dir} with {concurrency} connection(s)")
+    start = time.perf_counter()
+    results = asyncio.run(fetch_many(items, output_dir, concurrency, allowed_dirs))
+    elapsed = max(time.perf_counter() - start, 1e-9)
+
+    downloaded = sum(r.status == "downloaded" for r in results)
+    unchanged = sum(r.status == "not modified" for r in results)
+    megabytes = sum(r.bytes for r in results) / (1024 * 1024)
+    print(
+        f"[*] Fetched {downloaded} new, {unchanged} unchanged, "
+        f"{len(results) - downloaded - unchanged} failed in {elapsed:.2f}s "
+        f"({megabytes:.2f} MB, {megabytes / elapsed:.2f} MB/s)"
+    )
+    return results
+
+
+def _report(result: FetchResult) -> FetchResult:
+    if result.status == "failed":
+        print(f"[X] {result.item.name}: {result.error}")
+    elif result.status == "not modified":
+        print(f"[*] {result.item.name} is up to date (not modified)")
+    else:
+        print(f"[*] {result.item.name} ({result.bytes / 1024:.0f} KB, {result.seconds:.2f}s)")
+    return result
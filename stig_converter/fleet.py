@@ -0,0 +1,154 @@
+# fleet.py
+# Hosts × rules status matrix over many checklists, with vectorized compliance aggregates
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Status codes stored in the matrix; a host without the rule is NOT_PRESENT
+NOT_PRESENT = -1
+STATUSES = ("Not_Reviewed", "Open", "NotAFinding", "Not_Applicable")
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+NOT_REVIEWED, OPEN, NOT_A_FINDING, NOT_APPLICABLE = range(len(STATUSES))
+
+# Severity codes of the rule columns; anything unrecognised is "unknown"
+SEVERITIES = ("unknown", "low", "medium", "high")
+SEVERITY_CODES = {severity: code for code, severity in enumerate(SEVERITIES)}
+
+
+def _require_numpy() -> None:
+    if not NUMPY_AVAILABLE:
+        raise ImportError(
+            "The fleet matrix needs NumPy. Install it with: pip install 'stig-converter[fleet]'"
+        )
+
+
+class FleetMatrix:
+    """
+    Review status of every rule on every host, one int8 per cell.
+
+    status[h, r] is a STATUS_CODES value, or NOT_PRESENT when host h has no
+    checklist containing rule r. hosts and rules are the row and column labels
+    (HOST_NAME and Vuln_Num); severity holds one SEVERITY_CODES value per rule.
+    A rule is applicable to a host when it is present and not Not_Applicable.
+    """
+
+    __slots__ = ("status", "hosts", "rules", "severity")
+
+    def __init__(self, status, hosts, rules, severity) -> None:
+        self.status = status
+        self.hosts = hosts
+        self.rules = rules
+        self.severity = severity
+
+    def __repr__(self) -> str:
+        return f"FleetMatrix(hosts={len(self.hosts)}, rules={len(self.rules)})"
+
+    def _applicable(self):
+        return (self.status != NOT_PRESENT) & (self.status != NOT_APPLICABLE)
+
+    def open_by_severity(self) -> Dict[str, "np.ndarray"]:
+        """
+        Open findings per host, split by rule severity.
+        :return: {severity: per-host counts}; sum an array for the fleet total
+        """
+        one_hot = self.severity[:, None] == np.arange(len(SEVERITIES), dtype=np.int8)
+        counts = (self.status == OPEN).astype(np.int32) @ one_hot.astype(np.int32)
+        return {severity: counts[:, code] for code, severity in enumerate(SEVERITIES)}
+
+    def failure_rates(self) -> "np.ndarray":
+        """
+        Fraction of hosts where each rule is Open, out of the hosts it applies to.
+        :return: Per-rule float array; NaN for a rule that applies to no host
+        """
+        applicable = self._applicable().sum(axis=0)
+        failed = (self.status == OPEN).sum(axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(applicable > 0, failed / applicable, np.nan)
+
+    def compliance(self) -> "np.ndarray":
+        """
+        Percentage of applicable rules marked NotAFinding on each host.
+        Open and Not_Reviewed rules both count against compliance.
+        :return: Per-host float array; NaN for a host with no applicable rule
+        """
+        applicable = self._applicable().sum(axis=1)
+        passed = (self.status == NOT_A_FINDING).sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(applicable > 0, 100.0 * passed / applicable, np.nan)
+
+
+def _scan(input_path: Path):
+    """
+    Reduce one checklist to (host, Vuln_Nums, severity codes, status codes) (runs in a
+    worker process). Only these few bytes per rule travel back to the parent.
+    """
+    from stig_converter.converters.model import Checklist
+    from stig_converter.converters.readers import iter_ckl, read_cklb
+
+    if input_path.suffix.lower() == ".cklb":
+        checklist = read_cklb(input_path)
+        rules = list(checklist.rules())
+    else:
+        checklist = Checklist()
+        rules = [rule for _, rule in iter_ckl(input_path, checklist)]
+    return (
+        checklist.asset.host_name or input_path.stem,
+        [rule.vuln_num for rule in rules],
+        bytes(SEVERITY_CODES.get(rule.severity.lower(), 0) for rule in rules),
+        bytes(STATUS_CODES.get(rule.status, NOT_REVIEWED) for rule in rules),
+    )
+
+
+def build_fleet_matrix(sources, jobs: Optional[int] = None) -> FleetMatrix:
+    """
+    Parse every .ckl/.cklb matched by sources into one hosts × rules matrix.
+    Checklists with the same HOST_NAME (e.g. one per STIG) share a row; a file
+    without a HOST_NAME gets a row named after the file.
+    :param sources: Files, directories (searched recursively) or glob patterns
+    :param jobs: Parser processes (default: CPU count)
+    :return: FleetMatrix with hosts and rules in order of first appearance
+    """
+    _require_numpy()
+    from stig_converter.batch import expand_checklists
+
+    inputs = expand_checklists(sources)
+    jobs = jobs or os.cpu_count() or 1
+    parallel = jobs > 1 and len(inputs) > 1
+
+    host_rows: Dict[str, int] = {}
+    columns: Dict[str, int] = {}
+    severity = bytearray()
+    cells = []
+    with (ProcessPoolExecutor(max_workers=jobs) if parallel else nullcontext()) as pool:
+        scanned = pool.map(_scan, inputs, chunksize=4) if parallel else map(_scan, inputs)
+        for host, vuln_nums, severities, statuses in scanned:
+            row = host_rows.setdefault(host, len(host_rows))
+            cols = np.empty(len(vuln_nums), dtype=np.intp)
+            for i, vuln_num in enumerate(vuln_nums):
+                col = columns.get(vuln_num)
+                if col is None:
+                    col = columns[vuln_num] = len(columns)
+                    severity.append(severities[i])
+                cols[i] = col
+            cells.append((row, cols, np.frombuffer(statuses, dtype=np.int8)))
+
+    status = np.full((len(host_rows), len(columns)), NOT_PRESENT, dtype=np.int8)
+    for row, cols, codes in cells:
+        status[row, cols] = codes
+    return FleetMatrix(
+        status,
+        np.array(list(host_rows), dtype=str),
+        np.array(list(columns), dtype=str),
+        np.frombuffer(bytes(severity), dtype=np.int8).copy(),
+    )
@@ -0,0 +1,170 @@
+# generate.py
+# Generate one checklist per host from a single benchmark or template and an inventory CSV
+
+import csv
+import json
+import re
+import time
+import uuid
+from pathlib import Path
+from typing import List
+
+from stig_converter.converters.model import Asset, Checklist
+from stig_converter.converters.writers import (
+    _cklb_target,
+    ckl_asset_bytes,
+    cklb_document,
+    iter_ckl_stigs_bytes,
+)
+from stig_converter.security_utils import get_default_allowed_dirs, validate_output_path
+
+# Markers swapped in for the per-host CKLB fields before the shared document is serialized
+_CKLB_MARKERS = ("\ue000title\ue001", "\ue000id\ue001", "\ue000target_data\ue001")
+
+
+def _load_source(source_path: Path) -> Checklist:
+    """Read the benchmark or template every host checklist is generated from."""
+    ext = source_path.suffix[1:].lower()
+    if ext in ("xml", "zip"):
+        from stig_converter.converters.benchmark_cache import load_benchmark
+        return load_benchmark(source_path)
+    if ext == "ckl":
+        from stig_converter.converters.readers import read_ckl
+        return read_ckl(source_path)
+    if ext == "cklb":
+        from stig_converter.converters.readers import read_cklb
+        return read_cklb(source_path)
+    raise ValueError(f"Unsupported source type '{ext}'. Supported: xml, zip, ckl, cklb")
+
+
+def read_inventory(inventory_csv) -> List[dict]:
+    """
+    Read an inventory CSV into per-host Asset field overrides.
+    Columns are matched case-insensitively to the CKL ASSET tags
+    (HOST_NAME, HOST_IP, HOST_MAC, HOST_FQDN, TARGET_COMMENT, ROLE, ...);
+    other columns are ignored and empty cells keep the template's value.
+    :param inventory_csv: Path to the inventory .csv file
+    :return: One dict of Asset slot → value per row
+    """
+    with open(inventory_csv, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        columns = {
+            name: name.strip().lower()
+            for name in reader.fieldnames or ()
+            if name and name.strip().lower() in Asset.__slots__
+        }
+        if "host_name" not in columns.values():
+            raise ValueError(f"[X] Inventory has no HOST_NAME column: {inventory_csv}")
+        return [
+            {slot: row[name].strip() for name, slot in columns.items() if row.get(name)}
+            for row in reader
+        ]
+
+
+def _host_asset(template: Asset, fields: dict) -> Asset:
+    """Copy the template's asset and apply one inventory row on top."""
+    asset = Asset(**{slot: getattr(template, slot) for slot in Asset.__slots__})
+    for slot, value in fields.items():
+        setattr(asset, slot, value)
+    return asset
+
+
+def _file_stems(hosts: List[dict]) -> List[str]:
+    """File-system safe, unique output stem per host (row number when the name is blank)."""
+    stems, seen, suffixes = [], set(), {}
+    for number, fields in enumerate(hosts, 1):
+        base = re.sub(r"[^A-Za-z0-9_.-]", "_", fields.get("host_name", "")).strip("._")
+        base = base or f"host-{number}"
+        stem = base
+        # A suffixed stem may itself be a later host's name (web, web, web-2), so keep going
+        while stem in seen:
+            suffixes[base] = suffixes.get(base, 1) + 1
+            stem = f"{base}-{suffixes[base]}"
+        seen.add(stem)
+        stems.append(stem)
+    return stems
+
+
+class _CklbTemplate:
+    """The CKLB document serialized once, with title, id and target_data left open."""
+
+    def __init__(self, checklist: Checklist) -> None:
+        document = cklb_document(checklist)
+        self.base_id = document["id"]
+        for key, marker in zip(("title", "id", "target_data"), _CKLB_MARKERS):
+            document[key] = marker
+        text = json.dumps(document, indent=2)
+        self.chunks = []
+        pos = 0
+        for marker in _CKLB_MARKERS:
+            quoted = json.dumps(marker)
+            start = text.index(quoted, pos)
+            self.chunks.append(text[pos:start].encode("utf-8"))
+            pos = start + len(quoted)
+        self.chunks.append(text[pos:].encode("utf-8"))
+
+    def render(self, title: str, asset: Asset) -> list:
+        """Return the per-host document as byte chunks; only the open fields are serialized."""
+        checklist_id = str(uuid.uuid5(uuid.NAMESPACE_DNS, f"{self.base_id}:{title}"))
+        target = json.dumps(_cklb_target(asset), indent=2).replace("\n", "\n  ")
+        values = (json.dumps(title), json.dumps(checklist_id), target)
+        parts = [self.chunks[0]]
+        for value, chunk in zip(values, self.chunks[1:]):
+            parts.append(value.encode("utf-8"))
+            parts.append(chunk)
+        return parts
+
+
+def generate_checklists(source, inventory_csv, output_dir, output_format: str = "ckl") -> List[str]:
+    """
+    Write one blank checklist per inventory host from a single benchmark or template.
+    The rule body is serialized and encoded once; each host only formats its own
+    ASSET block (CKL) or target_data / title / id (CKLB) around the shared bytes.
+    :param source: XCCDF benchmark (.xml / STIG .zip) or a CKL/CKLB template
+    :param inventory_csv: CSV with a HOST_NAME column and optional HOST_IP, HOST_MAC, HOST_FQDN, ...
+    :param output_dir: Directory the per-host files are written to as <HOST_NAME>.<format>
+    :param output_format: "ckl" or "cklb"
+    :return: Paths to the created files, in inventory order
+    """
+    output_format = output_format.lower().lstrip(".")
+    if output_format not in ("ckl", "cklb"):
+        raise ValueError(f"Unsupported output format '{output_format}'. Supported: ckl, cklb")
+    source_path = Path(source)
+    if not source_path.is_file():
+        raise FileNotFoundError(f"[X] Source file does not exist: {source_path}")
+    if not Path(inventory_csv).is_file():
+        raise FileNotFoundError(f"[X] Inventory file does not exist: {inventory_csv}")
+
+    hosts = read_inventory(inventory_csv)
+    print(f"[*] Generating {len(hosts)} {output_format.upper()} checklist(s) from {source_path}")
+    start = time.perf_counter()
+
+    checklist = _load_source(source_path)
+    if output_format == "ckl":
+        body = b"".join(iter_ckl_stigs_bytes(checklist))
+    else:
+        template = _CklbTemplate(checklist)
+
+    output_dir = Path(output_dir)
+    allowed_dirs = get_default_allowed_dirs()
+    created = []
+    for stem, fields in zip(_file_stems(hosts), hosts):
+        asset = _host_asset(checklist.asset, fields)
+        path = validate_output_path(
+            output_dir / f"{stem}.{output_format}", source_path, allowed_dirs,
+            extension=f".{output_format}",
+        )
+        with open(path, "wb") as f:
+            if output_format == "ckl":
+                f.write(ckl_asset_bytes(asset))
+                f.write(body)
+            else:
+                f.writelines(template.render(stem, asset))
+        created.append(str(path))
+
+    elapsed = max(time.perf_counter() - start, 1e-9)
+    print(
+        f"[*] {len(created)} checklist(s) written to {output_dir} in {elapsed:.2f}s "
+        f"({len(created) / elapsed:.0f} hosts/s)"
+    )
+    return created
@@ -1,15 +1,31 @@
 # get_new_stigs.py
 # Download latest STIG packages from stigviewer.com and DISA Cyber Exchange
 
+import hashlib
 import json
 import os
+import tempfile
 import zipfile
+from datetime import datetime, timezone
+from email.utils import formatdate
 from pathlib import Path
 from urllib.parse import urlparse
 
 import httpx
 
-from stig_converter.security_utils import validate_file_path, get_default_allowed_dirs
+from stig_converter.security_utils import (
+    get_default_allowed_dirs,
+    validate_file_path,
+    validate_zip_member,
+)
+
+# Downloads larger than this are aborted as soon as the limit is crossed
+MAX_DOWNLOAD_BYTES = 100 * 1024 * 1024
+_CHUNK_SIZE = 64 * 1024
+
+DISA_BASE_URL = "https://dl.dod.cyber.mil/wp-content/uploads/stigs/zip"
+STIGVIEWER_BASE_URL = "https://stigviewer.com/stigs"
+DEFAULT_SLUG = "application_security_and_development"
 
 
 def secure_extract_zip(file_path, extract_to, allowed_dirs):
@@ -23,23 +39,132 @@ def secure_extract_zip(file_path, extract_to, allowed_dirs):
 
     with zipfile.ZipFile(file_path, "r") as zip_ref:
         for member in zip_ref.infolist():
-            if os.path.isabs(member.filename) or ".." in member.filename:
-                raise ValueError(f"Unsafe path in ZIP: {member.filename}")
+            validate_zip_member(member.filename)
+            zip_ref.extract(member, extract_to)
 
-            if member.filename.startswith("/") or member.filename.startswith("\\"):
-                raise ValueError(f"Absolute path in ZIP: {member.filename}")
 
-            normalized_path = os.path.normpath(member.filename)
-            if normalized_path != member.filename or normalized_path.startswith(".."):
-                raise ValueError(f"Suspicious normalized path: {member.filename}")
+class _PartialDownload:
+    """
+    Temporary file in the destination directory that a streamed download is written to.
+    The size cap is enforced and a SHA-256 computed as bytes arrive; commit() renames
+    the file into place, and leaving the block without committing deletes it, so a
+    failed or oversized download never leaves a partial file behind.
+    """
 
-            zip_ref.extract(member, extract_to)
+    def __init__(self, response, file_path: Path) -> None:
+        declared = response.headers.get("content-length")
+        if declared and declared.isdigit() and int(declared) > MAX_DOWNLOAD_BYTES:
+            raise ValueError(f"Download too large ({int(declared)} bytes > {MAX_DOWNLOAD_BYTES})")
+        self.file_path = file_path
+        self.size = 0
+        self._digest = hashlib.sha256()
+        fd, self._tmp_name = tempfile.mkstemp(
+            dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".part"
+        )
+        self._file = os.fdopen(fd, "wb")
+
+    def write(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self.size > MAX_DOWNLOAD_BYTES:
+            raise ValueError(f"Downloaded file too large (>{MAX_DOWNLOAD_BYTES} bytes)")
+        self._digest.update(chunk)
+        self._file.write(chunk)
+
+    def commit(self) -> str:
+        """Move the completed download into place and return its SHA-256 hex digest."""
+        self._file.close()
+        os.replace(self._tmp_name, self.file_path)
+        self._tmp_name = None
+        return self._digest.hexdigest()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._file.close()
+        if self._tmp_name:
+            try:
+                os.unlink(self._tmp_name)
+            except OSError:
+                pass
+
+
+def _stream_to_file(response, file_path: Path) -> str:
+    """
+    Write a streamed HTTP response body to file_path without holding it in memory.
+    :param response: An httpx response opened with client.stream()
+    :param file_path: Final destination path
+    :return: SHA-256 hex digest of the downloaded bytes
+    """
+    with _PartialDownload(response, file_path) as part:
+        for chunk in response.iter_bytes(_CHUNK_SIZE):
+            part.write(chunk)
+        return part.commit()
+
+
+def _zip_url(stig_sys: str, stig_ver: str, base_url: str = DISA_BASE_URL) -> str:
+    """Return the DISA Cyber Exchange URL of a STIG package after validating its parts."""
+    if not stig_sys.replace("_", "").replace("-", "").isalnum():
+        raise ValueError(f"Invalid stig_sys parameter: {stig_sys}")
+    if not stig_ver.replace("_", "").replace("V", "").replace("R", "").isalnum():
+        raise ValueError(f"Invalid stig_ver parameter: {stig_ver}")
+    return f"{base_url.rstrip('/')}/U_{stig_sys}_{stig_ver}_STIG.zip"
 
 
-def get_stig_json(file_name, allowed_dirs=None):
+def _json_url(slug: str, base_url: str = STIGVIEWER_BASE_URL) -> str:
+    """Return the stigviewer.com JSON URL of a STIG after validating its slug."""
+    if not slug or not slug.replace("_", "").replace("-", "").isalnum():
+        raise ValueError(f"Invalid stigviewer slug: {slug}")
+    return f"{base_url.rstrip('/')}/{slug}/json"
+
+
+def _meta_path(file_path: Path) -> Path:
+    """Sidecar that records the HTTP validators of a downloaded artifact."""
+    return file_path.with_name(file_path.name + ".meta.json")
+
+
+def _conditional_headers(file_path: Path, url: str) -> dict:
+    """
+    Build If-None-Match / If-Modified-Since headers for an artifact already on disk.
+    Validators come from the sidecar written by the last download of the same URL;
+    a file without a sidecar falls back to its modification time.
+    """
+    if not file_path.exists():
+        return {}
+    try:
+        with open(_meta_path(file_path), encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return {"If-Modified-Since": formatdate(file_path.stat().st_mtime, usegmt=True)}
+    if meta.get("url") != url:
+        return {}
+
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+
+def _save_meta(file_path: Path, url: str, response, sha256: str) -> None:
+    """Record the response's ETag / Last-Modified next to the artifact for the next fetch."""
+    meta = {
+        "url": url,
+        "etag": response.headers.get("etag"),
+        "last_modified": response.headers.get("last-modified"),
+        "sha256": sha256,
+        "fetched": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+    with open(_meta_path(file_path), "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+
+
+def get_stig_json(file_name, allowed_dirs=None, slug=DEFAULT_SLUG):
     """
     Pulls down the latest STIG checklist from the STIG Viewer website at:
-    https://stigviewer.com/stigs/application_security_and_development
+    https://stigviewer.com/stigs/<slug> (default: application_security_and_development)
+    An existing file is revalidated with a conditional request and left as-is on 304.
     """
     if allowed_dirs is None:
         allowed_dirs = get_default_allowed_dirs()
@@ -48,14 +173,19 @@ def get_stig_json(file_name, allowed_dirs=None):
         new_filepath = validate_file_path(file_name, allowed_dirs)
         new_filepath.parent.mkdir(parents=True, exist_ok=True)
         print(f"[*] Downloading STIGs to {new_filepath}")
-        target = (
-            "https://stigviewer.com/stigs/application_security_and_development/json"
-        )
-        response = httpx.get(target, timeout=30.0)
+        target = _json_url(slug)
+        headers = _conditional_headers(new_filepath, target)
+        response = httpx.get(target, headers=headers, timeout=30.0)
+        if response.status_code == 304:
+            print(f"[*] {new_filepath.name} is up to date (not modified)")
+            return new_filepath
         response.raise_for_status()
         json_checklist = response.json()
+        content = json.dumps(json_checklist, indent=2)
         with open(new_filepath, "w", encoding="utf-8") as new_stigs:
-            new_stigs.write(json.dumps(json_checklist, indent=2))
+            new_stigs.write(content)
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        _save_meta(new_filepath, target, response, digest)
         print(f"[*] Successfully downloaded {new_filepath.name}!")
         return new_filepath
     except Exception as e:
@@ -66,6 +196,7 @@ def get_stig_zip(output_name, stig_sys="ASD", stig_ver="V6R4", allowed_dirs=None
     """
     Downloads the latest STIG ZIP from DISA Cyber Exchange.
     The checklist itself is an XML file included in the zip.
+    An existing file is revalidated with a conditional request and left as-is on 304.
     """
     if allowed_dirs is None:
         allowed_dirs = get_default_allowed_dirs()
@@ -73,34 +204,26 @@ def get_stig_zip(output_name, stig_sys="ASD", stig_ver="V6R4", allowed_dirs=None
     file_path = validate_file_path(output_name, allowed_dirs)
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    if file_path.exists():
-        print(f"[!] The file '{file_path}' already exists.")
-        return file_path
-
-    if not stig_sys.replace("_", "").replace("-", "").isalnum():
-        raise ValueError(f"Invalid stig_sys parameter: {stig_sys}")
-    if not stig_ver.replace("_", "").replace("V", "").replace("R", "").isalnum():
-        raise ValueError(f"Invalid stig_ver parameter: {stig_ver}")
-
-    url = f"https://dl.dod.cyber.mil/wp-content/uploads/stigs/zip/U_{stig_sys}_{stig_ver}_STIG.zip"
+    url = _zip_url(stig_sys, stig_ver)
     zip_file = Path(urlparse(url).path).name
+    headers = _conditional_headers(file_path, url)
     print(f"[*] Downloading {zip_file} to {file_path}...")
     try:
         with httpx.Client(timeout=30.0) as client:
-            response = client.get(url)
-
-            if response.status_code == 200:
-                if len(response.content) > 100 * 1024 * 1024:
-                    raise ValueError("Downloaded file too large (>100MB)")
-
-                with open(file_path, "wb") as f:
-                    f.write(response.content)
-                print(f"[*] File successfully saved to {file_path}")
-                return file_path
-            else:
-                print(
-                    f"[X] Failed to download the file. Status code: {response.status_code}"
-                )
+            with client.stream("GET", url, headers=headers) as response:
+                if response.status_code == 304:
+                    print(f"[*] {file_path.name} is up to date (not modified)")
+                    return file_path
+                if response.status_code == 200:
+                    sha256 = _stream_to_file(response, file_path)
+                    _save_meta(file_path, url, response, sha256)
+                    print(f"[*] File successfully saved to {file_path}")
+                    print(f"[*] SHA-256: {sha256}")
+                    return file_path
+                else:
+                    print(
+                        f"[X] Failed to download the file. Status code: {response.status_code}"
+                    )
     except Exception as e:
         print(f"[X] Failed to download STIG zip. Error: {e}")
 
@@ -0,0 +1,159 @@
+# ingest.py
+# Bulk-load many checklists into one SQLite database for fleet-wide queries
+
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+from stig_converter.batch import expand_checklists
+from stig_converter.converters.readers import file_sha256
+from stig_converter.converters.sqlite_store import (
+    analyze,
+    ingested_hash,
+    open_database,
+    write_sqlite,
+)
+from stig_converter.security_utils import get_default_allowed_dirs, validate_output_path
+
+# Checklists written per transaction; one commit per batch keeps fsyncs rare without
+# holding an unbounded transaction open over a large fleet
+COMMIT_EVERY = 64
+
+
+class IngestResult(NamedTuple):
+    """Outcome of loading a single checklist into the database."""
+
+    input: Path
+    ok: bool
+    skipped: bool
+    findings: int
+    error: str
+
+
+def _parse(input_path: Path):
+    """Read one checklist into the model (runs in a worker process)."""
+    from stig_converter.converters.readers import read_ckl, read_cklb
+
+    try:
+        if input_path.suffix.lower() == ".cklb":
+            return read_cklb(input_path), ""
+        return read_ckl(input_path), ""
+    except Exception as e:
+        return None, str(e) or type(e).__name__
+
+
+def _parsed(paths: List[Path], jobs: int):
+    """
+    Yield (path, checklist, error) in input order. With several jobs, parsing runs
+    ahead on a process pool by at most a few files, so memory stays bounded while
+    the single SQLite writer is kept busy.
+    """
+    if jobs <= 1 or len(paths) <= 1:
+        for path in paths:
+            yield (path, *_parse(path))
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending = deque()
+        queue = iter(paths)
+        for path in queue:
+            pending.append((path, pool.submit(_parse, path)))
+            if len(pending) >= jobs * 2:
+                break
+        while pending:
+            path, future = pending.popleft()
+            next_path = next(queue, None)
+            if next_path is not None:
+                pending.append((next_path, pool.submit(_parse, next_path)))
+            yield (path, *future.result())
+
+
+def _store(conn, path: Path, checklist, sha256: str) -> IngestResult:
+    """
+    Write one checklist inside a savepoint, so a checklist the database rejects is
+    rolled back on its own without losing the rest of the uncommitted batch.
+    """
+    if not conn.in_transaction:
+        conn.execute("BEGIN")
+    conn.execute("SAVEPOINT checklist")
+    try:
+        findings = write_sqlite(checklist, conn, str(path.resolve()), sha256)
+    except Exception as e:
+        conn.execute("ROLLBACK TO checklist")
+        conn.execute("RELEASE checklist")
+        return IngestResult(path, False, False, 0, str(e) or type(e).__name__)
+    conn.execute("RELEASE checklist")
+    return IngestResult(path, True, False, findings, "")
+
+
+def ingest(
+    sources, database, jobs: Optional[int] = None, force: bool = False
+) -> List[IngestResult]:
+    """
+    Load every .ckl/.cklb matched by sources into a SQLite checklist database.
+    Files already in the database with the same content are skipped; changed files
+    replace their earlier rows.
+    :param sources: Files, directories (searched recursively) or glob patterns
+    :param database: Path to the .sqlite database; created if missing
+    :param jobs: Parser processes (default: CPU count)
+    :param force: Reload files even if their content is unchanged
+    :return: One IngestResult per input file
+    """
+    database = validate_output_path(database, allowed_dirs=get_default_allowed_dirs())
+    inputs = expand_checklists(sources)
+    jobs = jobs or os.cpu_count() or 1
+
+    start = time.perf_counter()
+    results = []
+    conn = open_database(database)
+    try:
+        pending = []
+        for path in inputs:
+            sha256 = file_sha256(path)
+            if not force and ingested_hash(conn, str(path.resolve())) == sha256:
+                results.append(IngestResult(path, True, True, 0, ""))
+            else:
+                pending.append((path, sha256))
+        print(
+            f"[*] Ingesting {len(pending)} checklist(s) into {database} "
+            f"({len(inputs) - len(pending)} unchanged) with {jobs} parser(s)..."
+        )
+
+        hashes = dict(pending)
+        uncommitted = 0
+        for path, checklist, error in _parsed([path for path, _ in pending], jobs):
+            if checklist is None:
+                result = IngestResult(path, False, False, 0, error)
+            else:
+                result = _store(conn, path, checklist, hashes[path])
+                uncommitted += result.ok
+                if uncommitted >= COMMIT_EVERY:
+                    conn.commit()
+                    uncommitted = 0
+            results.append(_report(result))
+        conn.commit()
+        if any(r.ok and not r.skipped for r in results):
+            analyze(conn)
+    finally:
+        conn.close()
+
+    elapsed = time.perf_counter() - start
+    loaded = [r for r in results if r.ok and not r.skipped]
+    failed = sum(1 for r in results if not r.ok)
+    findings = sum(r.findings for r in loaded)
+    print(
+        f"[*] Ingested {len(loaded)} checklist(s), {findings} finding(s) in {elapsed:.2f}s "
+        f"({findings / elapsed if elapsed else 0:.0f} findings/s); "
+        f"{len(results) - len(loaded) - failed} unchanged, {failed} failed"
+    )
+    return results
+
+
+def _report(result: IngestResult) -> IngestResult:
+    if result.ok:
+        print(f"[*] {result.input} ({result.findings} findings)")
+    else:
+        print(f"[X] {result.input}: {result.error}")
+    return result
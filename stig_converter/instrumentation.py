@@ -0,0 +1,233 @@
+# instrumentation.py
+# Per-stage timings, counters and byte sizes for conversions, collected only on request
+
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+# The collector of the current run and the conversion currently being recorded.
+# Both default to None, in which case every hook below is a no-op.
+_collector: ContextVar = ContextVar("stig_converter_timings", default=None)
+_current: ContextVar = ContextVar("stig_converter_conversion", default=None)
+
+# Stages in reporting order: reading the input, turning it into the output's
+# shape, and writing it. Streaming converters interleave the three, and
+# a reader that builds finding dicts as it parses reports that work as parse.
+STAGES = ("parse", "transform", "serialize")
+
+
+class ConversionTimings:
+    """Timings, counts and sizes recorded for one input → output(s) conversion."""
+
+    __slots__ = (
+        "input", "outputs", "stages", "rules", "stigs", "bytes_in", "bytes_out", "seconds",
+        "_nested",
+    )
+
+    def __init__(self, input_path, output_paths) -> None:
+        self.input = str(input_path)
+        self.outputs = [str(p) for p in output_paths]
+        self.stages = {}
+        self.rules = 0
+        self.stigs = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.seconds = 0.0
+        # Time already attributed to inner stages, excluded from the enclosing one
+        self._nested = 0.0
+
+    def as_dict(self) -> dict:
+        ordered = {name: self.stages[name] for name in STAGES if name in self.stages}
+        ordered.update({name: t for name, t in self.stages.items() if name not in ordered})
+        return {
+            "input": self.input,
+            "outputs": self.outputs,
+            "seconds": round(self.seconds, 6),
+            "stages": {name: round(t, 6) for name, t in ordered.items()},
+            "rules": self.rules,
+            "stigs": self.stigs,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+        }
+
+
+class Timings:
+    """Everything recorded while a collect() block was active."""
+
+    def __init__(self) -> None:
+        self.conversions = []
+        self.seconds = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "seconds": round(self.seconds, 6),
+            "conversions": [c.as_dict() for c in self.conversions],
+        }
+
+
+@contextmanager
+def collect():
+    """
+    Record every conversion run inside the block.
+    :return: Context manager yielding the Timings being filled in
+    """
+    timings = Timings()
+    token = _collector.set(timings)
+    start = time.perf_counter()
+    try:
+        yield timings
+    finally:
+        timings.seconds = time.perf_counter() - start
+        _collector.reset(token)
+
+
+def _size(path) -> int:
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
+@contextmanager
+def conversion(input_path, output_paths):
+    """
+    Open a record for one conversion when a collector is active.
+    Input and output sizes are taken from the files once the block ends.
+    :param output_paths: The requested output path(s); the created paths may be
+        passed back by assigning record.outputs inside the block
+    :return: Context manager yielding the ConversionTimings, or None when not collecting
+    """
+    timings = _collector.get()
+    if timings is None:
+        yield None
+        return
+    if isinstance(output_paths, (str, os.PathLike)):
+        output_paths = [output_paths]
+    record = ConversionTimings(input_path, output_paths)
+    token = _current.set(record)
+    start = time.perf_counter()
+    try:
+        yield record
+    finally:
+        record.seconds = time.perf_counter() - start
+        _current.reset(token)
+        record.bytes_in = _size(input_path)
+        record.bytes_out = sum(_size(p) for p in record.outputs)
+        timings.conversions.append(record)
+
+
+@contextmanager
+def stage(name: str):
+    """Add the time spent in the block to stage name of the current conversion."""
+    record = _current.get()
+    if record is None:
+        yield
+        return
+    nested_before = record._nested
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        inner = record._nested - nested_before
+        record.stages[name] = record.stages.get(name, 0.0) + elapsed - inner
+        record._nested = nested_before + elapsed
+
+
+def track(items, name: str = "parse", count_rules: bool = True):
+    """
+    Attribute the time spent producing each item of a lazy iterable to stage name,
+    and count the items as rules. This separates a streaming reader's cost from
+    the writer consuming it. Returns items unchanged when not collecting.
+    :param count_rules: False for a repeated pass over findings already counted
+    """
+    record = _current.get()
+    if record is None:
+        return items
+    return _track(items, name, record, count_rules)
+
+
+def _track(items, name: str, record, count_rules: bool = True):
+    iterator = iter(items)
+    clock = time.perf_counter
+    while True:
+        start = clock()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            elapsed = clock() - start
+            record.stages[name] = record.stages.get(name, 0.0) + elapsed
+            record._nested += elapsed
+            return
+        elapsed = clock() - start
+        record.stages[name] = record.stages.get(name, 0.0) + elapsed
+        record._nested += elapsed
+        record.rules += count_rules
+        yield item
+
+
+def count(rules: int = 0, stigs: int = 0) -> None:
+    """Add to the rule and STIG counters of the current conversion."""
+    record = _current.get()
+    if record is not None:
+        record.rules += rules
+        record.stigs += stigs
+
+
+def count_checklist(checklist) -> None:
+    """Count the rules and STIGs of a parsed Checklist."""
+    record = _current.get()
+    if record is not None:
+        record.rules += checklist.rule_count()
+        record.stigs += len(checklist.stigs)
+
+
+def run(func, timings_path=None, profile_path=None):
+    """
+    Call func, optionally recording stage timings and a cProfile of the call.
+    :param timings_path: Write the Timings as JSON here ("-" for stdout; progress
+        messages then go to stderr so stdout holds only the JSON)
+    :param profile_path: Dump cProfile statistics here (read with python -m pstats)
+    :return: Whatever func returns
+    """
+    import json
+    import sys
+    from contextlib import nullcontext, redirect_stdout
+
+    from stig_converter.security_utils import get_default_allowed_dirs, validate_output_path
+
+    allowed_dirs = get_default_allowed_dirs()
+    to_stdout = str(timings_path) == "-"
+    if timings_path and not to_stdout:
+        timings_path = validate_output_path(timings_path, allowed_dirs=allowed_dirs)
+    if profile_path:
+        profile_path = validate_output_path(profile_path, allowed_dirs=allowed_dirs)
+
+    with (collect() if timings_path else nullcontext()) as timings, \
+            (redirect_stdout(sys.stderr) if to_stdout else nullcontext()):
+        profiler = None
+        if profile_path:
+            import cProfile
+            profiler = cProfile.Profile()
+            profiler.enable()
+        try:
+            result = func()
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                profiler.dump_stats(profile_path)
+                print(
+                    f"[*] Profile written to {profile_path} "
+                    f"(view with: python -m pstats {profile_path})"
+                )
+
+    if timings_path:
+        report = json.dumps(timings.as_dict(), indent=2)
+        if to_stdout:
+            print(report)
+        else:
+            Path(timings_path).write_text(report + "\n", encoding="utf-8")
+            print(f"[*] Timings written to {timings_path}")
+    return result
@@ -1,6 +1,7 @@
 # security_utils.py
 # Security utilities for STIG converter scripts
 
+import os
 from pathlib import Path
 
 
@@ -25,6 +26,26 @@ def validate_file_path(file_path, allowed_dirs):
     raise ValueError(f"File path not allowed: {file_path}")
 
 
+def validate_zip_member(member_name: str) -> str:
+    """
+    Validate a ZIP member name to prevent path traversal (zip slip) attacks.
+    Applied both before extracting a member and before reading one in place.
+    :param member_name: The member's filename as stored in the archive
+    :return: The validated member name
+    :raises ValueError: If the name is absolute, escapes its root, or is not normalized
+    """
+    if os.path.isabs(member_name) or ".." in member_name:
+        raise ValueError(f"Unsafe path in ZIP: {member_name}")
+
+    if member_name.startswith("/") or member_name.startswith("\\"):
+        raise ValueError(f"Absolute path in ZIP: {member_name}")
+
+    normalized_path = os.path.normpath(member_name)
+    if normalized_path != member_name or normalized_path.startswith(".."):
+        raise ValueError(f"Suspicious normalized path: {member_name}")
+    return member_name
+
+
 def _find_project_root() -> Path:
     """
     Walk up from this file's location to find the project root (the directory
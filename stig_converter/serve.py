@@ -0,0 +1,386 @@
+# serve.py
+# Long-running conversion service that keeps templates, benchmarks and workers warm
+
+import hashlib
+import io
+import json
+import os
+import signal
+import threading
+import time
+import zipfile
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from socketserver import ThreadingMixIn, UnixStreamServer
+from urllib.parse import parse_qs, urlsplit
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Largest request body accepted (bytes); bigger uploads get 413
+MAX_REQUEST_BYTES = 128 * 1024 * 1024
+
+# Compiled XCCDF benchmarks kept per process, keyed on the uploaded bytes
+BENCHMARK_CACHE_SIZE = 16
+
+# Latencies kept per conversion for the percentiles in /metrics
+_LATENCY_WINDOW = 2048
+
+_CONTENT_TYPES = {
+    "ckl": "application/xml",
+    "cklb": "application/json",
+    "json": "application/json",
+    "jsonl": "application/x-ndjson",
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+    "md": "text/markdown; charset=utf-8",
+}
+
+# Malformed uploads: reported as 400 rather than 500
+_INPUT_ERRORS = (ValueError, SyntaxError, zipfile.BadZipFile)
+
+
+# ------------------------------------------------------------------
+# Conversion jobs (run in each pool worker, or in the request thread)
+# ------------------------------------------------------------------
+
+# Warm state of this process: parsed CKL templates by name, compiled benchmarks by digest
+_templates = {}
+_benchmarks = OrderedDict()
+_benchmarks_lock = threading.Lock()
+
+
+def _init_worker(template_paths: dict) -> None:
+    """Import the converters and parse every named template once, before the first job."""
+    from stig_converter import api
+
+    for name, path in template_paths.items():
+        _templates[name] = api.load_template(Path(path).read_bytes())
+
+
+def _ping(_) -> int:
+    return os.getpid()
+
+
+def _benchmark(body: bytes, src: str):
+    """Return (Checklist, cache hit) for an uploaded XCCDF benchmark or STIG package."""
+    from stig_converter import api
+
+    digest = hashlib.sha256(body).digest()
+    with _benchmarks_lock:
+        checklist = _benchmarks.get(digest)
+        if checklist is not None:
+            _benchmarks.move_to_end(digest)
+            return checklist, True
+    checklist = api.read_checklist(io.BytesIO(body), src)
+    with _benchmarks_lock:
+        _benchmarks[digest] = checklist
+        while len(_benchmarks) > BENCHMARK_CACHE_SIZE:
+            _benchmarks.popitem(last=False)
+    return checklist, False
+
+
+def convert_job(body: bytes, src: str, dst: str, template=None, title=None, date=None):
+    """
+    Run one conversion against this process's warm caches.
+    :param template: Name of a template loaded at startup (JSON/JSONL → CKL)
+    :return: (output bytes, True/False for a benchmark cache hit or None when not applicable)
+    """
+    from stig_converter import api
+
+    if template is not None and template not in _templates:
+        known = ", ".join(sorted(_templates)) or "none"
+        raise ValueError(f"Unknown template '{template}'. Loaded templates: {known}")
+    destination = io.BytesIO()
+    cache_hit = None
+    if src in ("xml", "zip") and dst in api.CONVERSIONS[src]:
+        checklist, cache_hit = _benchmark(body, src)
+        api.write_checklist(checklist, destination, dst, title=title)
+    else:
+        api.convert_stream(
+            io.BytesIO(body), destination, src, dst,
+            template=_templates.get(template), title=title, date=date,
+        )
+    return destination.getvalue(), cache_hit
+
+
+# ------------------------------------------------------------------
+# Metrics
+# ------------------------------------------------------------------
+
+def _percentile(ordered: list, fraction: float) -> float:
+    return ordered[round(fraction * (len(ordered) - 1))] if ordered else 0.0
+
+
+class Metrics:
+    """Request counters and latency windows, updated by every handler thread."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.started = time.monotonic()
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.conversions = {}
+
+    def begin(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+
+    def record(
+        self, key: str, seconds: float, bytes_in: int, bytes_out: int, ok: bool, cache_hit=None
+    ) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self.requests += 1
+            stats = self.conversions.get(key)
+            if stats is None:
+                stats = self.conversions[key] = {
+                    "count": 0, "errors": 0, "bytes_in": 0, "bytes_out": 0,
+                    "seconds": 0.0, "latencies": deque(maxlen=_LATENCY_WINDOW),
+                }
+            stats["count"] += 1
+            stats["bytes_in"] += bytes_in
+            stats["bytes_out"] += bytes_out
+            stats["seconds"] += seconds
+            stats["latencies"].append(seconds)
+            if not ok:
+                self.errors += 1
+                stats["errors"] += 1
+            if cache_hit is True:
+                self.cache_hits += 1
+            elif cache_hit is False:
+                self.cache_misses += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            uptime = max(time.monotonic() - self.started, 1e-9)
+            conversions = {}
+            for key, stats in sorted(self.conversions.items()):
+                latencies = sorted(stats["latencies"])
+                conversions[key] = {
+                    "count": stats["count"],
+                    "errors": stats["errors"],
+                    "bytes_in": stats["bytes_in"],
+                    "bytes_out": stats["bytes_out"],
+                    "latency_ms": {
+                        "mean": round(stats["seconds"] / stats["count"] * 1000, 3),
+                        "p50": round(_percentile(latencies, 0.50) * 1000, 3),
+                        "p95": round(_percentile(latencies, 0.95) * 1000, 3),
+                        "p99": round(_percentile(latencies, 0.99) * 1000, 3),
+                        "max": round(latencies[-1] * 1000, 3),
+                    },
+                }
+            return {
+                "uptime_seconds": round(uptime, 3),
+                "requests": self.requests,
+                "errors": self.errors,
+                "in_flight": self.in_flight,
+                "requests_per_second": round(self.requests / uptime, 3),
+                "benchmark_cache": {"hits": self.cache_hits, "misses": self.cache_misses},
+                "conversions": conversions,
+            }
+
+
+# ------------------------------------------------------------------
+# HTTP
+# ------------------------------------------------------------------
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _send(self, status: int, body: bytes, content_type: str = "application/json") -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: int, value) -> None:
+        self._send(status, (json.dumps(value, indent=2, ensure_ascii=False) + "\n").encode("utf-8"))
+
+    def _error(self, status: int, message: str) -> None:
+        self._send_json(status, {"error": message})
+
+    def do_GET(self) -> None:
+        path = urlsplit(self.path).path
+        if path == "/healthz":
+            self._send(200, b"ok\n", "text/plain")
+        elif path == "/metrics":
+            self._send_json(200, self.server.metrics.snapshot())
+        else:
+            self._error(404, f"Not found: {path}")
+
+    def do_POST(self) -> None:
+        url = urlsplit(self.path)
+        if url.path != "/convert":
+            self._error(404, f"Not found: {url.path}")
+            return
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        src = params.get("src", "").lower()
+        dst = params.get("dst", "").lower()
+        try:
+            length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            self._error(411, "Content-Length is required")
+            return
+        if length < 0:
+            # rfile.read(-1) would wait for the client to close the connection
+            self.close_connection = True
+            self._error(400, "Content-Length must not be negative")
+            return
+        if length > MAX_REQUEST_BYTES:
+            self.close_connection = True
+            self._error(413, f"Request body exceeds {MAX_REQUEST_BYTES} bytes")
+            return
+        body = self.rfile.read(length)
+
+        metrics = self.server.metrics
+        metrics.begin()
+        start = time.perf_counter()
+        output, ok, cache_hit = b"", False, None
+        try:
+            output, cache_hit = self.server.run(
+                body, src, dst, params.get("template"), params.get("title"), params.get("date")
+            )
+            ok = True
+        except _INPUT_ERRORS as e:
+            self._error(400, str(e))
+        except Exception as e:
+            self._error(500, f"{type(e).__name__}: {e}")
+        else:
+            self._send(200, output, _CONTENT_TYPES.get(dst, "application/octet-stream"))
+        finally:
+            metrics.record(
+                f"{src}→{dst}", time.perf_counter() - start, length, len(output), ok, cache_hit
+            )
+
+    def address_string(self) -> str:
+        # Unix-socket peers have no (host, port) address
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, format, *args) -> None:
+        if self.server.access_log:
+            super().log_message(format, *args)
+
+
+class _ServiceMixin:
+    """Shared state of the TCP and Unix-socket servers."""
+
+    daemon_threads = True
+
+    def setup_service(self, pool, workers: int, access_log: bool) -> None:
+        self.pool = pool
+        self.workers = workers
+        self.metrics = Metrics()
+        self.access_log = access_log
+
+    def run(self, *job):
+        """Run a conversion on the warm worker pool, or in this thread without one."""
+        if self.pool is None:
+            return convert_job(*job)
+        return self.pool.submit(convert_job, *job).result()
+
+    def close(self) -> None:
+        """Stop accepting requests and shut the worker pool down."""
+        self.server_close()
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+
+
+class ConversionServer(_ServiceMixin, ThreadingHTTPServer):
+    """HTTP conversion service on a TCP port."""
+
+
+class UnixConversionServer(_ServiceMixin, ThreadingMixIn, UnixStreamServer):
+    """HTTP conversion service on a Unix domain socket."""
+
+    def close(self) -> None:
+        super().close()
+        Path(self.server_address).unlink(missing_ok=True)
+
+
+def create_server(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    socket_path=None,
+    workers=None,
+    templates: dict = None,
+    access_log: bool = False,
+):
+    """
+    Build a conversion server with warm templates and a started worker pool.
+    Every worker imports the converters and parses the named templates before
+    the server accepts its first request; compiled benchmarks stay cached per
+    worker once uploaded.
+    :param socket_path: Listen on this Unix socket instead of host:port
+    :param workers: Worker processes (default: CPU count); 0 converts in the request threads
+    :param templates: Template name → CKL path, referenced as ?template=NAME
+    :param access_log: Log every request to stderr
+    :return: ConversionServer or UnixConversionServer (call serve_forever(), then close())
+    """
+    templates = {name: str(Path(path)) for name, path in (templates or {}).items()}
+    for name, path in templates.items():
+        if not Path(path).is_file():
+            raise FileNotFoundError(f"[X] Template '{name}' does not exist: {path}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 0:
+        raise ValueError("workers must be 0 or more")
+
+    pool = None
+    if workers:
+        pool = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(templates,)
+        )
+        # Start every worker now so imports and template parsing happen before the first request
+        list(pool.map(_ping, range(workers)))
+    else:
+        _init_worker(templates)
+
+    try:
+        if socket_path:
+            socket_path = Path(socket_path)
+            if socket_path.is_socket():
+                socket_path.unlink()
+            server = UnixConversionServer(str(socket_path), _Handler)
+        else:
+            server = ConversionServer((host, port), _Handler)
+    except BaseException:
+        if pool is not None:
+            pool.shutdown()
+        raise
+    server.setup_service(pool, workers, access_log)
+    return server
+
+
+def _interrupt(signum, frame) -> None:
+    raise KeyboardInterrupt
+
+
+def serve(**options) -> None:
+    """
+    Run the conversion server until interrupted (Ctrl+C or SIGTERM).
+    See create_server for the options.
+    """
+    server = create_server(**options)
+    if threading.current_thread() is threading.main_thread():
+        # Service managers stop with SIGTERM; shut down the same way as Ctrl+C
+        signal.signal(signal.SIGTERM, _interrupt)
+    if isinstance(server, UnixConversionServer):
+        where = f"unix:{server.server_address}"
+    else:
+        host, port = server.server_address[:2]
+        where = f"http://{host}:{port}"
+    print(f"[*] Serving conversions on {where} with {server.workers or 'no'} worker process(es)")
+    print("[*] POST /convert?src=ckl&dst=csv, GET /metrics, GET /healthz. Ctrl+C to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n[*] Shutting down")
+    finally:
+        server.close()
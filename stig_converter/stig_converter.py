@@ -6,10 +6,23 @@ and can fetch the latest STIG data from remote sources.
 Usage:
     stig_converter convert -i checklist.ckl -o report.csv
     stig_converter convert -i checklist.ckl -o findings.json
+    stig_converter convert -i checklist.ckl -o findings.jsonl
     stig_converter convert -i findings.json -o checklist.ckl --template-ckl template.ckl
     stig_converter convert -i findings.json -o report.md
+    stig_converter convert -i checklist.ckl -o r.csv -o r.json -o r.md -o r.cklb
+    stig_converter convert -i 'scans/**/*.ckl' -o out/ --to csv --jobs 8
+    stig_converter convert -i checklist.ckl -o report.csv --timings - --profile output/run.prof
+    stig_converter generate -i benchmark.zip --inventory hosts.csv -o out/ [--to cklb]
+    stig_converter synth -o output/stress.ckl --stigs 4 --rules 250000 --seed 1
+    stig_converter serve [--port 8765 | --socket /run/stig.sock] [--template asd=template.ckl]
+    stig_converter watch scans/ -o out/ --to csv,md [--jobs 4]
+    stig_converter ingest -i 'scans/**/*.ckl' -o output/fleet.sqlite
+    stig_converter diff old.ckl new.ckl [-o changes.json|changes.csv|changes.md]
+    stig_converter upgrade -i host.ckl --xccdf U_ASD_V6R4_STIG.zip -o host-V6R4.ckl
+    stig_converter upgrade -i 'scans/**/*.ckl' --xccdf U_ASD_V6R4_STIG.zip -o out/ --to ckl
     stig_converter fetch --json output.json
     stig_converter fetch --zip output.zip [--stig-sys ASD] [--stig-ver V6R4]
+    stig_converter fetch --manifest stigs.json [--dir data] [--concurrency 8]
     python -m stig_converter convert -i checklist.ckl -o report.csv
 """
 
@@ -23,11 +36,14 @@ from typing import Optional
 __version__ = "2.5"
 
 _SUPPORTED_CONVERSIONS = {
-    "ckl":  ["csv", "json", "md", "cklb"],
-    "cklb": ["ckl"],
-    "csv":  ["json"],
-    "json": ["ckl", "md"],
-    "xml":  ["ckl", "cklb"],
+    "ckl":    ["csv", "json", "jsonl", "ndjson", "md", "cklb", "sqlite"],
+    "cklb":   ["ckl", "sqlite"],
+    "csv":    ["json", "jsonl", "ndjson"],
+    "json":   ["ckl", "md"],
+    "jsonl":  ["ckl", "md"],
+    "ndjson": ["ckl", "md"],
+    "xml":    ["ckl", "cklb"],
+    "zip":    ["ckl", "cklb"],
 }
 
 
@@ -36,6 +52,14 @@ class ValidationError(Exception):
     pass
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def validate_file_conversion(input_path: Path, output_path: Path) -> None:
     """
     Validates that the conversion is supported and the paths are valid.
@@ -72,7 +96,10 @@ class STIGConverter:
 
     def __init__(self, args: argparse.Namespace) -> None:
         self.input_file_path: Path = args.input
-        self.output_file_path: Path = args.output
+        # -o may be given several times; the first target drives single-output dispatch
+        outputs = args.output if isinstance(args.output, list) else [args.output]
+        self.output_file_paths: list = outputs
+        self.output_file_path: Path = outputs[0]
         self.project_name: Optional[str] = getattr(args, "name", None)
         self.template_ckl: Optional[Path] = getattr(args, "template_ckl", None)
         self.date: str = datetime.now().strftime("%Y%m%d")
@@ -94,14 +121,26 @@ class STIGConverter:
     _DISPATCH: dict = {
         ("ckl",  "csv"):  "_ckl_to_csv",
         ("ckl",  "json"): "_ckl_to_json",
+        ("ckl",  "jsonl"): "_ckl_to_jsonl",
+        ("ckl",  "ndjson"): "_ckl_to_jsonl",
         ("ckl",  "md"):   "_ckl_to_md",
         ("ckl",  "cklb"): "_ckl_to_cklb",
+        ("ckl",  "sqlite"): "_ckl_to_sqlite",
         ("cklb", "ckl"):  "_cklb_to_ckl",
+        ("cklb", "sqlite"): "_ckl_to_sqlite",
         ("csv",  "json"): "_csv_to_json",
+        ("csv",  "jsonl"): "_csv_to_jsonl",
+        ("csv",  "ndjson"): "_csv_to_jsonl",
         ("json", "ckl"):  "_json_to_ckl",
         ("json", "md"):   "_json_to_md",
+        ("jsonl", "ckl"): "_jsonl_to_ckl",
+        ("jsonl", "md"):  "_jsonl_to_md",
+        ("ndjson", "ckl"): "_jsonl_to_ckl",
+        ("ndjson", "md"):  "_jsonl_to_md",
         ("xml",  "ckl"):  "_xccdf_to_ckl",
         ("xml",  "cklb"): "_xccdf_to_cklb",
+        ("zip",  "ckl"):  "_xccdf_to_ckl",
+        ("zip",  "cklb"): "_xccdf_to_cklb",
     }
 
     def convert(self) -> str:
@@ -111,7 +150,30 @@ class STIGConverter:
         method_name = self._DISPATCH.get((input_ext, output_ext))
         if not method_name:
             raise ValidationError(f"Unsupported conversion: {input_ext} → {output_ext}")
-        return getattr(self, method_name)()
+        from stig_converter.instrumentation import conversion
+        with conversion(self.input_file_path, self.output_file_path) as record:
+            created = getattr(self, method_name)()
+            if record is not None:
+                record.outputs = [created]
+        return created
+
+    def convert_all(self) -> list:
+        """
+        Convert the input to every requested output.
+        A single output goes through the regular (streaming) dispatch; several
+        outputs share one parse of the input via convert_to_many.
+        """
+        if len(self.output_file_paths) == 1:
+            return [self.convert()]
+        from stig_converter.converters.multi_output import convert_to_many
+        from stig_converter.instrumentation import conversion
+        with conversion(self.input_file_path, self.output_file_paths) as record:
+            created = convert_to_many(
+                self.input_file_path, self.output_file_paths, self.template_ckl
+            )
+            if record is not None:
+                record.outputs = created
+        return created
 
     # ------------------------------------------------------------------
     # Private conversion methods
@@ -137,6 +199,26 @@ class STIGConverter:
             self.input_file_path, self.output_file_path, self.template_ckl
         )
 
+    def _ckl_to_jsonl(self) -> str:
+        from stig_converter.converters.ckl_to_jsonl import convert_ckl_to_jsonl
+        return convert_ckl_to_jsonl(self.input_file_path, self.output_file_path)
+
+    def _csv_to_jsonl(self) -> str:
+        from stig_converter.converters.csv_to_jsonl import convert_csv_to_jsonl
+        return convert_csv_to_jsonl(self.input_file_path, self.output_file_path)
+
+    def _jsonl_to_ckl(self) -> str:
+        if not self.template_ckl:
+            raise ValidationError("--template-ckl is required for JSONL → CKL conversion")
+        from stig_converter.converters.jsonl_to_ckl import convert_jsonl_to_ckl
+        return convert_jsonl_to_ckl(
+            self.input_file_path, self.output_file_path, self.template_ckl
+        )
+
+    def _jsonl_to_md(self) -> str:
+        from stig_converter.converters.jsonl_to_markdown import convert_jsonl_to_md
+        return convert_jsonl_to_md(self.input_file_path, self.output_file_path)
+
     def _json_to_md(self) -> str:
         from stig_converter.converters.json_to_markdown import convert_json_to_md
         return convert_json_to_md(self.input_file_path, self.output_file_path)
@@ -153,6 +235,10 @@ class STIGConverter:
         from stig_converter.converters.cklb_to_ckl import convert_cklb_to_ckl
         return convert_cklb_to_ckl(self.input_file_path, self.output_file_path)
 
+    def _ckl_to_sqlite(self) -> str:
+        from stig_converter.converters.ckl_to_sqlite import convert_ckl_to_sqlite
+        return convert_ckl_to_sqlite(self.input_file_path, self.output_file_path)
+
     def _xccdf_to_ckl(self) -> str:
         from stig_converter.converters.xccdf_to_ckl import convert_xccdf_to_ckl
         return convert_xccdf_to_ckl(self.input_file_path, self.output_file_path)
@@ -172,8 +258,15 @@ def create_parser() -> argparse.ArgumentParser:
         description=(
             "Work with DISA STIG checklists: convert between formats or fetch the latest data.\n\n"
             "Subcommands:\n"
-            "  convert  Convert a checklist between CKL, CSV, JSON, and Markdown\n"
-            "  fetch    Download the latest STIG data from remote sources"
+            "  convert   Convert a checklist between CKL, CSV, JSON, and Markdown\n"
+            "  generate  Write one blank checklist per host from a benchmark and an inventory\n"
+            "  synth     Write a large synthetic checklist for scale and stress testing\n"
+            "  serve     Run a conversion service that keeps parsed inputs and workers warm\n"
+            "  watch     Re-convert checklists in a directory as they are added or changed\n"
+            "  ingest    Load many checklists into a SQLite database for fleet-wide queries\n"
+            "  diff      Report what changed between two checklists\n"
+            "  upgrade   Carry review results forward onto a new STIG release\n"
+            "  fetch     Download the latest STIG data from remote sources"
         ),
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
@@ -193,27 +286,37 @@ def create_parser() -> argparse.ArgumentParser:
         description=(
             "Convert DISA STIG checklists between CKL, CSV, JSON, and Markdown formats.\n\n"
             "Supported conversions:\n"
-            "  CKL  →  CSV, JSON, Markdown, CKLB\n"
-            "  CKLB →  CKL\n"
-            "  CSV  →  JSON\n"
-            "  JSON →  CKL, Markdown\n"
-            "  XML  →  CKL, CKLB  (DISA XCCDF Benchmark)\n\n"
+            "  CKL   →  CSV, JSON, JSONL, Markdown, CKLB, SQLite\n"
+            "  CKLB  →  CKL, SQLite\n"
+            "  CSV   →  JSON, JSONL\n"
+            "  JSON  →  CKL, Markdown\n"
+            "  JSONL →  CKL, Markdown  (.ndjson is accepted as an alias)\n"
+            "  XML   →  CKL, CKLB  (DISA XCCDF Benchmark)\n"
+            "  ZIP   →  CKL, CKLB  (DISA STIG package; the XCCDF is read in place)\n\n"
             "CKL is the XML-based checklist format used by DISA STIG Viewer.\n"
             "CKLB is the JSON-based checklist format used by DISA STIG Viewer 3+.\n"
             "XML (XCCDF) → CKL/CKLB produces a blank checklist with all findings set to Not_Reviewed.\n"
-            "JSON → CKL requires a --template-ckl file."
+            "JSONL writes one finding per line and is streamed in both directions.\n"
+            "JSON/JSONL → CKL requires a --template-ckl file.\n"
+            "SQLite output adds the checklist to the database (see the ingest command)."
         ),
         epilog=(
             "examples:\n"
             "  %(prog)s -i checklist.ckl -o report.csv\n"
             "  %(prog)s -i checklist.ckl -o findings.json\n"
             "  %(prog)s -i checklist.ckl -o report.md\n"
+            "  %(prog)s -i checklist.ckl -o findings.jsonl\n"
             "  %(prog)s -i findings.json -o checklist.ckl --template-ckl template.ckl\n"
             "  %(prog)s -i findings.json -o report.md\n"
             "  %(prog)s -i checklist.ckl -o checklist.cklb\n"
             "  %(prog)s -i checklist.cklb -o checklist.ckl\n"
+            "  %(prog)s -i checklist.ckl -o fleet.sqlite\n"
             "  %(prog)s -i benchmark.xml -o checklist.ckl\n"
             "  %(prog)s -i benchmark.xml -o checklist.cklb\n"
+            "  %(prog)s -i U_ASD_V6R4_STIG.zip -o checklist.ckl\n"
+            "  %(prog)s -i checklist.ckl -o r.csv -o r.json -o r.md -o r.cklb\n"
+            "  %(prog)s -i 'scans/**/*.ckl' -o out/ --to csv --jobs 8\n"
+            "  %(prog)s -i checklist.ckl -o report.csv --timings - --profile output/run.prof\n"
         ),
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
@@ -222,14 +325,21 @@ def create_parser() -> argparse.ArgumentParser:
         type=Path,
         required=True,
         metavar="FILE",
-        help="input file (.ckl, .cklb, .csv, .json, .xml)",
+        help=(
+            "input file (.ckl, .cklb, .csv, .json, .jsonl, .xml, .zip); "
+            "with --to, a directory or glob"
+        ),
     )
     convert_parser.add_argument(
         "-o", "--output",
         type=Path,
+        action="append",
         required=True,
         metavar="FILE",
-        help="output file (.csv, .json, .ckl, .md)",
+        help=(
+            "output file (.csv, .json, .jsonl, .ckl, .md, .sqlite); repeat to write several "
+            "formats from one parse; with --to, an output directory"
+        ),
     )
     convert_parser.add_argument(
         "-n", "--name",
@@ -241,7 +351,423 @@ def create_parser() -> argparse.ArgumentParser:
         dest="template_ckl",
         type=Path,
         metavar="FILE",
-        help="CKL template file (required for JSON → CKL)",
+        help="CKL template file (required for JSON/JSONL → CKL)",
+    )
+    convert_parser.add_argument(
+        "--to",
+        choices=sorted({ext for outputs in _SUPPORTED_CONVERSIONS.values() for ext in outputs}),
+        metavar="FORMAT",
+        help="batch mode: convert every matching input to FORMAT inside the -o directory",
+    )
+    convert_parser.add_argument(
+        "-j", "--jobs",
+        type=_positive_int,
+        metavar="N",
+        help="batch mode: number of worker processes (default: CPU count)",
+    )
+    convert_parser.add_argument(
+        "--timings",
+        metavar="FILE",
+        help=(
+            "write per-stage timings, rule/STIG counts and bytes in/out as JSON to FILE "
+            "('-' for stdout; progress messages then go to stderr)"
+        ),
+    )
+    convert_parser.add_argument(
+        "--profile",
+        metavar="FILE",
+        help="write cProfile statistics for the run to FILE (view with python -m pstats FILE)",
+    )
+
+    # -- generate subcommand -----------------------------------------------
+    generate_parser = subparsers.add_parser(
+        "generate",
+        help="write one blank checklist per host from a benchmark and an inventory",
+        description=(
+            "Generate a checklist per host for an enclave.\n\n"
+            "The source is an XCCDF benchmark (.xml or DISA STIG .zip) or a CKL/CKLB template.\n"
+            "The inventory is a CSV with a HOST_NAME column and optionally HOST_IP, HOST_MAC,\n"
+            "HOST_FQDN, TARGET_COMMENT, ROLE, TECH_AREA, ... (any CKL ASSET field).\n"
+            "The rule body is rendered once and shared; only the asset section differs per host."
+        ),
+        epilog=(
+            "examples:\n"
+            "  %(prog)s -i U_ASD_V6R4_STIG.zip --inventory hosts.csv -o output/enclave/\n"
+            "  %(prog)s -i template.ckl --inventory hosts.csv -o output/enclave/ --to cklb\n"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    generate_parser.add_argument(
+        "-i", "--input",
+        type=Path,
+        required=True,
+        metavar="FILE",
+        help="benchmark or template (.xml, .zip, .ckl, .cklb)",
+    )
+    generate_parser.add_argument(
+        "--inventory",
+        type=Path,
+        required=True,
+        metavar="CSV",
+        help="inventory CSV with one row per host",
+    )
+    generate_parser.add_argument(
+        "-o", "--output",
+        type=Path,
+        required=True,
+        metavar="DIR",
+        help="output directory; files are named <HOST_NAME>.<format>",
+    )
+    generate_parser.add_argument(
+        "--to",
+        choices=["ckl", "cklb"],
+        default="ckl",
+        metavar="FORMAT",
+        help="checklist format to write: ckl or cklb (default: ckl)",
+    )
+
+    # -- synth subcommand --------------------------------------------------
+    synth_parser = subparsers.add_parser(
+        "synth",
+        help="write a large synthetic checklist for scale and stress testing",
+        description=(
+            "Stream a synthetic, schema-valid checklist of any size.\n\n"
+            "The format follows the output suffix: .ckl, .cklb, .csv, .json, .jsonl/.ndjson\n"
+            "findings, or .xml for an XCCDF benchmark (single STIG only).\n"
+            "Rules are generated on the fly, so memory stays flat at millions of VULNs,\n"
+            "and the same arguments always produce the same bytes."
+        ),
+        epilog=(
+            "examples:\n"
+            "  %(prog)s -o output/stress.ckl --stigs 4 --rules 250000 --seed 1\n"
+            "  %(prog)s -o output/open-heavy.cklb --status Open=0.6,NotAFinding=0.4\n"
+            "  %(prog)s -o output/benchmark.xml --rules 5000 --severity high=1,medium=1,low=1\n"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    synth_parser.add_argument(
+        "-o", "--output",
+        type=Path,
+        required=True,
+        metavar="FILE",
+        help="output file (.ckl, .cklb, .csv, .json, .jsonl, .ndjson, .xml)",
+    )
+    synth_parser.add_argument(
+        "--stigs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="number of iSTIGs in the checklist (default: 1)",
+    )
+    synth_parser.add_argument(
+        "--rules",
+        type=int,
+        default=1000,
+        metavar="N",
+        help="VULNs per iSTIG (default: 1000)",
+    )
+    synth_parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        metavar="N",
+        help="random seed; the same seed gives identical output (default: 0)",
+    )
+    synth_parser.add_argument(
+        "--status",
+        metavar="MIX",
+        help="STATUS ratios, e.g. Open=0.2,NotAFinding=0.6,Not_Applicable=0.05,Not_Reviewed=0.15",
+    )
+    synth_parser.add_argument(
+        "--severity",
+        metavar="MIX",
+        help="severity ratios, e.g. high=0.1,medium=0.7,low=0.2",
+    )
+
+    # -- serve subcommand --------------------------------------------------
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="run a local conversion service that keeps parsed inputs and workers warm",
+        description=(
+            "Run a long-lived HTTP conversion service on a local port or Unix socket.\n\n"
+            "  POST /convert?src=ckl&dst=csv   request body in, converted document out\n"
+            "       optional: &template=NAME (JSON/JSONL → CKL), &title=..., &date=YYYYMMDD\n"
+            "  GET  /metrics                   request counts, latency percentiles, throughput\n"
+            "  GET  /healthz                   liveness check\n\n"
+            "Worker processes start once with the converters imported and the --template\n"
+            "files parsed; uploaded XCCDF benchmarks stay compiled in memory between requests."
+        ),
+        epilog=(
+            "examples:\n"
+            "  %(prog)s --port 8765 --template asd=data/template.ckl\n"
+            "  %(prog)s --socket /tmp/stig_converter.sock --workers 4\n"
+            "  curl --data-binary @checklist.ckl 'http://127.0.0.1:8765/convert?src=ckl&dst=cklb'\n"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    serve_parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        metavar="ADDR",
+        help="address to listen on (default: 127.0.0.1)",
+    )
+    serve_parser.add_argument(
+        "--port",
+        type=int,
+        default=8765,
+        metavar="N",
+        help="TCP port to listen on (default: 8765)",
+    )
+    serve_parser.add_argument(
+        "--socket",
+        dest="socket_path",
+        metavar="PATH",
+        help="listen on a Unix domain socket instead of a TCP port",
+    )
+    serve_parser.add_argument(
+        "--workers",
+        type=int,
+        metavar="N",
+        help="conversion worker processes (default: CPU count; 0 converts in the request threads)",
+    )
+    serve_parser.add_argument(
+        "--template",
+        dest="templates",
+        action="append",
+        default=[],
+        metavar="NAME=FILE",
+        help="CKL template to keep parsed, used as ?template=NAME (repeatable)",
+    )
+    serve_parser.add_argument(
+        "--access-log",
+        action="store_true",
+        help="log every request to stderr",
+    )
+
+    # -- watch subcommand --------------------------------------------------
+    watch_parser = subparsers.add_parser(
+        "watch",
+        help="re-convert checklists in a directory as they are added or changed",
+        description=(
+            "Watch a directory tree for new or modified .ckl/.cklb files and convert\n"
+            "each one to every --to format, mirroring the tree under the output directory.\n\n"
+            "A file is converted once its writes have settled, and only when its content\n"
+            "changed: a manifest of SHA-256 hashes in the output directory lets a restarted\n"
+            "watcher skip everything it has already converted."
+        ),
+        epilog=(
+            "examples:\n"
+            "  %(prog)s scans/ -o out/ --to csv,md\n"
+            "  %(prog)s scans/ -o out/ --to cklb,json --jobs 4 --settle 5\n"
+            "  %(prog)s scans/ -o out/ --to csv --once\n"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    watch_parser.add_argument(
+        "directory",
+        type=Path,
+        metavar="DIR",
+        help="directory tree to watch",
+    )
+    watch_parser.add_argument(
+        "-o", "--output",
+        type=Path,
+        required=True,
+        metavar="DIR",
+        help="output directory",
+    )
+    watch_parser.add_argument(
+        "--to",
+        required=True,
+        metavar="FORMATS",
+        help=(
+            "comma-separated output formats, e.g. csv,md "
+            "(csv, json, jsonl, ndjson, md, ckl, cklb)"
+        ),
+    )
+    watch_parser.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        metavar="SECONDS",
+        help="seconds between scans (default: 1)",
+    )
+    watch_parser.add_argument(
+        "--settle",
+        type=float,
+        default=2.0,
+        metavar="SECONDS",
+        help="seconds a file must go unmodified before it is converted (default: 2)",
+    )
+    watch_parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        metavar="N",
+        help="worker processes (default: CPU count)",
+    )
+    watch_parser.add_argument(
+        "--manifest",
+        dest="watch_manifest",
+        type=Path,
+        metavar="FILE",
+        help="manifest of converted files (default: OUTPUT/.stig_converter-watch.json)",
+    )
+    watch_parser.add_argument(
+        "--once",
+        action="store_true",
+        help="convert what changed since the last run, then exit",
+    )
+
+    # -- ingest subcommand -------------------------------------------------
+    ingest_parser = subparsers.add_parser(
+        "ingest",
+        help="load many checklists into a SQLite database for fleet-wide queries",
+        description=(
+            "Bulk-load .ckl/.cklb checklists into a normalized SQLite database.\n\n"
+            "Tables: assets, stigs, rules (rule text, stored once per STIG release),\n"
+            "checklists and findings (STATUS, FINDING_DETAILS, COMMENTS per host and rule).\n"
+            "Vuln_Num, Rule_ID, STATUS and HOST_NAME are indexed, and the fleet_findings\n"
+            "view joins them back into one row per host and rule.\n\n"
+            "Unchanged files already in the database are skipped; changed files replace\n"
+            "their earlier rows."
+        ),
+        epilog=(
+            "examples:\n"
+            "  %(prog)s -i 'scans/**/*.ckl' -o output/fleet.sqlite\n"
+            "  %(prog)s -i scans/ -i archive/host1.cklb -o output/fleet.sqlite --jobs 8\n"
+            "  sqlite3 output/fleet.sqlite \"SELECT HOST_NAME FROM fleet_findings "
+            "WHERE Vuln_Num = 'V-222400' AND STATUS = 'Open'\"\n"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    ingest_parser.add_argument(
+        "-i", "--input",
+        type=Path,
+        action="append",
+        required=True,
+        metavar="PATH",
+        help="checklist file, directory (searched recursively) or glob; repeatable",
+    )
+    ingest_parser.add_argument(
+        "-o", "--output",
+        type=Path,
+        required=True,
+        metavar="FILE",
+        help="SQLite database to create or add to",
+    )
+    ingest_parser.add_argument(
+        "-j", "--jobs",
+        type=_positive_int,
+        metavar="N",
+        help="number of parser processes (default: CPU count)",
+    )
+    ingest_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="reload checklists even if their content is unchanged",
+    )
+
+    # -- diff subcommand ---------------------------------------------------
+    diff_parser = subparsers.add_parser(
+        "diff",
+        help="report what changed between two checklists",
+        description=(
+            "Compare two checklists rule by rule, matched on Vuln_Num (or Rule_ID).\n\n"
+            "Reports status transitions, added and removed rules, and changed Rule_ID,\n"
+            "Severity, FINDING_DETAILS and COMMENTS. Either side may be a CKL, CKLB,\n"
+            "XCCDF (.xml/.zip) or a CSV/JSON/JSONL findings file.\n"
+            "The report format follows the -o suffix (.json, .csv or .md); without -o a\n"
+            "Markdown report is printed."
+        ),
+        epilog=(
+            "examples:\n"
+            "  %(prog)s 2026Q2/web01.ckl 2026Q3/web01.ckl\n"
+            "  %(prog)s old.cklb new.ckl -o output/changes.csv\n"
+            "  %(prog)s data/U_ASD_V6R3_STIG.zip data/U_ASD_V6R4_STIG.zip -o output/release.md\n"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    diff_parser.add_argument(
+        "old",
+        type=Path,
+        metavar="OLD",
+        help="earlier checklist or findings file",
+    )
+    diff_parser.add_argument(
+        "new",
+        type=Path,
+        metavar="NEW",
+        help="later checklist or findings file",
+    )
+    diff_parser.add_argument(
+        "-o", "--output",
+        type=Path,
+        metavar="FILE",
+        help="write the report to FILE (.json, .csv or .md) instead of printing it",
+    )
+
+    # -- upgrade subcommand ------------------------------------------------
+    upgrade_parser = subparsers.add_parser(
+        "upgrade",
+        help="carry review results forward onto a new STIG release",
+        description=(
+            "Generate checklists for a new STIG release from existing ones.\n\n"
+            "The new release's blank checklist is built from its XCCDF, and each rule takes\n"
+            "STATUS, FINDING_DETAILS, COMMENTS and the severity override of its old\n"
+            "counterpart, matched on Vuln_Num, then the Rule_ID without its revision,\n"
+            "then Rule_Ver, then LEGACY_ID. New rules without a counterpart stay\n"
+            "Not_Reviewed; reviewed rules missing from the new release are reported.\n"
+            "Other STIGs of a merged checklist are kept unchanged."
+        ),
+        epilog=(
+            "examples:\n"
+            "  %(prog)s -i web01.ckl --xccdf data/U_ASD_STIG_V6R4_Manual-xccdf.xml "
+            "-o output/web01.ckl\n"
+            "  %(prog)s -i web01.cklb --xccdf U_ASD_V6R4_STIG.zip -o output/web01.cklb "
+            "--report output/up.json\n"
+            "  %(prog)s -i 'scans/**/*.ckl' --xccdf U_ASD_V6R4_STIG.zip -o output/V6R4/ "
+            "--to ckl --jobs 8\n"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    upgrade_parser.add_argument(
+        "-i", "--input",
+        type=Path,
+        required=True,
+        metavar="FILE",
+        help="existing .ckl/.cklb checklist; with --to, a directory or glob",
+    )
+    upgrade_parser.add_argument(
+        "--xccdf",
+        type=Path,
+        required=True,
+        metavar="FILE",
+        help="new release as an XCCDF .xml or DISA STIG .zip",
+    )
+    upgrade_parser.add_argument(
+        "-o", "--output",
+        type=Path,
+        required=True,
+        metavar="FILE",
+        help="output .ckl/.cklb; with --to, an output directory",
+    )
+    upgrade_parser.add_argument(
+        "--to",
+        choices=["ckl", "cklb"],
+        metavar="FORMAT",
+        help="batch mode: upgrade every checklist under -i into the -o directory as FORMAT",
+    )
+    upgrade_parser.add_argument(
+        "-j", "--jobs",
+        type=_positive_int,
+        metavar="N",
+        help="batch mode: number of worker processes (default: CPU count)",
+    )
+    upgrade_parser.add_argument(
+        "--report",
+        type=Path,
+        metavar="FILE",
+        help="write matched and unmatched rules per checklist as JSON to FILE",
     )
 
     # -- fetch subcommand --------------------------------------------------
@@ -251,14 +777,18 @@ def create_parser() -> argparse.ArgumentParser:
         description=(
             "Download the latest STIG data.\n\n"
             "  --json  Fetches the ASD STIG checklist from stigviewer.com as JSON.\n"
-            "  --zip   Downloads the official STIG package from DISA Cyber Exchange as ZIP.\n\n"
-            "Exactly one of --json or --zip must be provided."
+            "  --zip   Downloads the official STIG package from DISA Cyber Exchange as ZIP.\n"
+            "  --manifest  Downloads every STIG listed in a JSON manifest concurrently.\n\n"
+            'Manifest entries are {"stig_sys": "ASD", "stig_ver": "V6R4"} for DISA packages\n'
+            'or {"slug": "application_security_and_development"} for stigviewer.com JSON.\n\n'
+            "Exactly one of --json, --zip or --manifest must be provided."
         ),
         epilog=(
             "examples:\n"
             "  %(prog)s --json data/latest_stigs.json\n"
             "  %(prog)s --zip data/U_ASD_V6R4_STIG.zip\n"
             "  %(prog)s --zip data/U_ASD_V6R4_STIG.zip --stig-sys ASD --stig-ver V6R4\n"
+            "  %(prog)s --manifest data/stigs.json --dir data --concurrency 8\n"
         ),
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
@@ -275,6 +805,12 @@ def create_parser() -> argparse.ArgumentParser:
         metavar="FILE",
         help="output path for the downloaded ZIP file (from DISA Cyber Exchange)",
     )
+    fetch_group.add_argument(
+        "--manifest",
+        dest="fetch_manifest",
+        metavar="FILE",
+        help="JSON manifest of STIGs to download concurrently into --dir",
+    )
     fetch_parser.add_argument(
         "--stig-sys",
         dest="stig_sys",
@@ -289,6 +825,20 @@ def create_parser() -> argparse.ArgumentParser:
         metavar="VER",
         help="STIG version for ZIP download (default: V6R4)",
     )
+    fetch_parser.add_argument(
+        "--dir",
+        dest="fetch_dir",
+        default="data",
+        metavar="DIR",
+        help="manifest mode: directory the downloads are written to (default: data)",
+    )
+    fetch_parser.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=4,
+        metavar="N",
+        help="manifest mode: maximum simultaneous downloads (default: 4)",
+    )
 
     return parser
 
@@ -296,9 +846,24 @@ def create_parser() -> argparse.ArgumentParser:
 def parse_args(args: Optional[list] = None) -> argparse.Namespace:
     parser = create_parser()
     parsed = parser.parse_args(args)
-    if parsed.command == "convert":
+    if parsed.command == "convert" and parsed.to is not None:
+        if len(parsed.output) > 1:
+            parser.error("batch mode (--to) takes a single -o output directory")
+        if parsed.timings or parsed.profile:
+            parser.error("--timings and --profile are not supported in batch mode (--to)")
+        parsed.output = parsed.output[0]
+    elif parsed.command == "serve" and any("=" not in t for t in parsed.templates):
+        parser.error("--template expects NAME=FILE")
+    elif parsed.command == "watch":
+        from stig_converter.watch import parse_formats
+        try:
+            parsed.to = parse_formats(parsed.to)
+        except ValueError as e:
+            parser.error(str(e))
+    elif parsed.command == "convert":
         try:
-            validate_file_conversion(parsed.input, parsed.output)
+            for output in parsed.output:
+                validate_file_conversion(parsed.input, output)
         except ValidationError as e:
             parser.error(str(e))
     return parsed
@@ -311,12 +876,83 @@ def main() -> None:
         sys.exit(0)
     args = parse_args()
     try:
-        if args.command == "convert":
+        if args.command == "convert" and args.to:
+            from stig_converter.batch import convert_batch
+            results = convert_batch(
+                args.input, args.output, args.to, jobs=args.jobs, template_ckl=args.template_ckl
+            )
+            if not all(r.ok for r in results):
+                sys.exit(1)
+        elif args.command == "convert":
+            from stig_converter.instrumentation import run
             converter = STIGConverter(args)
-            converter.convert()
+            run(converter.convert_all, timings_path=args.timings, profile_path=args.profile)
+        elif args.command == "generate":
+            from stig_converter.generate import generate_checklists
+            generate_checklists(args.input, args.inventory, args.output, args.to)
+        elif args.command == "synth":
+            from stig_converter.converters.model import CKL_TO_CKLB_STATUS
+            from stig_converter.synth import DEFAULT_SEVERITY_MIX, parse_mix, write_synth
+            write_synth(
+                args.output,
+                stigs=args.stigs,
+                rules=args.rules,
+                seed=args.seed,
+                status_mix=parse_mix(args.status, CKL_TO_CKLB_STATUS) if args.status else None,
+                severity_mix=(
+                    parse_mix(args.severity, DEFAULT_SEVERITY_MIX) if args.severity else None
+                ),
+            )
+        elif args.command == "serve":
+            from stig_converter.serve import serve
+            serve(
+                host=args.host,
+                port=args.port,
+                socket_path=args.socket_path,
+                workers=args.workers,
+                templates=dict(t.split("=", 1) for t in args.templates),
+                access_log=args.access_log,
+            )
+        elif args.command == "watch":
+            from stig_converter.watch import watch
+            results = watch(
+                args.directory,
+                args.output,
+                args.to,
+                interval=args.interval,
+                settle=args.settle,
+                jobs=args.jobs,
+                manifest_path=args.watch_manifest,
+                once=args.once,
+            )
+            if not all(r.ok for r in results):
+                sys.exit(1)
+        elif args.command == "ingest":
+            from stig_converter.ingest import ingest
+            results = ingest(args.input, args.output, jobs=args.jobs, force=args.force)
+            if not all(r.ok for r in results):
+                sys.exit(1)
+        elif args.command == "diff":
+            from stig_converter.diff import diff
+            diff(args.old, args.new, args.output)
+        elif args.command == "upgrade":
+            from stig_converter.upgrade import upgrade
+            results = upgrade(
+                args.input, args.xccdf, args.output,
+                to_ext=args.to, jobs=args.jobs, report_path=args.report,
+            )
+            if not all(r.ok for r in results):
+                sys.exit(1)
         elif args.command == "fetch":
             from stig_converter.get_new_stigs import get_stig_json, get_stig_zip
-            if args.fetch_json:
+            if args.fetch_manifest:
+                from stig_converter.fetch_many import fetch_manifest
+                results = fetch_manifest(
+                    args.fetch_manifest, args.fetch_dir, concurrency=args.concurrency
+                )
+                if any(r.status == "failed" for r in results):
+                    sys.exit(1)
+            elif args.fetch_json:
                 get_stig_json(args.fetch_json)
             else:
                 get_stig_zip(args.fetch_zip, stig_sys=args.stig_sys, stig_ver=args.stig_ver)
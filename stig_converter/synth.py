@@ -0,0 +1,331 @@
+# synth.py
+# Deterministic synthetic checklists of any size for scale and stress testing
+
+import itertools
+import math
+import random
+import time
+import uuid
+from pathlib import Path
+
+from stig_converter.converters.model import (
+    CKLB_TO_CKL_STATUS,
+    Asset,
+    Checklist,
+    Rule,
+    Stig,
+)
+from stig_converter.converters.writers import _encode, _escape
+from stig_converter.security_utils import get_default_allowed_dirs, validate_output_path
+
+# Output extensions synth can write; the format is taken from the file suffix
+SYNTH_FORMATS = ("ckl", "cklb", "csv", "json", "jsonl", "ndjson", "xml")
+
+# Default STATUS and severity proportions, roughly those of a partly reviewed checklist
+DEFAULT_STATUS_MIX = {
+    "NotAFinding": 0.55, "Open": 0.15, "Not_Applicable": 0.05, "Not_Reviewed": 0.25
+}
+DEFAULT_SEVERITY_MIX = {"high": 0.1, "medium": 0.7, "low": 0.2}
+
+# Fixed so that the same seed always produces the same bytes
+SYNTH_DATE = "20260101"
+
+# Median lengths (characters) of the free-text fields, taken from the ASD STIG
+_FIELD_LENGTHS = {
+    "rule_title": 90,
+    "vuln_discuss": 650,
+    "check_content": 550,
+    "fix_text": 250,
+    "finding_details": 180,
+    "comments": 70,
+}
+
+_WORDS = (
+    "the application must configure session audit records account access control "
+    "privileged user authentication certificate server database log retention "
+    "policy system administrator verify that is not if this a finding review "
+    "documentation ensure encryption TLS FIPS 140-2 validated module DOD PKI "
+    "&amp; R&D \"quoted\" /etc/ssh/sshd_config C:\\Windows\\System32 -> >= "
+    "password complexity lockout after three consecutive invalid attempts within "
+    "minutes protect confidentiality integrity of transmitted information"
+).split()
+
+_CORPUS_SIZE = 1 << 16
+
+_XCCDF_NS = "http://checklists.nist.gov/xccdf/1.1"
+
+# Description sub-tags in the order DISA writes them
+_XCCDF_DESC_TAGS = (
+    ("VulnDiscussion", "vuln_discuss"),
+    ("FalsePositives", "false_positives"),
+    ("FalseNegatives", "false_negatives"),
+    ("Documentable", "documentable"),
+    ("Mitigations", "mitigations"),
+    ("SeverityOverrideGuidance", "security_override_guidance"),
+    ("PotentialImpacts", "potential_impact"),
+    ("ThirdPartyTools", "third_party_tools"),
+    ("MitigationControl", "mitigation_control"),
+    ("Responsibility", "responsibility"),
+    ("IAControls", "ia_controls"),
+)
+
+
+def parse_mix(text: str, allowed) -> dict:
+    """
+    Parse a "NAME=WEIGHT,NAME=WEIGHT" ratio string into normalized proportions.
+    STATUS names may use either the CKL or the CKLB spelling.
+    :param text: e.g. "Open=0.3,NotAFinding=0.7"
+    :param allowed: Accepted names
+    :return: dict of name → proportion summing to 1
+    """
+    mix = {}
+    for part in filter(None, (p.strip() for p in text.split(","))):
+        name, sep, weight = part.partition("=")
+        name = CKLB_TO_CKL_STATUS.get(name.strip(), name.strip())
+        if not sep or name not in allowed:
+            raise ValueError(
+                f"Invalid ratio '{part}'. Expected NAME=WEIGHT with NAME in: {', '.join(allowed)}"
+            )
+        try:
+            value = float(weight)
+        except ValueError:
+            raise ValueError(f"Invalid weight in '{part}'") from None
+        if value < 0 or not math.isfinite(value):
+            raise ValueError(f"Invalid weight in '{part}'")
+        mix[name] = mix.get(name, 0.0) + value
+    total = sum(mix.values())
+    if total <= 0:
+        raise ValueError(f"Ratio '{text}' has no positive weight")
+    return {name: value / total for name, value in mix.items()}
+
+
+class _Text:
+    """Slices of a seeded word corpus with log-normally distributed lengths."""
+
+    def __init__(self, seed) -> None:
+        rng = random.Random(f"{seed}:corpus")
+        words = []
+        size = 0
+        while size < _CORPUS_SIZE:
+            word = rng.choice(_WORDS)
+            words.append(word + ("\n\n" if rng.random() < 0.03 else " "))
+            size += len(words[-1])
+        self.corpus = "".join(words)
+
+    def take(self, rng: random.Random, median: int) -> str:
+        length = min(int(rng.lognormvariate(math.log(median), 0.5)) + 1, _CORPUS_SIZE // 4)
+        start = rng.randrange(len(self.corpus) - length)
+        return self.corpus[start:start + length].strip() or "x"
+
+
+class _SynthRules:
+    """
+    A STIG's rules, generated afresh on every iteration instead of being stored.
+    Sized so writers that need the rule count up front (CKLB "size") can ask for it.
+    """
+
+    __slots__ = ("stig", "index", "count", "seed", "text", "statuses", "severities")
+
+    def __init__(self, stig, index, count, seed, text, statuses, severities) -> None:
+        self.stig = stig
+        self.index = index
+        self.count = count
+        self.seed = seed
+        self.text = text
+        self.statuses = statuses
+        self.severities = severities
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self):
+        rng = random.Random(f"{self.seed}:{self.index}")
+        take = self.text.take
+        stig_ref = self.stig.stig_ref
+        status_names, status_weights = self.statuses
+        severity_names, severity_weights = self.severities
+        prefix = f"SYN-{self.index + 1:02d}"
+        base = (self.index + 1) * 10_000_000
+
+        for i in range(self.count):
+            number = base + i
+            status = rng.choices(status_names, cum_weights=status_weights)[0]
+            rule = Rule(
+                vuln_num=f"V-{number}",
+                severity=rng.choices(severity_names, cum_weights=severity_weights)[0],
+                group_title=f"SRG-APP-{rng.randrange(1000):06d}",
+                rule_id=f"SV-{number}r{rng.randrange(1, 1_000_000)}_rule",
+                rule_ver=f"{prefix}-{i + 1:06d}",
+                rule_title=take(rng, _FIELD_LENGTHS["rule_title"]),
+                vuln_discuss=take(rng, _FIELD_LENGTHS["vuln_discuss"]),
+                check_content=take(rng, _FIELD_LENGTHS["check_content"]),
+                fix_text=take(rng, _FIELD_LENGTHS["fix_text"]),
+                check_content_ref="M",
+                stig_ref=stig_ref,
+                stig_uuid=self.stig.uuid,
+                uuid=str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+                status=status,
+            )
+            rule.legacy_ids = [
+                f"V-{rng.randrange(10000, 100000)}", f"SV-{rng.randrange(10000, 100000)}"
+            ]
+            rule.ccis = [f"CCI-{rng.randrange(1, 3500):06d}" for _ in range(rng.randint(1, 3))]
+            if status != "Not_Reviewed":
+                rule.finding_details = take(rng, _FIELD_LENGTHS["finding_details"])
+            if rng.random() < 0.3:
+                rule.comments = take(rng, _FIELD_LENGTHS["comments"])
+            yield rule
+
+
+def _cumulative(mix: dict):
+    names = list(mix)
+    return names, list(itertools.accumulate(mix[n] for n in names))
+
+
+def synth_checklist(
+    stigs: int = 1,
+    rules: int = 1000,
+    seed: int = 0,
+    status_mix: dict = None,
+    severity_mix: dict = None,
+) -> Checklist:
+    """
+    Build a synthetic Checklist whose rules are generated lazily.
+    Nothing per rule is kept in memory: every iteration over stig.rules
+    regenerates the same rules from the seed, so any streaming writer
+    (write_ckl, write_cklb, write_findings_*) runs in constant memory.
+    :param stigs: Number of iSTIGs
+    :param rules: VULNs per iSTIG
+    :param seed: Same seed, same checklist
+    :param status_mix: CKL STATUS → proportion (default DEFAULT_STATUS_MIX)
+    :param severity_mix: severity → proportion (default DEFAULT_SEVERITY_MIX)
+    :return: Checklist with lazily generated rules
+    """
+    if stigs < 1 or rules < 0:
+        raise ValueError("stigs must be at least 1 and rules must not be negative")
+    statuses = _cumulative(status_mix or DEFAULT_STATUS_MIX)
+    severities = _cumulative(severity_mix or DEFAULT_SEVERITY_MIX)
+    text = _Text(seed)
+    rng = random.Random(f"{seed}:checklist")
+
+    checklist = Checklist(
+        title=f"synthetic-{seed}",
+        id=str(uuid.uuid5(uuid.NAMESPACE_DNS, f"synthetic-{seed}")),
+        asset=Asset(
+            host_name=f"synth-{seed}",
+            host_ip=f"10.{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(1, 255)}",
+            host_mac=":".join(f"{rng.randrange(256):02X}" for _ in range(6)),
+            host_fqdn=f"synth-{seed}.example.mil",
+        ),
+    )
+    for index in range(stigs):
+        stig_id = f"Synthetic_{index + 1:02d}_STIG"
+        stig = Stig(
+            stig_id=stig_id,
+            title=f"Synthetic {index + 1:02d} Security Technical Implementation Guide",
+            version=str(rng.randint(1, 9)),
+            release_info=f"Release: {rng.randint(1, 12)} Benchmark Date: 01 Jan 2026",
+            uuid=str(uuid.uuid5(uuid.NAMESPACE_DNS, f"{stig_id}:{seed}")),
+        )
+        stig.rules = _SynthRules(stig, index, rules, seed, text, statuses, severities)
+        checklist.stigs.append(stig)
+    return checklist
+
+
+def _xccdf_group(rule) -> str:
+    description = "".join(
+        f"<{tag}>{getattr(rule, slot)}</{tag}>" for tag, slot in _XCCDF_DESC_TAGS
+    )
+    idents = [f'<ident system="http://cyber.mil/legacy">{i}</ident>' for i in rule.legacy_ids]
+    idents += [f'<ident system="http://cyber.mil/cci">{c}</ident>' for c in rule.ccis]
+    fix_id = "F-" + rule.rule_id.removeprefix("SV-").removesuffix("_rule")
+    return (
+        f'<Group id="{rule.vuln_num}"><title>{_escape(rule.group_title)}</title>'
+        f"<description>&lt;GroupDescription&gt;&lt;/GroupDescription&gt;</description>"
+        f'<Rule id="{rule.rule_id}" weight="{rule.weight}" severity="{rule.severity}">'
+        f"<version>{_escape(rule.rule_ver)}</version><title>{_escape(rule.rule_title)}</title>"
+        f"<description>{_escape(description)}</description>{''.join(idents)}"
+        f'<fixtext fixref="{fix_id}">{_escape(rule.fix_text)}</fixtext><fix id="{fix_id}" />'
+        f'<check system="C-{fix_id[2:]}"><check-content-ref href="Synthetic.xml" name="M" />'
+        f"<check-content>{_escape(rule.check_content)}</check-content></check></Rule></Group>\n"
+    )
+
+
+def write_xccdf(checklist: Checklist, fp) -> None:
+    """
+    Write a single-STIG Checklist as a DISA-style XCCDF 1.1 Benchmark, one Group at a time.
+    Review results (STATUS, details, comments) have no place in a benchmark and are dropped.
+    :param fp: Binary file opened for writing
+    """
+    if len(checklist.stigs) != 1:
+        raise ValueError("An XCCDF benchmark holds exactly one STIG")
+    stig = checklist.stigs[0]
+    fp.write(_encode(
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        f'<Benchmark xmlns="{_XCCDF_NS}" id="{stig.stig_id}" xml:lang="en">\n'
+        f'<status date="2026-01-01">accepted</status><title>{_escape(stig.title)}</title>\n'
+        f'<plain-text id="release-info">{_escape(stig.release_info)}</plain-text>'
+        f"<version>{_escape(stig.version)}</version>\n"
+    ))
+    for rule in stig.rules:
+        fp.write(_encode(_xccdf_group(rule)))
+    fp.write(b"</Benchmark>\n")
+
+
+def write_synth(
+    output_path,
+    stigs: int = 1,
+    rules: int = 1000,
+    seed: int = 0,
+    status_mix: dict = None,
+    severity_mix: dict = None,
+) -> str:
+    """
+    Stream a synthetic checklist to disk in the format given by the file suffix
+    (.ckl, .cklb, .csv, .json, .jsonl/.ndjson findings, or .xml XCCDF benchmark).
+    Memory stays flat regardless of size and the bytes depend only on the arguments.
+    :param output_path: Output file path
+    :return: Path to the created file
+    """
+    output_path = Path(output_path)
+    output_format = output_path.suffix[1:].lower()
+    if output_format not in SYNTH_FORMATS:
+        raise ValueError(
+            f"Unsupported output format '{output_format}'. Supported: {', '.join(SYNTH_FORMATS)}"
+        )
+    checklist = synth_checklist(stigs, rules, seed, status_mix, severity_mix)
+    if output_format == "xml" and stigs != 1:
+        raise ValueError("An XCCDF benchmark holds exactly one STIG; use --stigs 1 for .xml output")
+    path = validate_output_path(output_path, allowed_dirs=get_default_allowed_dirs())
+
+    print(f"[*] Synthesizing {stigs * rules} VULN(s) across {stigs} STIG(s) (seed {seed}) → {path}")
+    start = time.perf_counter()
+
+    if output_format == "ckl":
+        from stig_converter.converters.writers import write_ckl
+        with open(path, "wb") as f:
+            write_ckl(checklist, f)
+    elif output_format == "xml":
+        with open(path, "wb") as f:
+            write_xccdf(checklist, f)
+    elif output_format == "cklb":
+        from stig_converter.converters.writers import write_cklb
+        with open(path, "w", encoding="utf-8") as f:
+            write_cklb(checklist, f)
+    else:
+        from stig_converter.converters import writers
+        findings = writers.iter_findings(checklist, SYNTH_DATE)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            if output_format == "csv":
+                writers.write_findings_csv(findings, f)
+            elif output_format == "json":
+                writers.write_findings_json(findings, f)
+            else:
+                writers.write_findings_jsonl(findings, f)
+
+    elapsed = max(time.perf_counter() - start, 1e-9)
+    print(
+        f"[*] Wrote {path.stat().st_size / 1e6:.1f} MB in {elapsed:.2f}s "
+        f"({stigs * rules / elapsed:.0f} VULNs/s)"
+    )
+    return str(path)
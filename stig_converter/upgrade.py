@@ -0,0 +1,294 @@
+# upgrade.py
+# Carry review results from existing checklists onto a new STIG release
+
+import copy
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from stig_converter.converters.model import Checklist, Stig
+
+# Fields copied from the old rule to its counterpart in the new release
+CARRIED_FIELDS = (
+    "status", "finding_details", "comments", "severity_override", "severity_justification"
+)
+
+# Ways an old rule is matched to a new one, tried in this order
+MATCH_KEYS = ("Vuln_Num", "Rule_ID", "Rule_Ver", "LEGACY_ID")
+
+# New releases are read as XCCDF, bare or inside a DISA STIG package
+BENCHMARK_TYPES = ("xml", "zip")
+
+# SV-222387r960735_rule → SV-222387: the revision changes with every release
+_RULE_REVISION = re.compile(r"r\d+(?:_rule)?$|_rule$")
+
+
+def rule_stem(rule_id: str) -> str:
+    """Rule ID without its per-release revision and _rule suffix."""
+    return _RULE_REVISION.sub("", rule_id)
+
+
+class UpgradeResult(NamedTuple):
+    """Outcome of upgrading one checklist."""
+
+    input: Path
+    output: Optional[Path]
+    ok: bool
+    error: str
+    matched: Dict[str, int]  # MATCH_KEYS entry → rules matched that way
+    unmatched_new: Tuple[str, ...]  # Vuln_Nums of new rules left Not_Reviewed
+    unmatched_old: Tuple[Tuple[str, str], ...]  # (Vuln_Num, STATUS) of old rules not carried over
+
+    def as_dict(self) -> dict:
+        return {
+            "input": str(self.input),
+            "output": str(self.output) if self.output else None,
+            "ok": self.ok,
+            "error": self.error,
+            "matched": self.matched,
+            "unmatched_new": list(self.unmatched_new),
+            "unmatched_old": [{"Vuln_Num": v, "STATUS": s} for v, s in self.unmatched_old],
+        }
+
+
+def _indexes(rules) -> Dict[str, dict]:
+    """
+    Hash indexes over the old rules, one per MATCH_KEYS entry. The LEGACY_ID index
+    also holds each rule's own Vuln_Num and rule stem, so a renumbered rule whose
+    new LEGACY_IDs name the old identifiers is found too.
+    """
+    indexes = {key: {} for key in MATCH_KEYS}
+    for rule in rules:
+        for key, value in (
+            ("Vuln_Num", rule.vuln_num),
+            ("Rule_ID", rule_stem(rule.rule_id)),
+            ("Rule_Ver", rule.rule_ver),
+        ):
+            if value:
+                indexes[key].setdefault(value, rule)
+        for value in (*rule.legacy_ids, rule.vuln_num, rule_stem(rule.rule_id)):
+            if value:
+                indexes["LEGACY_ID"].setdefault(value, rule)
+    return indexes
+
+
+def _match(rule, indexes: Dict[str, dict]):
+    """Find the old counterpart of a new rule → (old rule, match key), or (None, None)."""
+    for key, value in (
+        ("Vuln_Num", rule.vuln_num),
+        ("Rule_ID", rule_stem(rule.rule_id)),
+        ("Rule_Ver", rule.rule_ver),
+    ):
+        old = indexes[key].get(value) if value else None
+        if old is not None:
+            return old, key
+    for value in (*rule.legacy_ids, rule.vuln_num):
+        old = indexes["LEGACY_ID"].get(value)
+        if old is not None:
+            return old, "LEGACY_ID"
+    return None, None
+
+
+def upgrade_checklist(old: Checklist, benchmark: Checklist) -> Tuple[Checklist, dict]:
+    """
+    Build the checklist for a new STIG release from an existing one.
+    The new STIG replaces the old checklist's STIG of the same benchmark id (or its
+    only STIG); any other STIGs of a merged checklist are kept as they are. Each new
+    rule takes STATUS, FINDING_DETAILS, COMMENTS and the severity override of the
+    old rule it matches, trying Vuln_Num, Rule_ID stem, Rule_Ver and LEGACY_ID in turn.
+    Neither input is modified, so one benchmark can be shared by many upgrades.
+    :param old: Existing checklist
+    :param benchmark: Blank checklist of the new release (e.g. load_benchmark of its XCCDF)
+    :return: (new Checklist, {"matched": {...}, "unmatched_new": [...], "unmatched_old": [...]})
+    :raises ValueError: If the benchmark has no STIG or no rules
+    """
+    if not benchmark.stigs or not benchmark.stigs[0].rules:
+        raise ValueError("The new benchmark has no rules; is it an XCCDF benchmark?")
+    new_stig = benchmark.stigs[0]
+    position = next((i for i, s in enumerate(old.stigs) if s.stig_id == new_stig.stig_id), None)
+    if position is None:
+        if len(old.stigs) != 1:
+            raise ValueError(
+                f"No STIG in the checklist matches the new benchmark '{new_stig.stig_id}'"
+            )
+        position = 0
+    old_id = old.stigs[position].stig_id
+    old_rules = [rule for stig in old.stigs if stig.stig_id == old_id for rule in stig.rules]
+    indexes = _indexes(old_rules)
+
+    matched = {key: 0 for key in MATCH_KEYS}
+    used = set()
+    unmatched_new = []
+    rules = []
+    for blank in new_stig.rules:
+        rule = copy.copy(blank)
+        previous, key = _match(blank, indexes)
+        if previous is None:
+            unmatched_new.append(rule.vuln_num)
+        else:
+            matched[key] += 1
+            used.add(id(previous))
+            for field in CARRIED_FIELDS:
+                setattr(rule, field, getattr(previous, field))
+        rules.append(rule)
+
+    upgraded = Stig(
+        stig_id=new_stig.stig_id,
+        title=new_stig.title,
+        version=new_stig.version,
+        release_info=new_stig.release_info,
+        uuid=new_stig.uuid,
+        rules=rules,
+    )
+    stigs = [s for s in old.stigs if s.stig_id != old.stigs[position].stig_id]
+    stigs.insert(min(position, len(stigs)), upgraded)
+    checklist = Checklist(title=old.title, id=old.id, asset=old.asset, stigs=stigs)
+    return checklist, {
+        "matched": matched,
+        "unmatched_new": unmatched_new,
+        "unmatched_old": [(r.vuln_num, r.status) for r in old_rules if id(r) not in used],
+    }
+
+
+# ------------------------------------------------------------------
+# Files and fleets
+# ------------------------------------------------------------------
+
+# Blank checklist of the new release, loaded once per worker process
+_benchmark = None
+
+
+def _init_worker(xccdf_path) -> None:
+    global _benchmark
+    from stig_converter.converters.benchmark_cache import load_benchmark
+    _benchmark = load_benchmark(xccdf_path)
+
+
+def _upgrade_one(input_path: Path, output_path: Path) -> UpgradeResult:
+    """Upgrade one checklist file against the worker's benchmark (runs in a worker process)."""
+    from stig_converter.converters.readers import read_ckl, read_cklb
+    from stig_converter.converters.writers import write_ckl, write_cklb
+
+    try:
+        reader = read_cklb if input_path.suffix.lower() == ".cklb" else read_ckl
+        old = reader(input_path)
+        checklist, report = upgrade_checklist(old, _benchmark)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if output_path.suffix.lower() == ".cklb":
+            with open(output_path, "w", encoding="utf-8") as f:
+                write_cklb(checklist, f)
+        else:
+            with open(output_path, "wb") as f:
+                write_ckl(checklist, f)
+    except Exception as e:
+        return UpgradeResult(input_path, None, False, str(e), {}, (), ())
+    return UpgradeResult(
+        input_path, output_path, True, "", report["matched"],
+        tuple(report["unmatched_new"]), tuple(report["unmatched_old"]),
+    )
+
+
+def _targets(source, output, to_ext: Optional[str]) -> List[Tuple[Path, Path]]:
+    """(input, output) pairs: one file, or a whole tree mirrored into output in batch mode."""
+    from stig_converter.batch import (
+        _output_for,
+        check_unique_outputs,
+        expand_checklists,
+        input_base,
+    )
+    from stig_converter.security_utils import get_default_allowed_dirs, validate_output_path
+
+    allowed_dirs = get_default_allowed_dirs()
+    if to_ext is None:
+        source = Path(source)
+        if not source.is_file():
+            raise FileNotFoundError(f"[X] Input file does not exist: {source}")
+        output = Path(output)
+        if output.suffix.lower() not in (".ckl", ".cklb"):
+            raise ValueError(f"Unsupported output type '{output.suffix[1:]}'. Supported: ckl, cklb")
+        return [(source, validate_output_path(output, source, allowed_dirs, extension=".ckl"))]
+
+    output_dir = validate_output_path(output, allowed_dirs=allowed_dirs)
+    base = input_base(source)
+    targets = [
+        (path, _output_for(path, base, output_dir, to_ext)) for path in expand_checklists(source)
+    ]
+    check_unique_outputs(targets)
+    return targets
+
+
+def upgrade(
+    source,
+    xccdf_path,
+    output,
+    to_ext: Optional[str] = None,
+    jobs: Optional[int] = None,
+    report_path=None,
+) -> List[UpgradeResult]:
+    """
+    Upgrade checklists to the STIG release of xccdf_path.
+    :param source: A .ckl/.cklb file; with to_ext, a directory or glob of them
+    :param xccdf_path: New release as an XCCDF .xml or DISA STIG .zip
+    :param output: Output .ckl/.cklb file; with to_ext, the output directory
+    :param to_ext: Batch mode: "ckl" or "cklb", the format of every output
+    :param jobs: Batch mode: worker processes (default: CPU count)
+    :param report_path: Write the per-checklist match report here as JSON
+    :return: One UpgradeResult per checklist
+    """
+    from stig_converter.security_utils import get_default_allowed_dirs, validate_output_path
+
+    if not Path(xccdf_path).is_file():
+        raise FileNotFoundError(f"[X] XCCDF file does not exist: {xccdf_path}")
+    xccdf_ext = Path(xccdf_path).suffix[1:].lower()
+    if xccdf_ext not in BENCHMARK_TYPES:
+        raise ValueError(
+            f"Unsupported XCCDF type '{xccdf_ext}'. Supported: {', '.join(BENCHMARK_TYPES)}"
+        )
+    if report_path:
+        report_path = validate_output_path(report_path, allowed_dirs=get_default_allowed_dirs())
+    targets = _targets(source, output, to_ext)
+    jobs = jobs or os.cpu_count() or 1
+
+    start = time.perf_counter()
+    if len(targets) > 1:
+        print(
+            f"[*] Upgrading {len(targets)} checklist(s) to {Path(xccdf_path).name} "
+            f"with {jobs} worker(s)..."
+        )
+    if jobs <= 1 or len(targets) <= 1:
+        _init_worker(xccdf_path)
+        results = [_report(_upgrade_one(*target)) for target in targets]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_worker, initargs=(xccdf_path,)
+        ) as pool:
+            results = [_report(r) for r in pool.map(_upgrade_one, *zip(*targets), chunksize=4)]
+
+    if report_path:
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump([r.as_dict() for r in results], f, indent=4)
+        print(f"[*] Upgrade report written to {report_path}")
+    if len(targets) > 1:
+        failed = sum(1 for r in results if not r.ok)
+        print(f"[*] Upgraded {len(results) - failed} of {len(results)} checklist(s) in "
+              f"{time.perf_counter() - start:.2f}s")
+    return results
+
+
+def _report(result: UpgradeResult) -> UpgradeResult:
+    if not result.ok:
+        print(f"[X] {result.input}: {result.error}")
+        return result
+    by_key = ", ".join(f"{n} by {key}" for key, n in result.matched.items() if n)
+    print(
+        f"[*] {result.input} → {result.output}: {sum(result.matched.values())} carried over "
+        f"({by_key or 'none'}), {len(result.unmatched_new)} new rule(s) left Not_Reviewed"
+    )
+    lost = [vuln for vuln, status in result.unmatched_old if status != "Not_Reviewed"]
+    if lost:
+        print(f"[!] {len(lost)} reviewed rule(s) not in the new release: {', '.join(lost)}")
+    return result
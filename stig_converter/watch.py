@@ -0,0 +1,314 @@
+# watch.py
+# Re-convert checklists in a directory as they are added or changed
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+from stig_converter.batch import _output_for, output_conflicts
+from stig_converter.converters.readers import file_sha256
+
+# Checklist formats that are watched for changes
+WATCH_EXTENSIONS = ("ckl", "cklb")
+
+# Formats a watched checklist can be converted to
+WATCH_FORMATS = ("csv", "json", "jsonl", "ndjson", "md", "ckl", "cklb")
+
+# Default manifest name, kept in the output directory
+MANIFEST_NAME = ".stig_converter-watch.json"
+
+MANIFEST_VERSION = 1
+
+
+class WatchResult(NamedTuple):
+    """Outcome of re-converting one changed checklist."""
+
+    input: Path
+    outputs: List[Path]
+    ok: bool
+    error: str
+    seconds: float
+
+
+def parse_formats(text: str) -> List[str]:
+    """
+    Parse a comma-separated --to list such as "csv,md".
+    :return: Unique formats in the order given
+    """
+    formats = []
+    for fmt in (f.strip().lower().lstrip(".") for f in text.split(",")):
+        if not fmt:
+            continue
+        if fmt not in WATCH_FORMATS:
+            raise ValueError(
+                f"Unsupported output format '{fmt}'. Supported: {', '.join(WATCH_FORMATS)}"
+            )
+        if fmt not in formats:
+            formats.append(fmt)
+    if not formats:
+        raise ValueError("No output format given")
+    return formats
+
+
+def load_manifest(path: Path) -> Dict[str, dict]:
+    """
+    Read the manifest of already converted files (relative path → entry).
+    A missing or unreadable manifest starts empty, so every file is converted once.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def save_manifest(path: Path, files: Dict[str, dict]) -> None:
+    """Write the manifest atomically, so an interrupted watcher never leaves it half written."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".part")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"version": MANIFEST_VERSION, "files": files}, f, indent=2, sort_keys=True)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def _targets(input_path: Path, directory: Path, output_dir: Path, formats: List[str]) -> List[Path]:
+    """Output paths for one checklist; a format equal to the input's own is skipped."""
+    ext = input_path.suffix[1:].lower()
+    return [_output_for(input_path, directory, output_dir, fmt) for fmt in formats if fmt != ext]
+
+
+def _convert_file(input_path: Path, outputs: List[Path]) -> WatchResult:
+    """Write every output of one checklist from a single parse (runs in a worker process)."""
+    from stig_converter.converters.multi_output import convert_to_many
+
+    start = time.perf_counter()
+    try:
+        # Per-file progress is reported by the watcher; keep converter chatter out of it
+        with contextlib.redirect_stdout(io.StringIO()):
+            created = convert_to_many(input_path, outputs)
+        outputs = [Path(p) for p in created]
+        return WatchResult(input_path, outputs, True, "", time.perf_counter() - start)
+    except Exception as e:
+        return WatchResult(input_path, [], False, str(e), time.perf_counter() - start)
+
+
+class Watcher:
+    """
+    Polls a directory tree and re-converts checklists whose content changed.
+
+    A file is only picked up once its mtime is at least `settle` seconds old, so
+    a checklist that is still being written (or saved in several steps) is
+    converted once, after the writes stop. The manifest records each file's
+    stat and SHA-256: an unchanged stat skips the file without reading it, and
+    an unchanged hash (e.g. a touched or re-copied file) skips the conversion.
+    Only failures and real content changes reach the worker pool.
+    """
+
+    def __init__(
+        self,
+        directory,
+        output_dir,
+        formats: List[str],
+        settle: float = 2.0,
+        jobs: Optional[int] = None,
+        manifest_path=None,
+    ) -> None:
+        self.directory = Path(directory)
+        if not self.directory.is_dir():
+            raise FileNotFoundError(f"[X] Directory does not exist: {self.directory}")
+        self.output_dir = Path(output_dir)
+        if self.output_dir.resolve() == self.directory.resolve():
+            raise ValueError("The output directory must differ from the watched directory")
+        self.formats = formats
+        self.settle = settle
+        self.jobs = jobs or os.cpu_count() or 1
+        self.manifest_path = (
+            Path(manifest_path) if manifest_path else self.output_dir / MANIFEST_NAME
+        )
+        self.files = load_manifest(self.manifest_path)
+        # Files left alone because another file writes the same outputs, warned about once
+        self.conflicts = set()
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def _scan(self) -> Dict[str, os.stat_result]:
+        """Stat every watched checklist, skipping anything under the output directory."""
+        output_dir = self.output_dir.resolve()
+        found = {}
+        for path in self.directory.rglob("*"):
+            if path.suffix[1:].lower() not in WATCH_EXTENSIONS or path.name.startswith("."):
+                continue
+            try:
+                if path.resolve().is_relative_to(output_dir):
+                    continue
+                stat = path.stat()
+            except OSError:
+                continue
+            if path.is_file():
+                found[path.relative_to(self.directory).as_posix()] = stat
+        return found
+
+    def _is_current(self, entry: dict, sha256: str, outputs: List[Path]) -> bool:
+        """True when the manifest entry already covers this content and these outputs."""
+        if entry.get("sha256") != sha256:
+            return False
+        if not entry.get("ok"):
+            return True  # failed before on the same content; retried once it changes
+        if not set(self.formats) <= set(entry.get("formats", ())):
+            return False
+        return all(p.exists() for p in outputs)
+
+    def poll(self) -> List[WatchResult]:
+        """
+        Run one pass: convert settled files whose content changed since the manifest.
+        :return: One WatchResult per converted file
+        """
+        now = time.time()
+        found = self._scan()
+        changed = False
+        for rel in set(self.files) - set(found):
+            del self.files[rel]
+            changed = True
+
+        targets = {
+            rel: _targets(self.directory / rel, self.directory, self.output_dir, self.formats)
+            for rel in found
+        }
+        conflicts = self._conflicts(targets)
+
+        tasks = []
+        for rel, stat in sorted(found.items()):
+            if now - stat.st_mtime < self.settle:
+                continue  # still being written; wait for it to settle
+            if rel in conflicts:
+                continue  # converting it would overwrite another file's outputs
+            entry = self.files.get(rel, {})
+            path = self.directory / rel
+            outputs = targets[rel]
+            stat_key = [stat.st_mtime_ns, stat.st_size]
+            unchanged = entry.get("stat") == stat_key
+            if unchanged and self._is_current(entry, entry.get("sha256"), outputs):
+                continue  # untouched since the last pass; not even read
+            try:
+                sha256 = file_sha256(path)
+            except OSError:
+                continue
+            if self._is_current(entry, sha256, outputs):
+                entry["stat"] = stat_key
+                changed = True
+                continue
+            tasks.append((rel, stat_key, sha256, path, outputs))
+
+        results = []
+        for (rel, stat_key, sha256, _, _), result in zip(tasks, self._run([t[3:] for t in tasks])):
+            self.files[rel] = {
+                "stat": stat_key,
+                "sha256": sha256,
+                "formats": self.formats if result.ok else [],
+                "ok": result.ok,
+            }
+            results.append(_report(result))
+        if changed or results:
+            save_manifest(self.manifest_path, self.files)
+        return results
+
+    def _conflicts(self, targets: Dict[str, List[Path]]) -> set:
+        """
+        Files sharing an output with another file (e.g. a.ckl and a.cklb → a.csv).
+        None of them is converted until the clash is gone; each is reported once.
+        """
+        conflicts = set()
+        pairs = ((rel, output) for rel, outputs in targets.items() for output in outputs)
+        for output, rels in output_conflicts(pairs).items():
+            for rel in set(rels) - self.conflicts - conflicts:
+                others = ", ".join(r for r in sorted(rels) if r != rel)
+                print(f"[X] {self.directory / rel}: skipped, {output} is also written for {others}")
+            conflicts.update(rels)
+        self.conflicts = conflicts
+        return conflicts
+
+    def _run(self, tasks):
+        if len(tasks) <= 1 or self.jobs == 1:
+            return [_convert_file(*task) for task in tasks]
+        if self._pool is None:
+            # Created on first use and kept for later passes, so workers stay warm
+            self._pool = ProcessPoolExecutor(max_workers=self.jobs)
+        return list(self._pool.map(_convert_file, *zip(*tasks)))
+
+    def run(self, interval: float = 1.0) -> None:
+        """Poll every interval seconds until interrupted."""
+        print(
+            f"[*] Watching {self.directory} → {self.output_dir} ({', '.join(self.formats)}) "
+            f"every {interval:g}s; {len(self.files)} file(s) in the manifest. Ctrl+C to stop"
+        )
+        try:
+            while True:
+                self.poll()
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            print("\n[*] Stopped watching")
+
+
+def _report(result: WatchResult) -> WatchResult:
+    if result.ok:
+        outputs = ", ".join(p.name for p in result.outputs)
+        print(f"[*] {result.input} → {outputs} ({result.seconds:.2f}s)")
+    else:
+        print(f"[X] {result.input}: {result.error}")
+    return result
+
+
+def watch(
+    directory,
+    output_dir,
+    formats,
+    interval: float = 1.0,
+    settle: float = 2.0,
+    jobs: Optional[int] = None,
+    manifest_path=None,
+    once: bool = False,
+) -> List[WatchResult]:
+    """
+    Keep converted copies of every .ckl/.cklb under directory up to date.
+    :param directory: Directory tree to watch
+    :param output_dir: Where outputs are written; the watched tree is mirrored under it
+    :param formats: Output formats, e.g. ["csv", "md"] or "csv,md"
+    :param interval: Seconds between polls
+    :param settle: Seconds a file's mtime must be old before it is converted
+    :param jobs: Worker processes (default: CPU count)
+    :param manifest_path: Manifest of content hashes
+        (default: <output_dir>/.stig_converter-watch.json)
+    :param once: Run a single pass and return instead of watching
+    :return: Results of the single pass when once is set
+    """
+    if isinstance(formats, str):
+        formats = parse_formats(formats)
+    with Watcher(directory, output_dir, formats, settle, jobs, manifest_path) as watcher:
+        if once:
+            return watcher.poll()
+        watcher.run(interval)
+        return []